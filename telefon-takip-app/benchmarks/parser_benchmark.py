@@ -0,0 +1,258 @@
+"""
+HTML ayrıştırıcılarını (html.parser, lxml, selectolax) saklanmış sayfalar üzerinde karşılaştırır.
+
+Sayfalar iki kaynaktan okunabilir:
+  --pages-dir DİZİN   Site adıyla isimlendirilmiş alt dizinlerdeki .html dosyaları
+                      (ör. DİZİN/mediamarkt/*.html, DİZİN/teknosa/*.html, DİZİN/vatan/*.html)
+  --from-cache        Scraper yanıt önbelleğindeki (responses.db) sayfalar
+
+Her ayrıştırıcı için sayfa başına ayrıştırma süresi, ayrıştırma + özellik çıkarma
+süresi ve tracemalloc ile ölçülen en yüksek bellek kullanımı raporlanır. --targeted
+verilirse her ayrıştırıcı tam sayfa ve hedefli (yalnızca scraper'ın tanımladığı
+bölümler) ayrıştırma için ayrı ayrı ölçülür. --parse-workers verilirse detay
+sayfalarının ayrıştırma havuzunda farklı süreç sayılarıyla işlenme hızı ölçülür.
+tracemalloc yalnızca Python tarafındaki ayırmaları gördüğünden lxml ve selectolax'ın
+C tarafında ayırdığı bellek tam olarak yansımaz.
+
+Kullanım:
+    python benchmarks/parser_benchmark.py --from-cache --repeat 5
+    python benchmarks/parser_benchmark.py --pages-dir sayfalar --targeted
+    python benchmarks/parser_benchmark.py --from-cache --parse-workers 1 2 4 8
+"""
+import argparse
+import glob
+import logging
+import os
+import sqlite3
+import statistics
+import sys
+import time
+import tracemalloc
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.config import SCRAPER_CACHE_DIR
+from src.scrapers.html_parser import available_backends, parse_html
+from src.scrapers.parse_pool import ParsePool
+
+SITES = {
+    'mediamarkt': 'mediamarkt.com.tr',
+    'teknosa': 'teknosa.com',
+    'vatan': 'vatanbilgisayar.com'
+}
+
+
+def load_pages_from_dir(pages_dir):
+    """
+    Site alt dizinlerindeki HTML dosyalarını okur.
+
+    Adı 'listing' ile başlayan dosyalar liste sayfası, diğerleri detay sayfası sayılır.
+    """
+    pages = []
+    for site in SITES:
+        for path in sorted(glob.glob(os.path.join(pages_dir, site, '*.html'))):
+            kind = 'listing' if os.path.basename(path).startswith('listing') else 'detail'
+            with open(path, 'r', encoding='utf-8', errors='replace') as f:
+                pages.append((site, kind, path, f.read()))
+    return pages
+
+
+def load_pages_from_cache(db_path):
+    """Yanıt önbelleğindeki sayfaları okur"""
+    pages = []
+    if not os.path.exists(db_path):
+        return pages
+    conn = sqlite3.connect(db_path)
+    try:
+        for url, host, resource_type, body in conn.execute('SELECT url, host, resource_type, body FROM responses'):
+            site = next((name for name, domain in SITES.items() if domain in (host or '')), None)
+            if site:
+                kind = 'listing' if resource_type == 'listing' else 'detail'
+                pages.append((site, kind, url, zlib.decompress(body).decode('utf-8')))
+    finally:
+        conn.close()
+    return pages
+
+
+def get_scraper_classes():
+    """Site scraper sınıflarını döndürür"""
+    from src.scrapers.mediamarkt_scraper import MediaMarktScraper
+    from src.scrapers.teknosa_scraper import TeknosaWebScraper
+    from src.scrapers.vatan_scraper import VatanWebScraper
+
+    return {
+        'mediamarkt': MediaMarktScraper,
+        'teknosa': TeknosaWebScraper,
+        'vatan': VatanWebScraper
+    }
+
+
+def measure(func, repeat):
+    """Fonksiyonun ortanca süresini (ms) ve en yüksek bellek kullanımını (KB) ölçer"""
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - started) * 1000)
+
+    tracemalloc.start()
+    result = func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return statistics.median(timings), peak / 1024
+
+
+def parse_classes_for(scraper_class, kind):
+    """Sayfa türü için scraper'ın hedefli ayrıştırma sınıflarını döndürür"""
+    if kind == 'listing':
+        return scraper_class.listing_parse_classes
+    return scraper_class.detail_parse_classes
+
+
+def run_benchmark(pages, backends, repeat, modes=('full',), extract=True):
+    """
+    Her ayrıştırıcı, ayrıştırma modu ve site için ölçümleri yapar.
+
+    Args:
+        pages (list): (site, sayfa türü, URL, HTML) demetleri
+        backends (list): Ölçülecek ayrıştırıcılar
+        repeat (int): Sayfa başına tekrar sayısı
+        modes (tuple): 'full' (tam sayfa) ve/veya 'targeted' (hedefli)
+        extract (bool): Detay sayfalarında ayrıştırma + özellik çıkarma süresini de ölç
+
+    Returns:
+        list: (ayrıştırıcı, mod, site, sayfa sayısı, ayrıştırma ms, çıkarma ms, bellek KB) satırları
+    """
+    scraper_classes = get_scraper_classes()
+    scrapers = {site: cls() for site, cls in scraper_classes.items()} if extract else {}
+
+    rows = []
+    for backend in backends:
+        for mode in modes:
+            for site in SITES:
+                site_pages = [(kind, url, html) for page_site, kind, url, html in pages if page_site == site]
+                if not site_pages:
+                    continue
+
+                parse_times, extract_times, peaks = [], [], []
+                scraper = scrapers.get(site)
+                for kind, url, html in site_pages:
+                    parse_only = parse_classes_for(scraper_classes[site], kind) if mode == 'targeted' else None
+                    parse_ms, peak_kb = measure(lambda: parse_html(html, backend, parse_only=parse_only), repeat)
+                    parse_times.append(parse_ms)
+                    peaks.append(peak_kb)
+                    if scraper and kind == 'detail':
+                        scraper.html_parser = backend
+                        scraper.targeted_parsing = mode == 'targeted'
+                        extract_ms, _ = measure(lambda: scraper._parse_phone_details(url, html), repeat)
+                        extract_times.append(extract_ms)
+
+                rows.append((
+                    backend, mode, site, len(site_pages),
+                    statistics.mean(parse_times),
+                    statistics.mean(extract_times) if extract_times else None,
+                    statistics.mean(peaks)
+                ))
+    return rows
+
+
+def run_pool_benchmark(pages, worker_counts, repeat):
+    """
+    Detay sayfalarının ayrıştırma havuzunda işlenme hızını süreç sayısına göre ölçer.
+
+    Args:
+        pages (list): (site, sayfa türü, URL, HTML) demetleri
+        worker_counts (list): Denenecek süreç sayıları (1: aynı süreçte ayrıştırma)
+        repeat (int): Sayfaların kaç kez işleneceği
+
+    Returns:
+        list: (süreç sayısı, sayfa sayısı, süre sn, sayfa/sn) satırları
+    """
+    scraper_classes = get_scraper_classes()
+    scrapers = {cls: cls() for cls in scraper_classes.values()}
+    jobs = [
+        (scraper_classes[site], scrapers[scraper_classes[site]].parse_settings(), url, html)
+        for site, kind, url, html in pages if kind == 'detail'
+    ] * repeat
+    if not jobs:
+        return []
+
+    rows = []
+    for workers in worker_counts:
+        if workers <= 1:
+            started = time.perf_counter()
+            for cls, _, url, html in jobs:
+                scrapers[cls]._extract_details(url, html)
+        else:
+            pool = ParsePool(workers=workers, min_items=0)
+            pool.start()
+            # Süreçlerin ayrıştırıcı nesnelerini oluşturması ölçüme dahil edilmez
+            for cls, scraper in scrapers.items():
+                pool.parse(cls, scraper.parse_settings(), '', '<html></html>')
+            started = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=workers * 2) as executor:
+                list(executor.map(lambda job: pool.parse(*job), jobs))
+        elapsed = time.perf_counter() - started
+        if workers > 1:
+            pool.close()
+        rows.append((workers, len(jobs), elapsed, len(jobs) / elapsed if elapsed else 0.0))
+    return rows
+
+
+def print_pool_report(rows):
+    print(f"{'Süreç':>5} {'Sayfa':>6} {'Süre sn':>8} {'Sayfa/sn':>9}")
+    for workers, count, elapsed, throughput in rows:
+        print(f"{workers:>5} {count:>6} {elapsed:>8.2f} {throughput:>9.1f}")
+
+
+def print_report(rows):
+    print(f"{'Ayrıştırıcı':<12} {'Mod':<9} {'Site':<11} {'Sayfa':>5} {'Ayrıştırma ms':>14} {'+Çıkarma ms':>12} {'Bellek KB':>10}")
+    for backend, mode, site, count, parse_ms, extract_ms, peak_kb in rows:
+        extract = f"{extract_ms:.2f}" if extract_ms is not None else '-'
+        print(f"{backend:<12} {mode:<9} {site:<11} {count:>5} {parse_ms:>14.2f} {extract:>12} {peak_kb:>10.0f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="HTML ayrıştırıcı karşılaştırması")
+    parser.add_argument('--pages-dir', help="Site alt dizinlerinde .html dosyaları içeren dizin")
+    parser.add_argument('--from-cache', action='store_true', help="Yanıt önbelleğindeki sayfaları kullan")
+    parser.add_argument('--cache-db', default=os.path.join(SCRAPER_CACHE_DIR, 'responses.db'),
+                        help="Yanıt önbelleği veritabanı")
+    parser.add_argument('--backends', nargs='+', default=available_backends(),
+                        help="Karşılaştırılacak ayrıştırıcılar")
+    parser.add_argument('--repeat', type=int, default=5, help="Sayfa başına tekrar sayısı")
+    parser.add_argument('--no-extract', action='store_true', help="Özellik çıkarma süresini ölçme")
+    parser.add_argument('--targeted', action='store_true',
+                        help="Tam sayfa ve hedefli ayrıştırmayı karşılaştır")
+    parser.add_argument('--parse-workers', type=int, nargs='+',
+                        help="Ayrıştırma havuzunu bu süreç sayılarıyla ölç (ör. 1 2 4 8)")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+
+    pages = []
+    if args.pages_dir:
+        pages.extend(load_pages_from_dir(args.pages_dir))
+    if args.from_cache:
+        pages.extend(load_pages_from_cache(args.cache_db))
+    if not pages:
+        parser.error("Ölçülecek sayfa bulunamadı (--pages-dir veya --from-cache kullanın)")
+
+    backends = [backend for backend in args.backends if backend in available_backends()]
+    skipped = set(args.backends) - set(backends)
+    if skipped:
+        print(f"Yüklü olmayan ayrıştırıcılar atlandı: {', '.join(sorted(skipped))}")
+
+    if args.parse_workers:
+        print_pool_report(run_pool_benchmark(pages, args.parse_workers, args.repeat))
+        return
+
+    modes = ('full', 'targeted') if args.targeted else ('full',)
+    print_report(run_benchmark(pages, backends, args.repeat, modes, extract=not args.no_extract))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,149 @@
+"""
+Scraper'ları kaydedilmiş yanıtlar üzerinde, canlı sitelere bağlanmadan ölçer.
+
+İki alt komut vardır:
+  record   Scraper'ları canlı sitelerde çalıştırır ve tüm HTTP yanıtlarını
+           (MediaMarkt, Teknosa, Vatan ve Firecrawl) sürümlü bir arşive kaydeder.
+  run      Arşivi yerel yeniden oynatma sunucusundan sunar ve her scraper için
+           scrape_all_phones süresini, saniyedeki sayfa sayısını, sayfa başına
+           ayrıştırma süresini ve yapısal veriden çıkarılan sayfaların oranını raporlar.
+           Sunucuya gecikme ve hata enjekte edilebilir.
+
+Ölçümler soğuk çalıştırmayı yansıtır: yanıt önbelleği, Firecrawl önbelleği ve
+koşullu GET kapatılır. --rate-limit verilmezse hız sınırı da kapatılır.
+
+Kullanım:
+    python benchmarks/scraper_benchmark.py record --archive fixtures/2024-06 --max-products 40
+    python benchmarks/scraper_benchmark.py run --archive fixtures/2024-06 --latency-ms 120 --jitter-ms 80 --repeat 3
+"""
+import argparse
+import logging
+import os
+import statistics
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+SITE_NAMES = ['mediamarkt', 'teknosa', 'vatan']
+
+
+def configure_environment(args, **overrides):
+    """
+    Ölçüm ortamını ayarlar. src modülleri ayarları içe aktarılırken okuduğundan
+    bu fonksiyon scraper'lar içe aktarılmadan önce çağrılmalıdır.
+    """
+    os.environ['SCRAPER_CACHE_ENABLED'] = 'false'
+    os.environ['FIRECRAWL_CACHE_ENABLED'] = 'false'
+    os.environ['SCRAPER_CONDITIONAL_GET_ENABLED'] = 'false'
+    os.environ['SCRAPER_MAX_PRODUCTS'] = str(args.max_products)
+    if not args.rate_limit:
+        os.environ['SCRAPER_RATE_LIMIT_ENABLED'] = 'false'
+    os.environ.update(overrides)
+
+
+def record(args):
+    """Scraper'ları canlı sitelerde çalıştırıp yanıtları arşive kaydeder"""
+    configure_environment(args, SCRAPER_RECORD_FIXTURES=args.archive)
+    from parser_benchmark import get_scraper_classes
+    scraper_classes = get_scraper_classes()
+
+    for site in args.sites:
+        scraper = scraper_classes[site]()
+        started = time.perf_counter()
+        phones = scraper.scrape_all_phones()
+        print(f"{site}: {len(phones)} telefon, {time.perf_counter() - started:.1f} sn")
+    # Arşiv süreç kapanırken diske yazılır
+    print(f"Yanıtlar kaydedildi: {args.archive}")
+
+
+def run(args):
+    """Arşivi yeniden oynatarak scraper'ları ölçer"""
+    configure_environment(args)
+    from src.scrapers.fixtures import FixtureArchive, install_replay
+    from src.scrapers.replay_server import ReplayServer
+    from parser_benchmark import SITES, get_scraper_classes
+
+    archive = FixtureArchive(args.archive).load()
+    server = ReplayServer(
+        archive, latency=args.latency_ms / 1000, jitter=args.jitter_ms / 1000,
+        error_rate=args.error_rate, error_status=args.error_status, seed=args.seed
+    ).start()
+    install_replay(server.url)
+    scraper_classes = get_scraper_classes()
+
+    rows = []
+    try:
+        for site in args.sites:
+            scraper = scraper_classes[site]()
+            durations, counts, pages, parse_ms, structured = [], [], [], [], []
+            for _ in range(args.repeat):
+                scraper.reset_stats()
+                server.reset_stats()
+                started = time.perf_counter()
+                phones = scraper.scrape_all_phones()
+                durations.append(time.perf_counter() - started)
+                counts.append(len(phones))
+
+                served = server.stats()
+                pages.append(sum(
+                    host_stats['hits'] for host, host_stats in served.items() if SITES[site] in host
+                ))
+                parse = scraper.get_stats().get('parse', {})
+                parsed = parse.get('pool', 0) + parse.get('in_process', 0)
+                if parsed:
+                    parse_ms.append(parse['time_ms'] / parsed)
+                    structured.append(parse.get('structured', 0) / parsed * 100)
+
+            duration = statistics.median(durations)
+            page_count = statistics.median(pages)
+            rows.append((
+                site, statistics.median(counts), page_count, duration,
+                page_count / duration if duration else 0.0,
+                statistics.median(parse_ms) if parse_ms else None,
+                statistics.median(structured) if structured else None
+            ))
+    finally:
+        server.stop()
+
+    print(f"{'Site':<11} {'Telefon':>7} {'Sayfa':>6} {'Süre sn':>8} {'Sayfa/sn':>9} "
+          f"{'Ayrıştırma ms/sayfa':>20} {'Yapısal %':>10}")
+    for site, count, page_count, duration, throughput, parse, structured_share in rows:
+        parse_text = f"{parse:.2f}" if parse is not None else '-'
+        structured_text = f"{structured_share:.0f}" if structured_share is not None else '-'
+        print(f"{site:<11} {count:>7.0f} {page_count:>6.0f} {duration:>8.2f} {throughput:>9.1f} "
+              f"{parse_text:>20} {structured_text:>10}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Kayıt/yeniden oynatma ile scraper ölçümü")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    def add_common(subparser):
+        subparser.add_argument('--archive', required=True, help="Arşiv dizini")
+        subparser.add_argument('--sites', nargs='+', choices=SITE_NAMES, default=SITE_NAMES)
+        subparser.add_argument('--max-products', type=int, default=0,
+                               help="Site başına azami ürün sayısı (0: sınırsız)")
+        subparser.add_argument('--rate-limit', action='store_true', help="Hız sınırını açık bırak")
+
+    add_common(subparsers.add_parser('record', help="Canlı yanıtları arşive kaydet"))
+
+    run_parser = subparsers.add_parser('run', help="Arşivi yeniden oynatarak ölç")
+    add_common(run_parser)
+    run_parser.add_argument('--repeat', type=int, default=3, help="Scraper başına çalıştırma sayısı")
+    run_parser.add_argument('--latency-ms', type=float, default=0, help="Yanıt başına sabit gecikme (ms)")
+    run_parser.add_argument('--jitter-ms', type=float, default=0, help="Eklenecek azami rastgele gecikme (ms)")
+    run_parser.add_argument('--error-rate', type=float, default=0, help="Hata döndürülecek isteklerin oranı (0-1)")
+    run_parser.add_argument('--error-status', type=int, default=503, help="Enjekte edilen hatanın durum kodu")
+    run_parser.add_argument('--seed', type=int, default=1, help="Rastgele tohum")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    if args.command == 'record':
+        record(args)
+    else:
+        run(args)
+
+
+if __name__ == '__main__':
+    main()
@@ -73,8 +73,173 @@ DATABASE_URL = os.getenv('DATABASE_URL', 'sqlite:///telefon_data.db')
 
 # Scraper ayarları
 SCRAPER_INTERVAL = 3600  # saniye cinsinden (1 saat)
+# Yalnızca liste sayfalarından fiyat güncelleme sıklığı (dakika)
+PRICE_REFRESH_INTERVAL_MINUTES = int(os.getenv("PRICE_REFRESH_INTERVAL_MINUTES", "10"))
+# Detay sayfalarıyla birlikte özellik güncelleme sıklığı (saat)
+SPEC_REFRESH_INTERVAL_HOURS = float(os.getenv("SPEC_REFRESH_INTERVAL_HOURS", "24"))
 USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
 
+# Site bazında azami scraping süreleri (saniye cinsinden)
+SCRAPER_TIMEOUT = int(os.getenv("SCRAPER_TIMEOUT", "900"))
+SCRAPER_TIMEOUTS = {
+    'mediamarkt': int(os.getenv("MEDIAMARKT_TIMEOUT", SCRAPER_TIMEOUT)),
+    'teknosa': int(os.getenv("TEKNOSA_TIMEOUT", SCRAPER_TIMEOUT)),
+    'vatan': int(os.getenv("VATAN_TIMEOUT", SCRAPER_TIMEOUT))
+}
+
+# Manuel güncelleme işleri: eşzamanlı iş sayısı ve bellekte tutulacak iş kaydı sayısı
+JOB_MANAGER_WORKERS = int(os.getenv("JOB_MANAGER_WORKERS", "2"))
+JOB_HISTORY_SIZE = int(os.getenv("JOB_HISTORY_SIZE", "100"))
+
+# Site bazında zamanlama: fiyat taraması (dakika), özellik taraması (saat) ve
+# çalıştırma zamanlarına eklenecek azami rastgele sapma (saniye)
+SCRAPER_SCHEDULE_JITTER = int(os.getenv("SCRAPER_SCHEDULE_JITTER", "60"))
+SCRAPER_SCHEDULES = {
+    'mediamarkt': {
+        'prices': {
+            'minutes': int(os.getenv("MEDIAMARKT_PRICE_INTERVAL_MINUTES", PRICE_REFRESH_INTERVAL_MINUTES)),
+            'jitter': int(os.getenv("MEDIAMARKT_SCHEDULE_JITTER", SCRAPER_SCHEDULE_JITTER))
+        },
+        'specs': {
+            'hours': float(os.getenv("MEDIAMARKT_SPEC_INTERVAL_HOURS", SPEC_REFRESH_INTERVAL_HOURS)),
+            'jitter': int(os.getenv("MEDIAMARKT_SCHEDULE_JITTER", SCRAPER_SCHEDULE_JITTER))
+        }
+    },
+    'teknosa': {
+        'prices': {
+            'minutes': int(os.getenv("TEKNOSA_PRICE_INTERVAL_MINUTES", PRICE_REFRESH_INTERVAL_MINUTES)),
+            'jitter': int(os.getenv("TEKNOSA_SCHEDULE_JITTER", SCRAPER_SCHEDULE_JITTER))
+        },
+        'specs': {
+            'hours': float(os.getenv("TEKNOSA_SPEC_INTERVAL_HOURS", SPEC_REFRESH_INTERVAL_HOURS)),
+            'jitter': int(os.getenv("TEKNOSA_SCHEDULE_JITTER", SCRAPER_SCHEDULE_JITTER))
+        }
+    },
+    'vatan': {
+        'prices': {
+            'minutes': int(os.getenv("VATAN_PRICE_INTERVAL_MINUTES", PRICE_REFRESH_INTERVAL_MINUTES)),
+            'jitter': int(os.getenv("VATAN_SCHEDULE_JITTER", SCRAPER_SCHEDULE_JITTER))
+        },
+        'specs': {
+            'hours': float(os.getenv("VATAN_SPEC_INTERVAL_HOURS", SPEC_REFRESH_INTERVAL_HOURS)),
+            'jitter': int(os.getenv("VATAN_SCHEDULE_JITTER", SCRAPER_SCHEDULE_JITTER))
+        }
+    }
+}
+
+# HTTP istek ayarları
+SCRAPER_REQUEST_TIMEOUT = int(os.getenv("SCRAPER_REQUEST_TIMEOUT", "30"))
+SCRAPER_MAX_CONCURRENCY_PER_HOST = int(os.getenv("SCRAPER_MAX_CONCURRENCY_PER_HOST", "4"))
+# Paylaşılan bağlantı havuzu: havuz tutulacak host sayısı ve host başına açık bağlantı sayısı
+HTTP_POOL_CONNECTIONS = int(os.getenv("HTTP_POOL_CONNECTIONS", "20"))
+HTTP_POOL_MAXSIZE = int(os.getenv("HTTP_POOL_MAXSIZE", "16"))
+# Scraper oturumunun DNS sorgu sonuçlarını saklama süresi (saniye, 0: kapalı); diğer kütüphaneleri etkilemez
+HTTP_DNS_CACHE_TTL = float(os.getenv("HTTP_DNS_CACHE_TTL", "300"))
+# HTTPS isteklerini httpx üzerinden HTTP/2 ile yap (httpx ve h2 gerekir; h2 sunmayan hostlarda HTTP/1.1 kullanılır)
+HTTP2_ENABLED = os.getenv("HTTP2_ENABLED", "false").lower() == "true"
+# HTTP/2 kullanılacak hostlar (virgülle ayrılmış, boş: tüm HTTPS hostları)
+HTTP2_HOSTS = [host.strip().lower() for host in os.getenv("HTTP2_HOSTS", "").split(",") if host.strip()]
+# Tüm HTTP yanıtlarını bu dizindeki arşive kaydet (boş: kapalı)
+SCRAPER_RECORD_FIXTURES = os.getenv("SCRAPER_RECORD_FIXTURES", "")
+# Tüm HTTP isteklerini bu adresteki yeniden oynatma sunucusuna yönlendir (boş: kapalı)
+SCRAPER_REPLAY_URL = os.getenv("SCRAPER_REPLAY_URL", "")
+
+# Host başına uyarlanabilir hız sınırı (istek/saniye)
+SCRAPER_RATE_LIMIT_ENABLED = os.getenv("SCRAPER_RATE_LIMIT_ENABLED", "true").lower() == "true"
+SCRAPER_RATE_INITIAL = float(os.getenv("SCRAPER_RATE_INITIAL", "2"))
+SCRAPER_RATE_MIN = float(os.getenv("SCRAPER_RATE_MIN", "0.2"))
+SCRAPER_RATE_MAX = float(os.getenv("SCRAPER_RATE_MAX", "10"))
+SCRAPER_RATE_BURST = int(os.getenv("SCRAPER_RATE_BURST", "4"))
+# Sağlıklı yanıt başına hız artışı ve 429/503 / yavaş yanıtta hızın çarpılacağı katsayı
+SCRAPER_RATE_INCREASE = float(os.getenv("SCRAPER_RATE_INCREASE", "0.1"))
+SCRAPER_RATE_BACKOFF = float(os.getenv("SCRAPER_RATE_BACKOFF", "0.5"))
+# Bu süreyi (saniye) aşan yanıtlar yavaş sayılır ve hız düşürülür
+SCRAPER_SLOW_RESPONSE_SECONDS = float(os.getenv("SCRAPER_SLOW_RESPONSE_SECONDS", "5"))
+# Retry-After başlığına en fazla bu kadar (saniye) uyulur
+SCRAPER_MAX_RETRY_AFTER = float(os.getenv("SCRAPER_MAX_RETRY_AFTER", "120"))
+
+# Geçici hatalarda yeniden deneme (ilk deneme dahil deneme sayısı, saniye cinsinden bekleme)
+SCRAPER_RETRY_ATTEMPTS = int(os.getenv("SCRAPER_RETRY_ATTEMPTS", "3"))
+SCRAPER_RETRY_BASE_DELAY = float(os.getenv("SCRAPER_RETRY_BASE_DELAY", "1"))
+SCRAPER_RETRY_MAX_DELAY = float(os.getenv("SCRAPER_RETRY_MAX_DELAY", "20"))
+# Site başına devre kesici: art arda bu kadar hatadan sonra istekler durdurulur
+SCRAPER_CIRCUIT_BREAKER_ENABLED = os.getenv("SCRAPER_CIRCUIT_BREAKER_ENABLED", "true").lower() == "true"
+SCRAPER_CIRCUIT_FAILURE_THRESHOLD = int(os.getenv("SCRAPER_CIRCUIT_FAILURE_THRESHOLD", "5"))
+# Açık devrenin yeniden deneme isteğine izin vermeden önce beklediği süre (saniye)
+SCRAPER_CIRCUIT_RECOVERY_TIMEOUT = float(os.getenv("SCRAPER_CIRCUIT_RECOVERY_TIMEOUT", "60"))
+
+# Yanıt önbelleği ayarları
+SCRAPER_CACHE_ENABLED = os.getenv("SCRAPER_CACHE_ENABLED", "true").lower() == "true"
+SCRAPER_CACHE_DIR = os.getenv("SCRAPER_CACHE_DIR", os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "cache"))
+SCRAPER_CACHE_MAX_MB = int(os.getenv("SCRAPER_CACHE_MAX_MB", "200"))
+# Aynı kaynağın taramalarını süreçler arasında tekilleştiren kilit dosyalarının dizini
+SCRAPER_LOCK_DIR = os.getenv("SCRAPER_LOCK_DIR", os.path.join(SCRAPER_CACHE_DIR, "locks"))
+# Başka bir süreçteki taramanın bitip bitmediğinin kontrol aralığı (saniye)
+SCRAPER_LOCK_POLL_INTERVAL = float(os.getenv("SCRAPER_LOCK_POLL_INTERVAL", "1"))
+# Kaynak türüne göre önbellek geçerlilik süreleri (saniye cinsinden)
+SCRAPER_CACHE_TTLS = {
+    'listing': int(os.getenv("SCRAPER_CACHE_TTL_LISTING", "900")),      # 15 dakika
+    'detail': int(os.getenv("SCRAPER_CACHE_TTL_DETAIL", "604800")),     # 7 gün
+    'default': int(os.getenv("SCRAPER_CACHE_TTL_DEFAULT", "3600"))      # 1 saat
+}
+# Firecrawl sonuç önbelleği (saniye cinsinden geçerlilik süresi)
+FIRECRAWL_CACHE_ENABLED = os.getenv("FIRECRAWL_CACHE_ENABLED", "true").lower() == "true"
+FIRECRAWL_CACHE_TTL = int(os.getenv("FIRECRAWL_CACHE_TTL", "86400"))
+# Firecrawl API adresi (yerel test sunucusuna yönlendirmek için değiştirilebilir)
+FIRECRAWL_API_URL = os.getenv("FIRECRAWL_API_URL", "https://api.firecrawl.dev")
+# Ürün detay sayfalarını Firecrawl'a toplu (batch) olarak gönder
+FIRECRAWL_BATCH_ENABLED = os.getenv("FIRECRAWL_BATCH_ENABLED", "true").lower() == "true"
+FIRECRAWL_BATCH_SIZE = int(os.getenv("FIRECRAWL_BATCH_SIZE", "50"))
+FIRECRAWL_BATCH_POLL_INTERVAL = float(os.getenv("FIRECRAWL_BATCH_POLL_INTERVAL", "2"))
+FIRECRAWL_BATCH_TIMEOUT = int(os.getenv("FIRECRAWL_BATCH_TIMEOUT", "600"))
+# Değişmeyen sayfalar için koşullu GET (ETag / Last-Modified) kullan
+SCRAPER_CONDITIONAL_GET_ENABLED = os.getenv("SCRAPER_CONDITIONAL_GET_ENABLED", "true").lower() == "true"
+# Artımlı tarama: liste kartı değişmeyen ürünlerin detay sayfası yeniden çekilmez
+SCRAPER_INCREMENTAL_ENABLED = os.getenv("SCRAPER_INCREMENTAL_ENABLED", "true").lower() == "true"
+# Kartı değişmese de özellikleri bu süreden (saat) eski olan ürünler yeniden çekilir (0: süre sınırı yok)
+SCRAPER_MAX_SPEC_AGE_HOURS = float(os.getenv("SCRAPER_MAX_SPEC_AGE_HOURS", "168"))
+
+# HTML ayrıştırıcı: html.parser, lxml veya selectolax (yüklü değilse html.parser kullanılır)
+HTML_PARSER_BACKEND = os.getenv("HTML_PARSER_BACKEND", "lxml")
+# Sayfaların yalnızca scraper'ın ihtiyaç duyduğu bölümlerini ayrıştır
+HTML_TARGETED_PARSING = os.getenv("HTML_TARGETED_PARSING", "true").lower() == "true"
+# Ürün bilgilerini önce JSON-LD / gömülü sayfa durumundan çıkar (bulunamazsa CSS seçicileri kullanılır)
+STRUCTURED_DATA_ENABLED = os.getenv("STRUCTURED_DATA_ENABLED", "true").lower() == "true"
+
+# Detay sayfalarını ayrı süreçlerde ayrıştır (0: işlemci çekirdeği sayısı kadar süreç)
+PARSE_POOL_ENABLED = os.getenv("PARSE_POOL_ENABLED", "true").lower() == "true"
+PARSE_POOL_WORKERS = int(os.getenv("PARSE_POOL_WORKERS", "0"))
+# Daha az sayfa çekilecekse ayrıştırma aynı süreçte yapılır
+PARSE_POOL_MIN_ITEMS = int(os.getenv("PARSE_POOL_MIN_ITEMS", "20"))
+# Süreç başlatma yöntemi: forkserver veya spawn (boş: forkserver, desteklenmiyorsa spawn)
+PARSE_POOL_START_METHOD = os.getenv("PARSE_POOL_START_METHOD", "")
+
+# Çekilen telefonlar bu büyüklükte gruplar halinde veritabanına yazılır
+PERSIST_BATCH_SIZE = int(os.getenv("PERSIST_BATCH_SIZE", "25"))
+# Bir kaydın yazılmadan önce bekleyebileceği azami süre (saniye)
+PERSIST_BATCH_MAX_LATENCY = float(os.getenv("PERSIST_BATCH_MAX_LATENCY", "2"))
+
+# Ürün detaylarını çeken eşzamanlı iş parçacığı sayısı
+SCRAPER_DETAIL_WORKERS = int(os.getenv("SCRAPER_DETAIL_WORKERS", "8"))
+# Site başına çekilecek azami ürün sayısı (0: sınırsız)
+SCRAPER_MAX_PRODUCTS = int(os.getenv("SCRAPER_MAX_PRODUCTS", "0"))
+
+# Selenium sürücü havuzu ayarları
+SELENIUM_POOL_SIZE = int(os.getenv("SELENIUM_POOL_SIZE", "2"))
+SELENIUM_MAX_PAGES_PER_DRIVER = int(os.getenv("SELENIUM_MAX_PAGES_PER_DRIVER", "50"))
+# Sayfanın hazır olması için azami bekleme süresi (saniye)
+SELENIUM_MAX_WAIT = float(os.getenv("SELENIUM_MAX_WAIT", "15"))
+# Sayfa yükleme (driver.get) ve betik çalıştırma için sürücü zaman aşımları (saniye)
+SELENIUM_PAGE_LOAD_TIMEOUT = float(os.getenv("SELENIUM_PAGE_LOAD_TIMEOUT", "30"))
+SELENIUM_SCRIPT_TIMEOUT = float(os.getenv("SELENIUM_SCRIPT_TIMEOUT", "10"))
+# Havuz doluyken boşta sürücü için azami bekleme süresi (saniye)
+SELENIUM_ACQUIRE_TIMEOUT = float(os.getenv("SELENIUM_ACQUIRE_TIMEOUT", "60"))
+# Görsel, yazı tipi ve izleyici isteklerini engelle
+SELENIUM_BLOCK_RESOURCES = os.getenv("SELENIUM_BLOCK_RESOURCES", "true").lower() == "true"
+# Geçici ağ hatasıyla (zaman aşımı, bağlantı hatası, 5xx) alınamayan liste ve detay
+# sayfalarını Selenium ile yeniden dene (devre açıkken ve 4xx yanıtlarda denenmez)
+SELENIUM_FALLBACK_ENABLED = os.getenv("SELENIUM_FALLBACK_ENABLED", "false").lower() == "true"
+
 # Bildirim ayarları
 NOTIFICATION_ENABLED = True
 EMAIL_ENABLED = False
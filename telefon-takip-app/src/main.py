@@ -21,7 +21,15 @@ from utils.export import export_to_excel, export_to_html
 from scrapers.mediamarkt_scraper import MediaMarktScraper
 from scrapers.teknosa_scraper import TeknosaWebScraper
 from scrapers.vatan_scraper import VatanWebScraper
-from config import SUPABASE_URL, SUPABASE_KEY, PORT, HOST, DEBUG, WEB_HOST, WEB_PORT
+from utils.scrape_orchestrator import ScrapeOrchestrator, JOB_PRICES, JOB_SPECS
+from utils.batch_writer import MicroBatchWriter
+from utils.source_scheduler import SourceScheduler
+from utils.job_manager import JobManager
+from utils.run_coordinator import get_run_coordinator
+from config import (
+    SUPABASE_URL, SUPABASE_KEY, PORT, HOST, DEBUG, WEB_HOST, WEB_PORT, SCRAPER_TIMEOUT, SCRAPER_TIMEOUTS,
+    PERSIST_BATCH_SIZE, PERSIST_BATCH_MAX_LATENCY, SCRAPER_SCHEDULES, JOB_MANAGER_WORKERS, JOB_HISTORY_SIZE
+)
 
 # Logging yapılandırması
 logging.basicConfig(
@@ -59,116 +67,139 @@ scrapers = {
 # Planlayıcı (scheduler)
 scheduler = BackgroundScheduler()
 
-def update_phone_data():
-    """Zamanlanmış olarak telefon verilerini günceller"""
+# Manuel güncelleme istekleri için arka plan işleri
+job_manager = JobManager(max_workers=JOB_MANAGER_WORKERS, history_size=JOB_HISTORY_SIZE)
+
+# Zamanlanmış ve manuel taramaların aynı kaynakta üst üste binmesini önler
+run_coordinator = get_run_coordinator()
+
+# Durum nesnesinde kullanılan kaynak adları
+SCRAPER_DISPLAY_NAMES = {
+    'mediamarkt': 'MediaMarkt',
+    'teknosa': 'Teknosa',
+    'vatan': 'Vatan'
+}
+
+JOB_LABELS = {
+    JOB_PRICES: 'Fiyat güncelleme',
+    JOB_SPECS: 'Veri çekme'
+}
+
+def run_scrape_job(job, sources=None, report=None):
+    """
+    Sitelerde tarama çalıştırır ve sonuçları kaydeder.
+    
+    Args:
+        job (str): JOB_PRICES (yalnızca liste sayfalarındaki fiyatlar) veya
+            JOB_SPECS (detay sayfalarıyla birlikte tam tarama)
+        sources (list, optional): Taranacak kaynaklar (varsayılan: tümü)
+        report (callable, optional): İş durumunu güncellemek için report(**alanlar)
+    
+    Returns:
+        dict: Kaynak adı -> son durum; işlem hata ile sonlandıysa None
+    """
+    label = JOB_LABELS[job]
+    report = report or (lambda **fields: None)
     try:
-        logger.info("Telefon verilerini güncelleme işlemi başlatılıyor...")
-        
-        # Tüm telefon scraper'larını başlat
-        media_markt_scraper = MediaMarktScraper()
-        teknosa_scraper = TeknosaWebScraper()
-        vatan_scraper = VatanWebScraper()
+        logger.info(f"{label} işlemi başlatılıyor...")
         
         # WebSocket ile istemciye bildir
-        socketio.emit('scraping_status', {'status': 'started', 'message': 'Veri çekme işlemi başladı'})
-        
-        # Her scraper için ayrı bir durum nesnesi oluştur
-        scraping_status = {
-            'MediaMarkt': {'status': 'pending', 'progress': 0, 'error': None, 'count': 0},
-            'Teknosa': {'status': 'pending', 'progress': 0, 'error': None, 'count': 0},
-            'Vatan': {'status': 'pending', 'progress': 0, 'error': None, 'count': 0}
-        }
+        socketio.emit('scraping_status', {'status': 'started', 'job': job, 'message': f'{label} işlemi başladı'})
+        
+        # Çekilen telefonlar küçük gruplar halinde kaydedilir; ilk sonuçlar tarama sürerken görünür
+        def on_flush(batch, saved):
+            write_stats = writer.stats()
+            report(counts={'received': write_stats['received'], 'saved': write_stats['saved']})
+            socketio.emit('phones_saved', {
+                'count': saved,
+                'total_saved': write_stats['saved'],
+                'phones': [
+                    {'model': phone.get('model', ''), 'price': phone.get('price', ''), 'source': phone.get('source', '')}
+                    for phone in batch
+                ]
+            })
+
+        def publish_progress(status):
+            report(progress=status)
+            socketio.emit('scraping_progress', status)
+
+        # Fiyat taraması yeni satır eklemez, var olan kayıtların fiyatını günceller
+        writer = MicroBatchWriter(
+            db.update_prices if job == JOB_PRICES else save_phones_to_database,
+            batch_size=PERSIST_BATCH_SIZE,
+            max_latency=PERSIST_BATCH_MAX_LATENCY,
+            on_flush=on_flush
+        )
         
-        # WebSocket ile istemciye güncel scraping durumunu gönder
-        socketio.emit('scraping_progress', scraping_status)
-        
-        # MediaMarkt veri çekme
-        logger.info("MediaMarkt verilerini çekme işlemi başlatılıyor...")
-        scraping_status['MediaMarkt']['status'] = 'in_progress'
-        socketio.emit('scraping_progress', scraping_status)
-        
-        def media_markt_progress_callback(current, total, error=None, message=None):
-            scraping_status['MediaMarkt']['progress'] = int((current / total) * 100)
-            if error:
-                scraping_status['MediaMarkt']['error'] = error
-            socketio.emit('scraping_progress', scraping_status)
-        
-        media_markt_phones = media_markt_scraper.scrape_all_phones(progress_callback=media_markt_progress_callback)
-        scraping_status['MediaMarkt']['status'] = 'completed'
-        scraping_status['MediaMarkt']['count'] = len(media_markt_phones)
-        if len(media_markt_phones) == 0:
-            scraping_status['MediaMarkt']['error'] = 'MediaMarkt\'tan telefon verisi çekilemedi.'
-        socketio.emit('scraping_progress', scraping_status)
-        logger.info(f"MediaMarkt verilerini çekme tamamlandı. {len(media_markt_phones)} adet telefon bulundu.")
-        
-        # Teknosa veri çekme
-        logger.info("Teknosa verilerini çekme işlemi başlatılıyor...")
-        scraping_status['Teknosa']['status'] = 'in_progress'
-        socketio.emit('scraping_progress', scraping_status)
-        
-        def teknosa_progress_callback(current, total, error=None, message=None):
-            scraping_status['Teknosa']['progress'] = int((current / total) * 100)
-            if error:
-                scraping_status['Teknosa']['error'] = error
-            socketio.emit('scraping_progress', scraping_status)
-        
-        teknosa_phones = teknosa_scraper.scrape_all_phones(progress_callback=teknosa_progress_callback)
-        scraping_status['Teknosa']['status'] = 'completed'
-        scraping_status['Teknosa']['count'] = len(teknosa_phones)
-        if len(teknosa_phones) == 0:
-            scraping_status['Teknosa']['error'] = 'Teknosa\'dan telefon verisi çekilemedi.'
-        socketio.emit('scraping_progress', scraping_status)
-        logger.info(f"Teknosa verilerini çekme tamamlandı. {len(teknosa_phones)} adet telefon bulundu.")
-        
-        # Vatan veri çekme
-        logger.info("Vatan Bilgisayar verilerini çekme işlemi başlatılıyor...")
-        scraping_status['Vatan']['status'] = 'in_progress'
-        socketio.emit('scraping_progress', scraping_status)
-        
-        def vatan_progress_callback(current, total, error=None, message=None):
-            scraping_status['Vatan']['progress'] = int((current / total) * 100)
-            if error:
-                scraping_status['Vatan']['error'] = error
-            socketio.emit('scraping_progress', scraping_status)
-        
-        vatan_phones = vatan_scraper.scrape_all_phones(progress_callback=vatan_progress_callback)
-        scraping_status['Vatan']['status'] = 'completed'
-        scraping_status['Vatan']['count'] = len(vatan_phones)
-        if len(vatan_phones) == 0:
-            scraping_status['Vatan']['error'] = 'Vatan Bilgisayar\'dan telefon verisi çekilemedi.'
-        socketio.emit('scraping_progress', scraping_status)
-        logger.info(f"Vatan Bilgisayar verilerini çekme tamamlandı. {len(vatan_phones)} adet telefon bulundu.")
-        
-        # Telefonları birleştir
-        all_phones = media_markt_phones + teknosa_phones + vatan_phones
-        
-        # Telefonları veritabanına kaydet
-        save_phones_to_database(all_phones)
+        # Tüm siteleri eşzamanlı çalıştır; her site kendi süre sınırına sahip
+        # Scraper nesneleri uygulama boyunca yaşar; paylaşılan bağlantı havuzu
+        # sayesinde açılan bağlantılar sonraki çalıştırmalarda da kullanılır
+        orchestrator = ScrapeOrchestrator(
+            scrapers,
+            display_names=SCRAPER_DISPLAY_NAMES,
+            timeouts=SCRAPER_TIMEOUTS,
+            default_timeout=SCRAPER_TIMEOUT,
+            emit=publish_progress,
+            sink=writer.add,
+            job=job,
+            coordinator=run_coordinator
+        )
+        try:
+            _, status = orchestrator.run(sources)
+        finally:
+            # Kalan kayıtları yaz
+            write_stats = writer.close()
         
         # İşlem tamamlandı
-        total_count = len(all_phones)
+        total_count = write_stats['received']
         if total_count == 0:
-            finish_message = "Veri çekme işlemi tamamlandı, ancak hiçbir siteden telefon verisi çekilemedi."
+            finish_message = f"{label} işlemi tamamlandı, ancak hiçbir siteden telefon verisi çekilemedi."
             logger.warning(finish_message)
         else:
-            finish_message = f"Veri çekme işlemi tamamlandı. Toplam {total_count} adet telefon çekildi."
+            finish_message = (f"{label} işlemi tamamlandı. Toplam {total_count} adet telefon çekildi, "
+                              f"{write_stats['saved']} adedi kaydedildi.")
             logger.info(finish_message)
         
+        report(message=finish_message, counts={'received': total_count, 'saved': write_stats['saved']})
         socketio.emit('scraping_status', {
             'status': 'completed', 
+            'job': job,
             'message': finish_message,
-            'total_count': total_count
+            'total_count': total_count,
+            'saved_count': write_stats['saved']
         })
         
-        return True
+        return status
     except Exception as e:
-        error_message = f"Veri çekme işlemi sırasında hata oluştu: {str(e)}"
+        error_message = f"{label} işlemi sırasında hata oluştu: {str(e)}"
         logger.error(error_message)
-        socketio.emit('scraping_status', {'status': 'error', 'message': error_message})
-        return False
+        report(error=error_message)
+        socketio.emit('scraping_status', {'status': 'error', 'job': job, 'message': error_message})
+        return None
+
+def update_phone_data():
+    """Tüm sitelerde telefon verilerini (fiyatlar ve özellikler) günceller"""
+    return run_scrape_job(JOB_SPECS) is not None
+
+def update_phone_prices():
+    """Tüm sitelerde yalnızca liste sayfalarındaki fiyatları günceller"""
+    return run_scrape_job(JOB_PRICES) is not None
+
+def run_source_job(source, job):
+    """
+    Zamanlanmış işi tek bir kaynak için çalıştırır.
+    
+    Returns:
+        str: Kaynağın son durumu ('completed', 'timeout', 'error')
+    """
+    status = run_scrape_job(job, sources=[source])
+    if status is None:
+        return 'error'
+    return status.get(SCRAPER_DISPLAY_NAMES.get(source, source), {}).get('status', 'error')
 
-# Zamanlanmış görevleri ekle
-scheduler.add_job(update_phone_data, 'interval', hours=1, id='update_phone_data')
+# Zamanlanmış görevleri ekle: her site için ayrı fiyat ve özellik işleri
+source_scheduler = SourceScheduler(scheduler, run_source_job, SCRAPER_SCHEDULES)
+source_scheduler.add_jobs(scrapers.keys())
 
 # API Route'ları
 @app.route('/')
@@ -306,6 +337,16 @@ def get_price_history(model):
     price_history = db.get_price_history(model)
     return jsonify(price_history)
 
+@app.route('/api/scraper_stats')
+def get_scraper_stats():
+    """Scraper performans istatistikleri API'si"""
+    return jsonify({source: scraper.get_stats() for source, scraper in scrapers.items()})
+
+@app.route('/api/scheduler_stats')
+def get_scheduler_stats():
+    """Kaynak başına zamanlanmış çalıştırma süreleri API'si"""
+    return jsonify(source_scheduler.stats())
+
 @app.route('/api/export/excel')
 def export_excel():
     """Excel export API'si"""
@@ -342,17 +383,27 @@ def export_html():
         logger.error(f"HTML export hatası: {str(e)}")
         return jsonify({"success": False, "message": f"Hata: {str(e)}"}), 500
 
+def _job_response(job, created):
+    """İş kaydından manuel güncelleme isteğinin yanıtını oluşturur"""
+    if created:
+        message = 'Veri güncelleme işlemi başlatıldı. İşlem tamamlandığında bildirim alacaksınız.'
+    else:
+        message = 'Bu kaynak için veri güncelleme işlemi zaten sürüyor.'
+    return jsonify({
+        'status': 'success',
+        'job_id': job['id'],
+        'job_status': job['status'],
+        'status_url': url_for('get_job', job_id=job['id']),
+        'message': message
+    }), 202
+
 @app.route('/update_data')
 def update_data():
-    """Verileri manuel olarak güncelle"""
+    """Verileri manuel olarak güncelle (arka planda çalışır, iş kimliği döner)"""
     try:
         logger.info("Manuel veri güncelleme isteği alındı")
-        # Arka planda çalıştırmak yerine doğrudan çalıştır
-        update_phone_data()
-        return jsonify({
-            'status': 'success', 
-            'message': 'Veri güncelleme işlemi başlatıldı. İşlem tamamlandığında bildirim alacaksınız.'
-        })
+        job, created = job_manager.submit(JOB_SPECS, list(scrapers.keys()), run_scrape_job, JOB_SPECS)
+        return _job_response(job, created)
     except Exception as e:
         logger.error(f"Veri güncelleme hatası: {str(e)}", exc_info=True)
         return jsonify({
@@ -363,7 +414,7 @@ def update_data():
 # Belirli bir kaynaktan veri güncelleme
 @app.route('/update_data/<source>')
 def update_source_data(source):
-    """Belirli bir kaynaktan verileri güncelle"""
+    """Belirli bir kaynaktan verileri güncelle (arka planda çalışır, iş kimliği döner)"""
     try:
         logger.info(f"{source} için veri güncelleme isteği alındı")
         
@@ -372,80 +423,29 @@ def update_source_data(source):
                 'status': 'error',
                 'message': f'Geçersiz kaynak: {source}'
             }), 400
-            
-        # İlerleme durumunu sıfırla
-        socketio.emit('scraping_progress', {
-            'source': source,
-            'progress': 0,
-            'status': 'başladı'
-        })
-        
-        # Veri çek
-        scraper = scrapers[source]
-        phones = scraper.scrape_all_phones(
-            progress_callback=lambda current, total, error=None, message=None: socketio.emit('scraping_progress', {
-                'source': source,
-                'progress': int(current),
-                'status': 'devam ediyor' if not error else 'hata',
-                'error': error,
-                'message': message
-            })
-        )
-        
-        # Veritabanına ekle
-        success_count = 0
-        for phone in phones:
-            try:
-                model = phone.get("model", "")
-                brand = model.split(" ")[0] if " " in model else ""
-                price_str = phone.get("price", "0")
-                
-                # Fiyat string işleme
-                if isinstance(price_str, str):
-                    price_str = price_str.replace(" TL", "").replace(".", "").replace(",", ".")
-                    price = float(price_str)
-                else:
-                    price = float(price_str)
-                
-                specs = phone.get("specs", {})
-                
-                # Veritabanına ekle
-                phone_id = db.add_phone(model, brand, price, specs, source.capitalize())
-                
-                if phone_id:
-                    success_count += 1
-                    logger.debug(f"Telefon eklendi: {brand} {model}")
-            except Exception as e:
-                logger.error(f"Telefon ekleme hatası: {str(e)}")
-                continue
-                
-        # İşlem tamamlandı
-        logger.info(f"{source} sitesinden toplam {len(phones)} telefondan {success_count} tanesi başarıyla eklendi")
-        socketio.emit('scraping_progress', {
-            'source': source,
-            'progress': 100,
-            'status': 'tamamlandı',
-            'message': f"{success_count} telefon verisi güncellendi"
-        })
-            
-        return jsonify({
-            'status': 'success',
-            'message': f'{source} için veri güncelleme tamamlandı.'
-        })
         
+        job, created = job_manager.submit(JOB_SPECS, [source], update_source_phones, source)
+        return _job_response(job, created)
     except Exception as e:
         logger.error(f"{source} veri güncelleme hatası: {str(e)}", exc_info=True)
-        socketio.emit('scraping_progress', {
-            'source': source,
-            'progress': 0,
-            'status': 'hata',
-            'error': str(e)
-        })
         return jsonify({
             'status': 'error',
             'message': f'Veri güncelleme hatası: {str(e)}'
         }), 500
 
+@app.route('/api/jobs')
+def list_jobs():
+    """Veri güncelleme işleri API'si (?active=1 ile yalnızca sürenler)"""
+    return jsonify(job_manager.list(active_only=request.args.get('active') in ('1', 'true')))
+
+@app.route('/api/jobs/<job_id>')
+def get_job(job_id):
+    """Veri güncelleme işinin durumu: ilerleme, sayılar ve hatalar"""
+    job = job_manager.get(job_id)
+    if job is None:
+        return jsonify({'status': 'error', 'message': f'İş bulunamadı: {job_id}'}), 404
+    return jsonify(job)
+
 @app.route('/api/compare', methods=['POST'])
 def compare_phones():
     """Telefon karşılaştırma API'si"""
@@ -624,7 +624,8 @@ def handle_request_update():
     """İstemciden veri güncelleme isteği geldiğinde"""
     logger.info("İstemciden veri güncelleme isteği alındı")
     # Arka planda güncelleme işlemini başlat
-    update_phone_data()
+    job, _ = job_manager.submit(JOB_SPECS, list(scrapers.keys()), run_scrape_job, JOB_SPECS)
+    emit('update_job', {'job_id': job['id'], 'status': job['status']})
 
 @socketio.on('request_source_update')
 def handle_source_update(data):
@@ -632,72 +633,25 @@ def handle_source_update(data):
     source = data.get('source')
     if source and source in scrapers:
         logger.info(f"İstemciden {source} için güncelleme isteği alındı")
-        
-        # İşlemi gerçekleştir
-        try:
-            # İlerleme durumunu sıfırla
-            socketio.emit('scraping_progress', {
-                'source': source,
-                'progress': 0,
-                'status': 'başladı'
-            })
-            
-            # Veri çek
-            scraper = scrapers[source]
-            phones = scraper.scrape_all_phones(
-                progress_callback=lambda current, total, error=None, message=None: socketio.emit('scraping_progress', {
-                    'source': source,
-                    'progress': int(current),
-                    'status': 'devam ediyor' if not error else 'hata',
-                    'error': error,
-                    'message': message
-                })
-            )
-            
-            # Veritabanına ekle
-            success_count = 0
-            for phone in phones:
-                try:
-                    model = phone.get("model", "")
-                    brand = model.split(" ")[0] if " " in model else ""
-                    price_str = phone.get("price", "0")
-                    
-                    # Fiyat string işleme
-                    if isinstance(price_str, str):
-                        price_str = price_str.replace(" TL", "").replace(".", "").replace(",", ".")
-                        price = float(price_str)
-                    else:
-                        price = float(price_str)
-                    
-                    specs = phone.get("specs", {})
-                    
-                    # Veritabanına ekle
-                    phone_id = db.add_phone(model, brand, price, specs, source.capitalize())
-                    
-                    if phone_id:
-                        success_count += 1
-                        logger.debug(f"Telefon eklendi: {brand} {model}")
-                except Exception as e:
-                    logger.error(f"Telefon ekleme hatası: {str(e)}")
-                    continue
-                    
-            # İşlem tamamlandı
-            logger.info(f"{source} sitesinden toplam {len(phones)} telefondan {success_count} tanesi başarıyla eklendi")
-            socketio.emit('scraping_progress', {
-                'source': source,
-                'progress': 100,
-                'status': 'tamamlandı',
-                'message': f"{success_count} telefon verisi güncellendi"
-            })
-                
-        except Exception as e:
-            logger.error(f"{source} veri güncelleme hatası: {str(e)}", exc_info=True)
-            socketio.emit('scraping_progress', {
-                'source': source,
-                'progress': 0,
-                'status': 'hata',
-                'error': str(e)
-            })
+        job, _ = job_manager.submit(JOB_SPECS, [source], update_source_phones, source)
+        emit('update_job', {'job_id': job['id'], 'source': source, 'status': job['status']})
+
+def update_source_phones(source, report=None):
+    """
+    Tek bir kaynaktaki telefon verilerini günceller.
+    
+    Tüm kaynakların taramasıyla aynı yolu kullanır: kayıtlar akış halinde küçük
+    gruplar olarak kaydedilir ve kaynak başka bir yerden taranıyorsa o
+    çalıştırmanın sonucu beklenir.
+    
+    Args:
+        source (str): Kaynak anahtarı
+        report (callable, optional): İş durumunu güncellemek için report(**alanlar)
+    
+    Returns:
+        dict: Kaynak adı -> son durum; işlem hata ile sonlandıysa None
+    """
+    return run_scrape_job(JOB_SPECS, sources=[source], report=report)
 
 def save_phones_to_database(phones):
     """
@@ -715,7 +669,7 @@ def save_phones_to_database(phones):
             return 0
             
         # Supabase bağlantısını al
-        supabase_client = get_supabase_client()
+        supabase_client = db.supabase
         
         # Mevcut telefonları temizle (her seferinde tümünü güncelliyoruz)
         # supabase_client.table("phones").delete().execute()
@@ -762,7 +716,7 @@ def get_phones_from_database():
     """
     try:
         # Supabase bağlantısını al
-        supabase_client = get_supabase_client()
+        supabase_client = db.supabase
         
         # Telefonları çek
         result = supabase_client.table("phones").select("*").execute()
@@ -907,4 +861,7 @@ if __name__ == '__main__':
     print(f"Host: {WEB_HOST}")
     print(f"Port: {WEB_PORT}")
     print(f"Debug: {DEBUG}")
+    # Debug modunda yeniden yükleyici iki süreç başlatır; işler yalnızca uygulamayı çalıştıran süreçte zamanlanır
+    if not DEBUG or os.environ.get('WERKZEUG_RUN_MAIN') == 'true':
+        scheduler.start()
     socketio.run(app, host=WEB_HOST, port=WEB_PORT, debug=DEBUG, allow_unsafe_werkzeug=True) 
\ No newline at end of file
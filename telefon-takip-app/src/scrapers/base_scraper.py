@@ -1,11 +1,11 @@
+import asyncio
+import hashlib
 import requests
 from abc import ABC, abstractmethod
-from bs4 import BeautifulSoup
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from urllib.parse import urljoin, urlparse
 import time
+import threading
 import logging
 import os
 import sys
@@ -13,7 +13,45 @@ import sys
 # Ana dizini ekle
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
-from src.config import FIRECRAWL_API_KEY
+from src.scrapers.response_cache import get_response_cache, normalize_url
+from src.scrapers.record_store import get_record_store
+from src.scrapers.rate_limiter import get_rate_limiter
+from src.scrapers.resilience import RetryPolicy, CircuitOpenError, get_circuit_breaker
+from src.scrapers.webdriver_pool import get_webdriver_pool, wait_for_page_ready, build_blocked_url_patterns
+from src.scrapers.firecrawl_batch import FirecrawlBatchClient
+from src.scrapers.html_parser import parse_html, resolve_backend
+from src.scrapers.parse_pool import get_parse_pool
+from src.scrapers.http_client import get_http_client
+from src.scrapers.structured_data import extract_product, EMBEDDED_STATE_NAMES
+from src.config import (
+    FIRECRAWL_API_KEY, SCRAPER_REQUEST_TIMEOUT, SCRAPER_MAX_CONCURRENCY_PER_HOST,
+    SCRAPER_DETAIL_WORKERS, SCRAPER_MAX_PRODUCTS, SELENIUM_MAX_WAIT, SCRAPER_CACHE_ENABLED,
+    SCRAPER_CONDITIONAL_GET_ENABLED, FIRECRAWL_BATCH_ENABLED, HTML_TARGETED_PARSING,
+    SCRAPER_RATE_LIMIT_ENABLED, SCRAPER_CIRCUIT_BREAKER_ENABLED, PARSE_POOL_ENABLED, STRUCTURED_DATA_ENABLED,
+    SCRAPER_INCREMENTAL_ENABLED, SCRAPER_MAX_SPEC_AGE_HOURS, SCRAPER_CACHE_TTLS, SELENIUM_FALLBACK_ENABLED
+)
+
+# Koşullu GET isteğinde sayfanın değişmediğini (304) belirten değer
+NOT_MODIFIED = object()
+
+# Sayfa çekilemediğinde başarısızlığın nedeni. Yalnızca geçici ağ hatalarında
+# (zaman aşımı, bağlantı hatası, 5xx) Selenium ile yeniden denemek anlamlıdır.
+FETCH_TRANSIENT = 'transient'
+FETCH_CIRCUIT_OPEN = 'circuit_open'
+FETCH_CLIENT_ERROR = 'client_error'
+FETCH_ERROR = 'error'
+
+# Ürün kartlarının geldiği liste kaynakları; kart parmak izleri kaynak başına saklanır
+LISTING_HTML = 'html'
+LISTING_FIRECRAWL = 'firecrawl'
+
+# Ürün detay sayfaları için Firecrawl parametreleri (tekil ve toplu taramada aynı)
+FIRECRAWL_DETAIL_PARAMS = {
+    'formats': ['markdown', 'json'],
+    'jsonOptions': {
+        'prompt': "Extract the following smartphone information: name, brand, price, screen size, processor, RAM, storage, battery, camera details"
+    }
+}
 
 class BaseScraper(ABC):
     """
@@ -21,6 +59,30 @@ class BaseScraper(ABC):
     Tüm site-spesifik scraperlar bu sınıftan türetilmelidir.
     """
     
+    # Selenium ile açılan sayfaların hazır sayılması için beklenecek koşullar.
+    # CSS seçicisi veya ağ trafiğinin durmasını beklemek için 'networkidle' olabilir.
+    listing_ready_selector = None
+    detail_ready_selector = None
+    
+    # Selenium ile sayfa açılırken varsayılanlara ek olarak engellenecek URL desenleri
+    # ve varsayılan engelleme listesinden çıkarılacak desenler
+    blocked_url_patterns = []
+    allowed_url_patterns = []
+    
+    # Hedefli ayrıştırmada yalnızca bu CSS sınıflarına sahip öğeler (ve alt ağaçları)
+    # belleğe alınır. Boş liste sayfanın tamamının ayrıştırılması anlamına gelir.
+    listing_parse_classes = []
+    detail_parse_classes = []
+    
+    # Liste sayfalarındaki ürün kartları ve kart içindeki ürün adı, fiyat ve rozet seçicileri
+    listing_item_selector = None
+    listing_name_selector = None
+    listing_price_selector = None
+    listing_badge_selector = None
+    
+    # Detay sayfalarında aranacak gömülü uygulama durumu değişkenleri / script kimlikleri
+    embedded_state_names = EMBEDDED_STATE_NAMES
+    
     def __init__(self, base_url, site_name):
         self.base_url = base_url
         self.site_name = site_name
@@ -28,57 +90,466 @@ class BaseScraper(ABC):
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
             'Accept-Language': 'tr-TR,tr;q=0.9,en-US;q=0.8,en;q=0.7'
         }
-        self.session = requests.Session()
+        self.max_concurrency_per_host = SCRAPER_MAX_CONCURRENCY_PER_HOST
+        self.request_timeout = SCRAPER_REQUEST_TIMEOUT
+        self.detail_workers = SCRAPER_DETAIL_WORKERS
+        self.max_products = SCRAPER_MAX_PRODUCTS
+        self.html_parser = resolve_backend()
+        self.targeted_parsing = HTML_TARGETED_PARSING
+        self.structured_data = STRUCTURED_DATA_ENABLED
+        
+        # Detay sayfalarını ayrı süreçlerde ayrıştıran havuz (yalnızca büyük çalıştırmalarda kullanılır)
+        self.parse_pool = get_parse_pool() if PARSE_POOL_ENABLED else None
+        self._parse_in_pool = False
+        
+        # Süreç genelinde paylaşılan bağlantı havuzu: bağlantılar scraper'lar ve çalıştırmalar
+        # arasında açık kalır, TLS el sıkışması host başına bir kez yapılır
+        self.http_client = get_http_client()
+        self.session = self.http_client.session
         self.logger = logging.getLogger(f"scraper.{site_name}")
+        
+        # Diskteki yanıt önbelleği (süreç genelinde paylaşılır)
+        self.response_cache = get_response_cache() if SCRAPER_CACHE_ENABLED else None
+        
+        # HTTP doğrulayıcıları, son çıkarılan kayıtlar ve liste kartı parmak izleri
+        # (çalıştırmalar arasında korunur)
+        self.conditional_get = SCRAPER_CONDITIONAL_GET_ENABLED
+        self.incremental = SCRAPER_INCREMENTAL_ENABLED
+        self.max_spec_age = SCRAPER_MAX_SPEC_AGE_HOURS * 3600
+        self.record_store = get_record_store() if self.conditional_get or self.incremental else None
+        
+        # Host başına uyarlanabilir hız sınırı (süreç genelinde paylaşılır)
+        self.rate_limiter = get_rate_limiter() if SCRAPER_RATE_LIMIT_ENABLED else None
+        
+        # Geçici hatalar için yeniden deneme politikası ve site başına devre kesici
+        self.retry_policy = RetryPolicy()
+        self.circuit_breaker_enabled = SCRAPER_CIRCUIT_BREAKER_ENABLED
+        
+        # Detay sayfaları için Firecrawl toplu tarama istemcisi (alt sınıf self.firecrawl tanımlarsa kullanılır)
+        self.firecrawl_batch = FirecrawlBatchClient(FIRECRAWL_API_KEY) if FIRECRAWL_BATCH_ENABLED and FIRECRAWL_API_KEY else None
+        
+        # İstatistik sayaçları
+        self._stats_lock = threading.Lock()
+        self._counters = {}
     
-    def _get_page_content(self, url):
+    def parse_settings(self):
         """
-        Belirtilen URL'den sayfa içeriğini alır.
+        Sayfa ayrıştırmak için gereken ayarları döndürür (ayrıştırma süreçlerine gönderilir).
+        
+        Returns:
+            dict: base_url, site_name, html_parser, targeted_parsing, structured_data
+        """
+        return {
+            'base_url': self.base_url,
+            'site_name': self.site_name,
+            'html_parser': self.html_parser,
+            'targeted_parsing': self.targeted_parsing,
+            'structured_data': self.structured_data
+        }
+    
+    @classmethod
+    def for_parsing(cls, settings):
+        """
+        Yalnızca ayrıştırma metodlarını kullanmak için nesne oluşturur.
+        
+        __init__ çağrılmaz: HTTP oturumu, önbellekler, kayıt deposu ve Firecrawl
+        istemcisi oluşturulmaz. Ayrıştırma süreçlerinde kullanılır.
+        
+        Args:
+            settings (dict): parse_settings() çıktısı
+            
+        Returns:
+            BaseScraper: Ayrıştırmaya hazır nesne
+        """
+        scraper = cls.__new__(cls)
+        for key, value in settings.items():
+            setattr(scraper, key, value)
+        scraper.logger = logging.getLogger(f"scraper.{settings['site_name']}")
+        scraper._stats_lock = threading.Lock()
+        scraper._counters = {}
+        return scraper
+    
+    def _count_stat(self, section, field, amount=1):
+        """
+        İstatistik sayacını iş parçacığı güvenli şekilde artırır.
+        
+        Args:
+            section (str): İstatistik bölümü (ör. 'conditional_get')
+            field (str): Sayaç adı
+            amount (int/float): Artış miktarı
+        """
+        with self._stats_lock:
+            counters = self._counters.setdefault(section, {})
+            counters[field] = counters.get(field, 0) + amount
+    
+    def _send(self, url, headers=None, timeout=None):
+        """
+        Paylaşılan oturum üzerinden tek bir GET isteği yapar.
+        
+        Hız sınırı açıksa istek host'un token bucket'ından izin alınarak yapılır ve
+        yanıt durumu/süresi hızın ayarlanması için sınırlayıcıya bildirilir.
+        
+        Args:
+            url (str): İstek yapılacak URL
+            headers (dict, optional): İstek başlıkları (varsayılan: self.headers)
+            timeout (int, optional): Saniye cinsinden zaman aşımı
+            
+        Returns:
+            requests.Response: HTTP yanıtı
+        """
+        if self.rate_limiter is None:
+            return self.session.get(
+                url,
+                headers=headers or self.headers,
+                timeout=timeout or self.request_timeout
+            )
+        
+        self.rate_limiter.acquire(url)
+        started = time.monotonic()
+        try:
+            response = self.session.get(
+                url,
+                headers=headers or self.headers,
+                timeout=timeout or self.request_timeout
+            )
+        except (requests.exceptions.Timeout, requests.exceptions.ConnectionError):
+            self.rate_limiter.record(url, None, time.monotonic() - started)
+            raise
+        self.rate_limiter.record(
+            url, response.status_code, time.monotonic() - started,
+            retry_after=response.headers.get('Retry-After')
+        )
+        return response
+    
+    def _request(self, url, headers=None, timeout=None):
+        """
+        GET isteği yapar; geçici hatalarda yeniden dener.
+        
+        Zaman aşımı, bağlantı hataları ve 429/5xx yanıtları retry_policy'ye göre
+        rastgeleleştirilmiş üstel beklemeyle yeniden denenir. Site devresi açıksa
+        istek yapılmadan CircuitOpenError fırlatılır; devre deneme sırasında açılırsa
+        kalan denemeler yapılmaz.
+        
+        Args:
+            url (str): İstek yapılacak URL
+            headers (dict, optional): İstek başlıkları (varsayılan: self.headers)
+            timeout (int, optional): Saniye cinsinden zaman aşımı
+            
+        Returns:
+            requests.Response: HTTP yanıtı (son denemenin yanıtı)
+        """
+        breaker = get_circuit_breaker(urlparse(url).netloc) if self.circuit_breaker_enabled else None
+        attempts = self.retry_policy.max_attempts
+        
+        for attempt in range(1, attempts + 1):
+            if breaker and not breaker.allow_request():
+                self._count_stat('retry', 'circuit_rejected')
+                raise CircuitOpenError(f"{breaker.name} devresi açık, istek yapılmadı: {url}")
+            
+            try:
+                response = self._send(url, headers=headers, timeout=timeout)
+            except requests.exceptions.RequestException as e:
+                if breaker:
+                    breaker.record_failure()
+                if not self.retry_policy.should_retry_exception(e):
+                    raise
+                if attempt == attempts or (breaker and breaker.state == breaker.OPEN):
+                    self._count_stat('retry', 'gave_up')
+                    raise
+                reason = type(e).__name__
+            else:
+                if not self.retry_policy.should_retry_status(response.status_code):
+                    if breaker:
+                        breaker.record_success()
+                    return response
+                if breaker:
+                    breaker.record_failure()
+                if attempt == attempts or (breaker and breaker.state == breaker.OPEN):
+                    self._count_stat('retry', 'gave_up')
+                    return response
+                reason = f"HTTP {response.status_code}"
+            
+            delay = self.retry_policy.delay(attempt)
+            self._count_stat('retry', 'retries')
+            self.logger.warning(f"İstek başarısız ({reason}), {delay:.1f} sn sonra yeniden denenecek "
+                                f"({attempt}/{attempts - 1}): {url}")
+            time.sleep(delay)
+    
+    def _parse_html(self, html, parse_classes=None):
+        """
+        HTML içeriğini scraper'ın ayrıştırıcısıyla (self.html_parser) ayrıştırır.
+        
+        Args:
+            html (str/bytes): HTML içeriği
+            parse_classes (list, optional): Hedefli ayrıştırmada tutulacak CSS sınıfları
+                (ör. self.detail_parse_classes). targeted_parsing kapalıysa yok sayılır.
+            
+        Returns:
+            BeautifulSoup veya SelectolaxNode: select/select_one/find destekleyen belge
+        """
+        parse_only = parse_classes if self.targeted_parsing else None
+        return parse_html(html, self.html_parser, parse_only=parse_only)
+    
+    def _fetch_html(self, url, headers=None, timeout=None, resource_type='default', validators=None, use_cache=True):
+        """
+        URL'nin HTML içeriğini metin olarak alır.
+        
+        Argümanlar ve önbellek davranışı için bkz. _fetch_html_result.
+        
+        Returns:
+            str: Sayfa içeriği, sayfa değişmemişse NOT_MODIFIED, hata durumunda None
+        """
+        html, _ = self._fetch_html_result(url, headers, timeout, resource_type, validators, use_cache)
+        return html
+    
+    @staticmethod
+    def _failure_reason(error):
+        """
+        İstek hatasını başarısızlık nedenine çevirir.
+        
+        Args:
+            error (requests.RequestException): İstek hatası
+            
+        Returns:
+            str: FETCH_CIRCUIT_OPEN, FETCH_TRANSIENT, FETCH_CLIENT_ERROR veya FETCH_ERROR
+        """
+        if isinstance(error, CircuitOpenError):
+            return FETCH_CIRCUIT_OPEN
+        if isinstance(error, RetryPolicy.RETRY_EXCEPTIONS):
+            return FETCH_TRANSIENT
+        response = getattr(error, 'response', None)
+        if response is not None:
+            return FETCH_TRANSIENT if response.status_code >= 500 else FETCH_CLIENT_ERROR
+        return FETCH_ERROR
+    
+    def _fetch_html_result(self, url, headers=None, timeout=None, resource_type='default', validators=None,
+                           use_cache=True):
+        """
+        URL'nin HTML içeriğini alır ve başarısız olursa nedenini bildirir.
+        
+        İçerik önce diskteki önbellekte aranır; bulunamazsa istek yapılır ve
+        başarılı yanıt önbelleğe yazılır. Doğrulayıcılar verilirse koşullu istek
+        yapılır ve sayfa değişmemişse NOT_MODIFIED döner.
         
         Args:
             url (str): İçeriği alınacak URL
+            headers (dict, optional): İstek başlıkları
+            timeout (int, optional): Saniye cinsinden zaman aşımı
+            resource_type (str): Önbellek süresini belirleyen kaynak türü ('listing', 'detail' vb.)
+            validators (dict, optional): {'etag': ..., 'last_modified': ...}
+            use_cache (bool): False ise önbellekteki kopya kullanılmaz (yeni yanıt yine önbelleğe yazılır)
             
         Returns:
-            BeautifulSoup: Sayfa içeriğinin BeautifulSoup nesnesi
+            tuple: (sayfa içeriği veya NOT_MODIFIED ya da hata durumunda None,
+                başarısızlık nedeni (FETCH_*) ya da başarılıysa None)
         """
+        if self.response_cache and use_cache:
+            cached = self.response_cache.get(url, resource_type)
+            if cached is not None:
+                self.logger.debug(f"Önbellekten alındı: {url}")
+                return cached, None
+        
+        request_headers = dict(headers or self.headers)
+        if validators:
+            if validators.get('etag'):
+                request_headers['If-None-Match'] = validators['etag']
+            if validators.get('last_modified'):
+                request_headers['If-Modified-Since'] = validators['last_modified']
+        
         try:
-            response = self.session.get(url, headers=self.headers, timeout=30)
+            response = self._request(url, headers=request_headers, timeout=timeout)
+            if validators and response.status_code == 304:
+                self._count_stat('conditional_get', 'not_modified')
+                return NOT_MODIFIED, None
             response.raise_for_status()
-            return BeautifulSoup(response.text, 'html.parser')
         except requests.exceptions.RequestException as e:
             self.logger.error(f"URL çekilirken hata oluştu {url}: {e}")
-            return None
+            return None, self._failure_reason(e)
+        
+        html = response.text
+        if validators:
+            self._count_stat('conditional_get', 'modified')
+        if self.response_cache:
+            self.response_cache.set(url, html, resource_type)
+        if self.record_store and self.conditional_get:
+            self.record_store.set_validators(
+                url,
+                etag=response.headers.get('ETag'),
+                last_modified=response.headers.get('Last-Modified')
+            )
+        return html, None
     
-    def _get_page_with_selenium(self, url):
+    async def fetch_many(self, urls, headers=None, timeout=None, resource_type='default', use_cache=True):
         """
-        Selenium kullanarak JavaScript gerektiren sayfaları çeker.
+        Birden fazla URL'yi eşzamanlı olarak çeker.
+        
+        Aynı host'a aynı anda en fazla `max_concurrency_per_host` istek yapılır.
+        Her deneme kendi zaman aşımına sahiptir; yeniden denemeler ve hız sınırı
+        beklemeleri toplam süreyi uzatabileceğinden dışarıdan ayrıca süre sınırı konmaz.
         
         Args:
-            url (str): İçeriği alınacak URL
+            urls (list): Çekilecek URL'ler
+            headers (dict, optional): İstek başlıkları
+            timeout (int, optional): İstek başına saniye cinsinden zaman aşımı
+            resource_type (str): Önbellek süresini belirleyen kaynak türü
+            use_cache (bool): False ise önbellekteki kopyalar kullanılmaz
             
         Returns:
-            BeautifulSoup: Sayfa içeriğinin BeautifulSoup nesnesi
+            dict: URL -> sayfa içeriği (hata durumunda None)
         """
-        try:
-            options = Options()
-            options.add_argument('--headless')
-            options.add_argument('--no-sandbox')
-            options.add_argument('--disable-dev-shm-usage')
+        timeout = timeout or self.request_timeout
+        semaphores = {}
+        
+        async def fetch_one(url):
+            host = urlparse(url).netloc
+            if host not in semaphores:
+                semaphores[host] = asyncio.Semaphore(self.max_concurrency_per_host)
+            async with semaphores[host]:
+                # İstek engelleyici olduğundan iş parçacığında çalıştırılır
+                return await asyncio.to_thread(
+                    self._fetch_html, url, headers, timeout, resource_type, use_cache=use_cache
+                )
+        
+        unique_urls = list(dict.fromkeys(urls))
+        results = await asyncio.gather(*(fetch_one(url) for url in unique_urls))
+        return dict(zip(unique_urls, results))
+    
+    def fetch_many_sync(self, urls, headers=None, timeout=None, resource_type='default', use_cache=True):
+        """
+        fetch_many metodunun senkron sarmalayıcısı.
+        
+        Returns:
+            dict: URL -> sayfa içeriği (hata durumunda None)
+        """
+        if not urls:
+            return {}
+        return asyncio.run(self.fetch_many(
+            urls, headers=headers, timeout=timeout, resource_type=resource_type, use_cache=use_cache
+        ))
+    
+    def get_pages(self, urls, headers=None, resource_type='default'):
+        """
+        Birden fazla sayfayı eşzamanlı çekip ayrıştırır.
+        
+        Args:
+            urls (list): Çekilecek URL'ler
+            headers (dict, optional): İstek başlıkları
+            resource_type (str): Önbellek süresini belirleyen kaynak türü
             
-            service = Service(ChromeDriverManager().install())
-            driver = webdriver.Chrome(service=service, options=options)
+        Returns:
+            dict: URL -> ayrıştırılmış belge (hata durumunda None)
+        """
+        pages = self.fetch_many_sync(urls, headers=headers, resource_type=resource_type)
+        return {
+            url: self._parse_html(html) if html else None
+            for url, html in pages.items()
+        }
+    
+    def _get_page_content(self, url):
+        """
+        Belirtilen URL'den sayfa içeriğini alır.
+        
+        Args:
+            url (str): İçeriği alınacak URL
             
-            driver.get(url)
-            time.sleep(3)  # Sayfanın yüklenmesi için bekle
+        Returns:
+            BeautifulSoup: Sayfa içeriğinin ayrıştırılmış belgesi
+        """
+        html = self._fetch_html(url)
+        if html is None:
+            return None
+        return self._parse_html(html)
+    
+    def _fetch_html_with_selenium(self, url, resource_type='default', ready_selector=None, max_wait=None):
+        """
+        Selenium kullanarak JavaScript gerektiren sayfaların HTML içeriğini alır.
+        
+        Sabit bir süre beklemek yerine sayfa hazır olma koşulu sağlanır sağlanmaz döner.
+        Koşul verilmezse kaynak türüne göre listing_ready_selector veya
+        detail_ready_selector kullanılır. Sayfa yüklemeleri HTTP istekleriyle aynı
+        host hız sınırından izin alır ve site devresine sayılır; devre açıksa
+        tarayıcı hiç açılmaz.
+        
+        Args:
+            url (str): İçeriği alınacak URL
+            resource_type (str): Kaynak türü ('listing', 'detail' vb.)
+            ready_selector (str, optional): Beklenecek CSS seçicisi veya 'networkidle'
+            max_wait (float, optional): Azami bekleme süresi (saniye)
             
-            page_source = driver.page_source
-            driver.quit()
+        Returns:
+            str: Sayfa içeriği, hata durumunda None
+        """
+        if ready_selector is None:
+            ready_selector = {
+                'listing': self.listing_ready_selector,
+                'detail': self.detail_ready_selector
+            }.get(resource_type)
+        max_wait = max_wait or SELENIUM_MAX_WAIT
+        breaker = get_circuit_breaker(urlparse(url).netloc) if self.circuit_breaker_enabled else None
+        if breaker and not breaker.allow_request():
+            self._count_stat('retry', 'circuit_rejected')
+            self.logger.warning(f"{breaker.name} devresi açık, Selenium ile sayfa açılmadı: {url}")
+            return None
+        try:
+            # Havuzdan sıcak bir sürücü kirala; sürücü işlem sonunda havuza döner
+            blocked_urls = build_blocked_url_patterns(self.blocked_url_patterns, self.allowed_url_patterns)
+            with get_webdriver_pool().lease(blocked_urls=blocked_urls) as driver:
+                if self.rate_limiter is not None:
+                    self.rate_limiter.acquire(url)
+                started = time.monotonic()
+                try:
+                    driver.get(url)
+                except Exception:
+                    if self.rate_limiter is not None:
+                        self.rate_limiter.record(url, None, time.monotonic() - started)
+                    raise
+                if self.rate_limiter is not None:
+                    self.rate_limiter.record(url, 200, time.monotonic() - started)
+                ready, waited = wait_for_page_ready(driver, ready_selector, max_wait)
+                page_source = driver.page_source
             
-            return BeautifulSoup(page_source, 'html.parser')
+            if breaker:
+                breaker.record_success()
+            if ready:
+                self.logger.info(f"Selenium bekleme süresi {waited:.2f} sn ({ready_selector or 'document'}): {url}")
+            else:
+                self.logger.warning(f"Sayfa {max_wait} sn içinde hazır olmadı ({ready_selector or 'document'}): {url}")
+            self._count_stat('selenium', resource_type)
+            return page_source
         except Exception as e:
+            if breaker:
+                breaker.record_failure()
             self.logger.error(f"Selenium ile sayfa çekilirken hata oluştu {url}: {e}")
             return None
     
+    def _get_page_with_selenium(self, url, ready_selector=None, max_wait=None, resource_type='default'):
+        """
+        Selenium kullanarak JavaScript gerektiren sayfaları çeker ve ayrıştırır.
+        
+        Returns:
+            BeautifulSoup: Sayfa içeriğinin ayrıştırılmış belgesi, hata durumunda None
+        """
+        html = self._fetch_html_with_selenium(url, resource_type, ready_selector, max_wait)
+        return self._parse_html(html) if html is not None else None
+    
+    def _fetch_html_with_fallback(self, url, resource_type='default', **kwargs):
+        """
+        _fetch_html ile sayfayı çeker; istek geçici bir ağ hatasıyla başarısız olursa
+        Selenium ile dener.
+        
+        Devre açıksa veya site 4xx döndürdüyse Selenium denenmez: tarayıcı aynı
+        sonucu daha pahalıya alır ve devrenin hızlı başarısız olmasını boşa çıkarır.
+        
+        Returns:
+            str: Sayfa içeriği, sayfa değişmemişse NOT_MODIFIED, hata durumunda None
+        """
+        html, reason = self._fetch_html_result(url, resource_type=resource_type, **kwargs)
+        if html is None and reason == FETCH_TRANSIENT and SELENIUM_FALLBACK_ENABLED:
+            self.logger.info(f"HTTP isteği başarısız, Selenium ile deneniyor: {url}")
+            self._count_stat('selenium', 'fallback')
+            html = self._fetch_html_with_selenium(url, resource_type)
+        return html
+    
     def _use_firecrawl(self, url, selectors):
         """
         Firecrawl API kullanarak veri çekme
@@ -106,10 +577,11 @@ class BaseScraper(ABC):
                 "extract": selectors.get("extract", {})
             }
             
-            response = requests.post(
+            response = self.session.post(
                 "https://api.firecrawl.dev/scrape",
                 headers=headers,
-                json=payload
+                json=payload,
+                timeout=self.request_timeout
             )
             
             response.raise_for_status()
@@ -120,6 +592,830 @@ class BaseScraper(ABC):
             self.logger.error(f"Firecrawl ile veri çekilirken hata oluştu: {e}")
             return None
     
+    def _fetch_phone_details(self, url):
+        """
+        Detay sayfasını çekip ayrıştırır; değişmeyen sayfalar için önceki kaydı kullanır.
+        
+        Sayfa için daha önce çıkarılmış bir kayıt varsa koşullu istek yapılır.
+        Sunucu 304 döndürürse sayfa ayrıştırılmaz ve saklanan kayıt döner.
+        
+        Args:
+            url (str): Telefonun detay sayfasının URL'si
+            
+        Returns:
+            dict: Telefonun özellikleri, sayfa alınamazsa None
+        """
+        record = self.record_store.get_record(url) if self.record_store and self.conditional_get else None
+        validators = self.record_store.get_validators(url) if record else None
+        
+        html = self._fetch_html_with_fallback(url, resource_type='detail', validators=validators)
+        if html is NOT_MODIFIED:
+            self.logger.debug(f"Sayfa değişmemiş, önceki kayıt kullanılıyor: {url}")
+            return record
+        if html is None:
+            return None
+        
+        details = self._parse_details(url, html)
+        if details and self.record_store and self.conditional_get:
+            self.record_store.set_record(url, self.site_name, details)
+        return details
+    
+    def _parse_details(self, url, html):
+        """
+        Detay sayfasını ayrıştırma havuzunda veya aynı süreçte ayrıştırır.
+        
+        Havuz kullanılamazsa sayfa aynı süreçte ayrıştırılır. Yapısal veri ve CSS
+        seçici yollarının kullanım sayıları ve süreleri istatistiklere eklenir.
+        
+        Args:
+            url (str): Telefonun detay sayfasının URL'si
+            html (str): Detay sayfasının HTML içeriği
+            
+        Returns:
+            dict: Telefonun özellikleri
+        """
+        started = time.perf_counter()
+        result = None
+        if self._parse_in_pool:
+            try:
+                result = self.parse_pool.parse(type(self), self.parse_settings(), url, html)
+                self._count_stat('parse', 'pool')
+            except Exception as e:
+                self.logger.warning(f"Sayfa havuzda ayrıştırılamadı, aynı süreçte ayrıştırılıyor: {str(e)}")
+                self._count_stat('parse', 'pool_errors')
+        
+        if result is None:
+            result = self._extract_details(url, html)
+            self._count_stat('parse', 'in_process')
+        
+        details, path, extract_ms = result
+        self._count_stat('parse', path)
+        self._count_stat('parse', f'{path}_ms', extract_ms)
+        self._count_stat('parse', 'time_ms', (time.perf_counter() - started) * 1000)
+        return details
+    
+    def _extract_details(self, url, html):
+        """
+        Detay sayfasından telefon bilgilerini çıkarır.
+        
+        Önce sayfadaki JSON-LD / gömülü durum DOM oluşturmadan çözülür; ürün adı,
+        fiyatı ve özellikleri bulunamazsa CSS seçicileriyle ayrıştırmaya geçilir.
+        
+        Args:
+            url (str): Telefonun detay sayfasının URL'si
+            html (str): Detay sayfasının HTML içeriği
+            
+        Returns:
+            tuple: (telefonun özellikleri, kullanılan yol: 'structured' veya 'selector', süre ms)
+        """
+        started = time.perf_counter()
+        if self.structured_data:
+            try:
+                details = self._details_from_structured(url, html)
+            except Exception as e:
+                self.logger.debug(f"Yapısal veri çözülemedi {url}: {str(e)}")
+                details = None
+            if details:
+                return details, 'structured', (time.perf_counter() - started) * 1000
+        
+        details = self._parse_phone_details(url, html)
+        return details, 'selector', (time.perf_counter() - started) * 1000
+    
+    def _details_from_structured(self, url, html):
+        """
+        Sayfadaki JSON-LD Product bloğundan veya gömülü durumdan telefon bilgilerini oluşturur.
+        
+        Args:
+            url (str): Telefonun detay sayfasının URL'si
+            html (str): Detay sayfasının HTML içeriği
+            
+        Returns:
+            dict: Telefonun özellikleri; ad, fiyat veya özellikler eksikse None
+        """
+        product = extract_product(html, self.embedded_state_names)
+        if not product or not product['specs']:
+            return None
+        
+        name = product['name']
+        image_url = product['image_url']
+        if image_url and not image_url.startswith('http'):
+            image_url = urljoin(self.base_url, image_url)
+        return {
+            "name": name,
+            "brand": product['brand'] or (name.split(" ")[0] if " " in name else name),
+            "price": product['price'],
+            "image_url": image_url,
+            "url": url,
+            "source": self.site_name,
+            "installment_count": 0,
+            "installment_amount": 0.0,
+            "specs": self._process_specs(product['specs'])
+        }
+    
+    def _process_specs(self, specs):
+        """
+        Sitenin özellik etiketlerini ortak özellik alanlarına dönüştürür.
+        
+        Args:
+            specs (dict): Etiket -> değer
+            
+        Returns:
+            dict: Düzenlenmiş özellikler
+        """
+        return dict(specs)
+    
+    @abstractmethod
+    def _parse_phone_details(self, url, html):
+        """
+        Detay sayfasının HTML içeriğinden telefon bilgilerini çıkarır.
+        
+        Args:
+            url (str): Telefonun detay sayfasının URL'si
+            html (str): Detay sayfasının HTML içeriği
+            
+        Returns:
+            dict: Telefonun özellikleri
+        """
+        pass
+    
+    def _listing_page_url(self, page):
+        """
+        Liste sayfasının URL'sini döndürür.
+        
+        Args:
+            page (int): Sayfa numarası (1'den başlar)
+            
+        Returns:
+            str: Sayfa URL'si
+        """
+        return f"{self.phones_url}?page={page}"
+    
+    def _get_total_pages(self, soup):
+        """
+        İlk liste sayfasından toplam sayfa sayısını çıkarır.
+        
+        Args:
+            soup: İlk liste sayfasının ayrıştırılmış belgesi
+            
+        Returns:
+            int: Toplam sayfa sayısı (bulunamazsa 1)
+        """
+        return 1
+    
+    def _extract_product_links(self, soup):
+        """
+        Liste sayfasındaki ürün kartlarından ürün bağlantılarını çıkarır.
+        
+        Args:
+            soup: Liste sayfasının ayrıştırılmış belgesi
+            
+        Returns:
+            list: {'url', 'text', 'price', 'badge', 'listing_source'} alanlarını içeren ürün bağlantıları
+        """
+        product_links = []
+        for item in soup.select(self.listing_item_selector):
+            link = item.select_one('a[href]')
+            if not link:
+                continue
+            href = link.get('href')
+            name_elem = item.select_one(self.listing_name_selector) if self.listing_name_selector else None
+            name = link.get('title') or (name_elem.text.strip() if name_elem else '') or link.text.strip()
+            price_elem = item.select_one(self.listing_price_selector) if self.listing_price_selector else None
+            badge_elem = item.select_one(self.listing_badge_selector) if self.listing_badge_selector else None
+            product_links.append({
+                'url': href if href.startswith('http') else urljoin(self.base_url, href),
+                'text': ' '.join(name.split()),
+                'price': ' '.join(price_elem.text.split()) if price_elem else '',
+                'badge': ' '.join(badge_elem.text.split()) if badge_elem else '',
+                'listing_source': LISTING_HTML
+            })
+        return product_links
+    
+    @staticmethod
+    def _card_fingerprint(product):
+        """
+        Liste kartının parmak izini üretir; URL, ad, fiyat veya rozet değişirse parmak izi değişir.
+        
+        Args:
+            product (dict): {'url', 'text', 'price', 'badge'} alanlarını içeren ürün bağlantısı
+            
+        Returns:
+            str: SHA-1 parmak izi
+        """
+        parts = [normalize_url(product['url'])] + [product.get(field) or '' for field in ('text', 'price', 'badge')]
+        return hashlib.sha1('\x1f'.join(parts).encode('utf-8')).hexdigest()
+    
+    def _stored_cards(self, product_links):
+        """
+        Ürünlerin saklanan kart parmak izlerini ve kayıtlarını liste kaynaklarına göre okur.
+        
+        Args:
+            product_links (list): Ürün bağlantıları
+            
+        Returns:
+            dict: URL -> (parmak izi, kayıt, kaydın güncellenme zamanı)
+        """
+        by_listing = {}
+        for product in product_links:
+            by_listing.setdefault(product.get('listing_source', LISTING_HTML), []).append(product['url'])
+        stored = {}
+        for listing, urls in by_listing.items():
+            stored.update(self.record_store.get_cards(urls, listing))
+        return stored
+    
+    def _crawl_listing_pages(self, headers=None, progress_callback=None, progress_start=0, progress_end=10,
+                             use_cache=True):
+        """
+        Kategorideki tüm liste sayfalarını tarar ve ürün bağlantılarını toplar.
+        
+        İlk sayfadan toplam sayfa sayısı bulunduktan sonra kalan sayfalar host başına
+        eşzamanlılık sınırı kadar gruplar halinde paralel çekilir. Yeni ürün
+        bağlantısı içermeyen bir sayfaya gelindiğinde tarama erken bitirilir.
+        
+        Args:
+            headers (dict, optional): İstek başlıkları
+            progress_callback (callable, optional): İlerleme bildirimi fonksiyonu
+            progress_start (int): Tarama başlangıcındaki ilerleme yüzdesi
+            progress_end (int): Tarama sonundaki ilerleme yüzdesi
+            use_cache (bool): False ise liste sayfaları önbellekten okunmaz
+            
+        Returns:
+            list: Tekrarsız ürün bağlantıları, ilk sayfa alınamazsa None
+        """
+        html = self._fetch_html_with_fallback(
+            self._listing_page_url(1), resource_type='listing', headers=headers, use_cache=use_cache
+        )
+        if html is None:
+            return None
+        
+        soup = self._parse_html(html, self.listing_parse_classes)
+        total_pages = self._get_total_pages(soup)
+        product_links = []
+        seen = set()
+        
+        def add_links(links):
+            added = 0
+            for link in links:
+                if link['url'] not in seen:
+                    seen.add(link['url'])
+                    product_links.append(link)
+                    added += 1
+            return added
+        
+        add_links(self._extract_product_links(soup))
+        self.logger.info(f"Liste sayfası 1/{total_pages}: {len(product_links)} ürün")
+        
+        page = 2
+        window = max(self.max_concurrency_per_host, 1)
+        while page <= total_pages:
+            if self.max_products and len(product_links) >= self.max_products:
+                self.logger.info(f"Azami ürün sayısına ulaşıldı ({self.max_products}), liste taraması durduruldu")
+                break
+            
+            pages = list(range(page, min(page + window, total_pages + 1)))
+            urls = [self._listing_page_url(number) for number in pages]
+            results = self.fetch_many_sync(urls, headers=headers, resource_type='listing', use_cache=use_cache)
+            
+            exhausted = False
+            for number, url in zip(pages, urls):
+                if results.get(url) is None:
+                    self._count_stat('listing', 'failed_pages')
+                    continue
+                added = add_links(self._extract_product_links(self._parse_html(results[url], self.listing_parse_classes)))
+                self.logger.debug(f"Liste sayfası {number}/{total_pages}: {added} yeni ürün")
+                if not added:
+                    # Sayfa yeni ürün getirmiyorsa katalog bitmiştir (ör. son sayfanın tekrarı)
+                    self.logger.info(f"Liste sayfası {number} yeni ürün içermiyor, tarama erken bitirildi")
+                    exhausted = True
+                    break
+            
+            page = pages[-1] + 1
+            if progress_callback:
+                progress = progress_start + int(min(page - 1, total_pages) / total_pages * (progress_end - progress_start))
+                progress_callback(progress, 100, message=f"{min(page - 1, total_pages)}/{total_pages} liste sayfası tarandı")
+            if exhausted:
+                break
+        
+        self._count_stat('listing', 'pages', min(page - 1, total_pages))
+        self._count_stat('listing', 'products', len(product_links))
+        self.logger.info(f"{min(page - 1, total_pages)} liste sayfasından {len(product_links)} ürün bağlantısı toplandı")
+        return product_links
+    
+    def _firecrawl_product_link(self, href):
+        """
+        Firecrawl'ın döndürdüğü bağlantının ürün sayfası olup olmadığını belirler.
+        
+        Args:
+            href (str): Sayfadaki bağlantı
+            
+        Returns:
+            dict: {'url': ..., 'text': ...}; ürün bağlantısı değilse None
+        """
+        return None
+    
+    def _listing_cards(self, soup):
+        """
+        Liste sayfasındaki ürün kartlarını normalleştirilmiş URL'ye göre döndürür.
+        
+        Returns:
+            dict: Normalleştirilmiş URL -> ürün kartı (kart seçicisi tanımlı değilse boş)
+        """
+        if not self.listing_item_selector:
+            return {}
+        return {normalize_url(card['url']): card for card in self._extract_product_links(soup)}
+    
+    @staticmethod
+    def _enrich_firecrawl_link(link, cards):
+        """
+        Firecrawl bağlantısını aynı sayfadaki ürün kartının ad, fiyat ve rozetiyle tamamlar.
+        
+        Böylece kart parmak izi fiyat ve rozet değişikliklerini yakalar ve kayıtta
+        liste sayfasındaki güncel fiyat kullanılır. Kartı bulunamayan bağlantılar
+        URL'den çıkarılan adla kalır.
+        
+        Args:
+            link (dict): {'url', 'text'} alanlarını içeren Firecrawl bağlantısı
+            cards (dict): Normalleştirilmiş URL -> ürün kartı
+            
+        Returns:
+            dict: Ürün bağlantısı
+        """
+        card = cards.get(normalize_url(link['url']))
+        if card:
+            link = dict(card, url=link['url'], text=card['text'] or link['text'])
+        return dict(link, listing_source=LISTING_FIRECRAWL)
+    
+    def _scrape_listing_page_firecrawl(self, page):
+        """
+        Liste sayfasını Firecrawl ile HTML ve bağlantılarıyla birlikte çeker.
+        
+        Args:
+            page (int): Sayfa numarası (1'den başlar)
+            
+        Returns:
+            dict: Firecrawl sonucu, sayfa alınamazsa None
+        """
+        result = self.firecrawl.scrape_url(
+            url=self._listing_page_url(page),
+            params={'formats': ['html', 'links']},
+            ttl=SCRAPER_CACHE_TTLS['listing']
+        )
+        if not result or 'links' not in result:
+            return None
+        return result
+    
+    def _crawl_listing_pages_firecrawl(self, progress_callback=None, progress_start=0, progress_end=10):
+        """
+        Kategorideki tüm liste sayfalarını Firecrawl ile tarar ve ürün bağlantılarını toplar.
+        
+        _crawl_listing_pages ile aynı düzeni izler: toplam sayfa sayısı ilk sayfanın
+        HTML'inden bulunur, kalan sayfalar host başına eşzamanlılık sınırı kadar
+        gruplar halinde paralel çekilir. Yeni ürün bağlantısı içermeyen bir sayfaya
+        gelindiğinde veya azami ürün sayısına ulaşıldığında tarama erken bitirilir.
+        
+        Args:
+            progress_callback (callable, optional): İlerleme bildirimi fonksiyonu
+            progress_start (int): Tarama başlangıcındaki ilerleme yüzdesi
+            progress_end (int): Tarama sonundaki ilerleme yüzdesi
+            
+        Returns:
+            list: Tekrarsız ürün bağlantıları, ilk sayfa alınamazsa None
+        """
+        first = self._scrape_listing_page_firecrawl(1)
+        if first is None:
+            return None
+        
+        product_links = []
+        seen = set()
+        total_pages = 1
+        
+        def add_links(scrape_result, first_page=False):
+            nonlocal total_pages
+            cards = {}
+            if scrape_result.get('html'):
+                soup = self._parse_html(scrape_result['html'], self.listing_parse_classes)
+                if first_page:
+                    total_pages = self._get_total_pages(soup)
+                cards = self._listing_cards(soup)
+            
+            added = 0
+            for href in scrape_result.get('links', []):
+                # Bağlantılar metin olarak gelir
+                link = self._firecrawl_product_link(href) if isinstance(href, str) else None
+                if link and link['url'] not in seen:
+                    seen.add(link['url'])
+                    product_links.append(self._enrich_firecrawl_link(link, cards))
+                    added += 1
+            return added
+        
+        def scrape_page(page):
+            try:
+                return self._scrape_listing_page_firecrawl(page)
+            except Exception as e:
+                self.logger.error(f"Firecrawl liste sayfası {page} çekilemedi: {str(e)}")
+                return None
+        
+        add_links(first, first_page=True)
+        self.logger.info(f"Firecrawl liste sayfası 1/{total_pages}: {len(product_links)} ürün")
+        
+        page = 2
+        window = max(self.max_concurrency_per_host, 1)
+        executor = ThreadPoolExecutor(max_workers=window, thread_name_prefix=f"{self.site_name}-liste")
+        try:
+            while page <= total_pages:
+                if self.max_products and len(product_links) >= self.max_products:
+                    self.logger.info(f"Azami ürün sayısına ulaşıldı ({self.max_products}), liste taraması durduruldu")
+                    break
+                
+                pages = list(range(page, min(page + window, total_pages + 1)))
+                results = list(executor.map(scrape_page, pages))
+                
+                exhausted = False
+                for number, scrape_result in zip(pages, results):
+                    if scrape_result is None:
+                        self._count_stat('listing', 'failed_pages')
+                        continue
+                    added = add_links(scrape_result)
+                    self.logger.debug(f"Firecrawl liste sayfası {number}/{total_pages}: {added} yeni ürün")
+                    if not added:
+                        # Sayfa yeni ürün getirmiyorsa katalog bitmiştir (ör. son sayfanın tekrarı)
+                        self.logger.info(f"Liste sayfası {number} yeni ürün içermiyor, tarama erken bitirildi")
+                        exhausted = True
+                        break
+                
+                page = pages[-1] + 1
+                if progress_callback:
+                    progress = progress_start + int(min(page - 1, total_pages) / total_pages * (progress_end - progress_start))
+                    progress_callback(progress, 100, message=f"{min(page - 1, total_pages)}/{total_pages} liste sayfası tarandı")
+                if exhausted:
+                    break
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+        
+        self._count_stat('listing', 'pages', min(page - 1, total_pages))
+        self._count_stat('listing', 'products', len(product_links))
+        self.logger.info(f"{min(page - 1, total_pages)} Firecrawl liste sayfasından {len(product_links)} ürün bağlantısı toplandı")
+        return product_links
+    
+    def _details_from_firecrawl(self, url, json_data):
+        """
+        Firecrawl'ın JSON çıktısını telefon detayı biçimine dönüştürür.
+        
+        Args:
+            url (str): Telefonun detay sayfasının URL'si
+            json_data (dict): Firecrawl 'json' alanı
+            
+        Returns:
+            dict: Telefonun özellikleri
+        """
+        name = json_data.get('name', '')
+        price_text = json_data.get('price', '0')
+        price = self._normalize_price(price_text) if isinstance(price_text, str) else price_text
+        
+        # Marka ve model
+        brand = json_data.get('brand', '')
+        if not brand and ' ' in name:
+            brand = name.split(" ")[0]
+        
+        # Özellikleri düzenle
+        processed_specs = {
+            "processor": json_data.get("processor", ""),
+            "ram_rom": f"{json_data.get('RAM', '')} + {json_data.get('storage', '')}",
+            "screen": json_data.get("screen_size", ""),
+            "battery_charging": json_data.get("battery", ""),
+            "front_camera": "",
+            "rear_cameras": json_data.get("camera_details", ""),
+            "additional_features": "",
+            "network_connectivity": ""
+        }
+        
+        return {
+            "name": name,
+            "brand": brand,
+            "price": price,
+            "url": url,
+            "source": self.site_name,
+            "specs": processed_specs
+        }
+    
+    def _iter_firecrawl_batch_details(self, urls):
+        """
+        Detay sayfalarını Firecrawl toplu tarama ile çeker ve tamamlananları hemen döndürür.
+        
+        Önbellekte geçerli sonucu olan sayfalar API'ye gönderilmez. Toplu taramadan
+        gelen sonuçlar tekil scrape_url çağrılarıyla aynı önbelleğe yazılır.
+        
+        Args:
+            urls (list): Detay sayfası URL'leri
+            
+        Yields:
+            tuple: (URL, telefon detayları)
+        """
+        pending = []
+        for url in urls:
+            cached, _ = self.firecrawl.get_cached(url, FIRECRAWL_DETAIL_PARAMS)
+            if cached and cached.get('json'):
+                self._count_stat('firecrawl_batch', 'cached')
+                yield url, self._details_from_firecrawl(url, cached['json'])
+            else:
+                pending.append(url)
+        
+        if not pending:
+            return
+        
+        self.logger.info(f"{len(pending)} detay sayfası Firecrawl toplu tarama ile çekiliyor")
+        for url, document in self.firecrawl_batch.iter_results(pending, FIRECRAWL_DETAIL_PARAMS):
+            if not document.get('json'):
+                self._count_stat('firecrawl_batch', 'empty')
+                continue
+            self.firecrawl.store(url, FIRECRAWL_DETAIL_PARAMS, document, 0)
+            self._count_stat('firecrawl_batch', 'fetched')
+            yield url, self._details_from_firecrawl(url, document['json'])
+    
+    def _iter_product_details(self, product_links, progress_callback=None, progress_start=10, progress_end=70):
+        """
+        Ürün detaylarını çeker ve her kaydı hazır olur olmaz döndürür.
+        
+        Firecrawl kullanılabiliyorsa detay sayfaları önce toplu taramaya gönderilir ve
+        sonuçlar geldikçe işlenir; toplu taramada alınamayan sayfalar sınırlı sayıda
+        iş parçacığıyla doğrudan HTML üzerinden çekilir. Kayıtlar tamamlanma
+        sırasıyla döner. Her tamamlanan ürün için ilerleme durumu progress_callback
+        ile bildirilir.
+        
+        Artımlı taramada liste kartı (URL, ad, fiyat, rozet) önceki çalıştırmadakiyle
+        aynı olan ve özellikleri SCRAPER_MAX_SPEC_AGE_HOURS'tan yeni olan ürünler
+        için detay sayfası çekilmez, saklanan kayıt kullanılır.
+        
+        Args:
+            product_links (list): {'url': ..., 'text': ...} biçiminde ürün bağlantıları
+            progress_callback (callable, optional): İlerleme bildirimi fonksiyonu
+            progress_start (int): Detay çekme başlangıcındaki ilerleme yüzdesi
+            progress_end (int): Detay çekme sonundaki ilerleme yüzdesi
+            
+        Yields:
+            dict: Telefon kaydı
+        """
+        # Aynı ürüne ait tekrarlanan bağlantıları ayıkla
+        seen = set()
+        product_links = [p for p in product_links if not (p['url'] in seen or seen.add(p['url']))]
+        if self.max_products:
+            product_links = product_links[:self.max_products]
+        total = len(product_links)
+        if not total:
+            return
+        
+        completed = 0
+        incremental = self.incremental and self.record_store is not None
+        fingerprints = {}
+        
+        def make_record(index, details, reused=False):
+            nonlocal completed
+            completed += 1
+            
+            # İlerleme durumunu güncelle
+            if progress_callback:
+                progress = progress_start + int(completed / total * (progress_end - progress_start))
+                progress_callback(progress, 100, message=f"{completed}/{total} ürün işlendi")
+            
+            if not details:
+                return None
+            product = product_links[index]
+            # Detay verisi önbellekten gelmiş olabilir; liste kartındaki fiyat daha yenidir
+            price = self._normalize_price(product.get('price')) or details.get('price', 0)
+            if price != details.get('price'):
+                details = dict(details, price=price)
+            if incremental and not reused:
+                self.record_store.set_card(
+                    product['url'], self.site_name, product.get('listing_source', LISTING_HTML),
+                    fingerprints[index], details
+                )
+            return {
+                "model": product['text'] or details.get('name', 'Bilinmeyen Model'),
+                "price": price,
+                "specs": details.get('specs', {}),
+                "source": self.site_name,
+                "source_url": product['url']
+            }
+        
+        pending = list(range(total))
+        if incremental:
+            # Kartı değişmeyen ve özellikleri yeterince yeni olan ürünlerin detay sayfası çekilmez
+            stored = self._stored_cards(product_links)
+            now = time.time()
+            pending = []
+            for index, product in enumerate(product_links):
+                fingerprints[index] = self._card_fingerprint(product)
+                card = stored.get(product['url'])
+                if card is None:
+                    reason = 'new'
+                elif card[0] != fingerprints[index]:
+                    reason = 'changed'
+                elif self.max_spec_age and now - card[2] > self.max_spec_age:
+                    reason = 'stale'
+                else:
+                    self._count_stat('incremental', 'reused')
+                    record = make_record(index, card[1], reused=True)
+                    if record:
+                        yield record
+                    continue
+                self._count_stat('incremental', reason)
+                pending.append(index)
+            self.logger.info(f"{total - len(pending)} ürün önceki kayıtlardan alındı, "
+                             f"{len(pending)} ürünün detay sayfası çekilecek")
+        
+        fetch_details = self.get_phone_details
+        if pending and getattr(self, 'firecrawl', None) is not None and self.firecrawl_batch is not None:
+            url_index = {normalize_url(product_links[index]['url']): index for index in pending}
+            done = set()
+            try:
+                for url, details in self._iter_firecrawl_batch_details([product_links[index]['url'] for index in pending]):
+                    index = url_index.get(normalize_url(url))
+                    if index is None or index in done:
+                        continue
+                    done.add(index)
+                    record = make_record(index, details)
+                    if record:
+                        yield record
+            except Exception as e:
+                self.logger.error(f"Firecrawl toplu tarama hatası: {str(e)}")
+            
+            pending = [index for index in pending if index not in done]
+            # Toplu taramada alınamayan sayfalar için Firecrawl'ı tekrar deneme, HTML'den çek
+            fetch_details = self._fetch_phone_details
+            if pending:
+                self.logger.info(f"Toplu taramada alınamayan {len(pending)} ürün HTML üzerinden çekilecek")
+        
+        if not pending:
+            return
+        
+        self.logger.info(f"{len(pending)} ürünün detayı {self.detail_workers} iş parçacığıyla çekiliyor")
+        # Küçük çalıştırmalarda süreç başlatma maliyetine girmeden aynı süreçte ayrıştır
+        self._parse_in_pool = self.parse_pool is not None and self.parse_pool.should_use(len(pending))
+        if self._parse_in_pool:
+            self.parse_pool.start()
+            self.logger.info(f"Detay sayfaları {self.parse_pool.workers} süreçte ayrıştırılacak")
+        executor = ThreadPoolExecutor(max_workers=self.detail_workers, thread_name_prefix=f"{self.site_name}-detay")
+        try:
+            futures = {
+                executor.submit(fetch_details, product_links[index]['url']): index
+                for index in pending
+            }
+            for future in as_completed(futures):
+                details = None
+                try:
+                    details = future.result()
+                except Exception as e:
+                    self.logger.error(f"Ürün detayı çekme hatası: {str(e)}")
+                record = make_record(futures[future], details)
+                if record:
+                    yield record
+        finally:
+            # Tüketici erken durursa henüz başlamamış istekler iptal edilir
+            executor.shutdown(wait=True, cancel_futures=True)
+            self._parse_in_pool = False
+    
+    def iter_prices(self, progress_callback=None):
+        """
+        Yalnızca liste sayfalarındaki fiyatları çeker; detay sayfası istenmez.
+        
+        Özellikler önceki tam taramada saklanan kayıtlardan alınır; daha önce
+        görülmemiş ürünler boş özelliklerle döner ve sonraki özellik taramasında
+        tamamlanır. Saklanan kayıtların fiyatları ve kart parmak izleri güncellenir.
+        
+        Args:
+            progress_callback (callable, optional): İlerleme bildirimi fonksiyonu
+            
+        Yields:
+            dict: Telefon kaydı
+        """
+        if progress_callback:
+            progress_callback(0, 100)
+        
+        # Fiyat taraması liste önbelleğinin süresinden sık çalışır; sayfalar her seferinde yeniden çekilir
+        product_links = self._crawl_listing_pages(progress_callback=progress_callback, progress_end=90, use_cache=False)
+        if product_links is None:
+            if progress_callback:
+                progress_callback(0, 100, error=f"{self.site_name} liste sayfası çekilemedi.")
+            return
+        if self.max_products:
+            product_links = product_links[:self.max_products]
+        
+        stored = self._stored_cards(product_links) if self.record_store else {}
+        updates = []
+        try:
+            for product in product_links:
+                price = self._normalize_price(product.get('price'))
+                if not price:
+                    self._count_stat('prices', 'missing_price')
+                    continue
+                
+                card = stored.get(product['url'])
+                details = dict(card[1], price=price) if card else {}
+                if card:
+                    updates.append((product['url'], self._card_fingerprint(product), details))
+                self._count_stat('prices', 'known' if card else 'new')
+                yield {
+                    "model": product['text'] or details.get('name', 'Bilinmeyen Model'),
+                    "price": price,
+                    "specs": details.get('specs', {}),
+                    "source": self.site_name,
+                    "source_url": product['url']
+                }
+        finally:
+            if updates and self.incremental:
+                self.record_store.update_prices(self.site_name, LISTING_HTML, updates)
+        
+        if progress_callback:
+            progress_callback(100, 100, message="Fiyat taraması tamamlandı")
+    
+    @abstractmethod
+    def iter_phones(self, progress_callback=None):
+        """
+        Sitedeki telefonları çeker ve her kaydı ayrıştırılır ayrıştırılmaz döndürür.
+        
+        Args:
+            progress_callback (callable, optional): İlerleme bildirimi fonksiyonu
+            
+        Yields:
+            dict: Telefon kaydı
+        """
+        pass
+    
+    async def aiter_phones(self, progress_callback=None):
+        """
+        iter_phones metodunun asenkron karşılığı.
+        
+        Kayıtlar iş parçacığında üretilir, olay döngüsü engellenmez.
+        
+        Yields:
+            dict: Telefon kaydı
+        """
+        iterator = self.iter_phones(progress_callback)
+        done = object()
+        try:
+            while True:
+                phone = await asyncio.to_thread(next, iterator, done)
+                if phone is done:
+                    break
+                yield phone
+        finally:
+            iterator.close()
+    
+    def scrape_all_phones(self, progress_callback=None):
+        """
+        Sitedeki tüm telefonları çeker.
+        
+        Args:
+            progress_callback (callable, optional): İlerleme bildirimi fonksiyonu
+            
+        Returns:
+            list: Telefon kayıtları
+        """
+        return list(self.iter_phones(progress_callback))
+    
+    def get_stats(self):
+        """
+        Scraper'ın performans istatistiklerini döndürür.
+        
+        Returns:
+            dict: Bölüm adı -> istatistikler
+        """
+        with self._stats_lock:
+            stats = {section: dict(counters) for section, counters in self._counters.items()}
+        if self.response_cache:
+            stats['cache'] = self.response_cache.stats(urlparse(self.base_url).netloc)
+        if self.rate_limiter:
+            stats['rate_limit'] = self.rate_limiter.stats(urlparse(self.base_url).netloc)
+        if self.circuit_breaker_enabled:
+            stats['circuit_breaker'] = get_circuit_breaker(urlparse(self.base_url).netloc).stats()
+        stats['http'] = self.http_client.stats(urlparse(self.base_url).netloc)
+        parse = stats.get('parse')
+        if parse:
+            # Yol başına ortalama süre ve yapısal yolun CSS seçici yoluna göre hızı
+            for path in ('structured', 'selector'):
+                if parse.get(path):
+                    parse[f'{path}_avg_ms'] = round(parse[f'{path}_ms'] / parse[path], 2)
+            if parse.get('structured_avg_ms') and parse.get('selector_avg_ms'):
+                parse['structured_speedup'] = round(parse['selector_avg_ms'] / parse['structured_avg_ms'], 1)
+        firecrawl = getattr(self, 'firecrawl', None)
+        if firecrawl is not None and hasattr(firecrawl, 'stats'):
+            stats['firecrawl'] = firecrawl.stats()
+        return stats
+    
+    def reset_stats(self):
+        """Yeni bir çalıştırma için istatistik sayaçlarını sıfırlar"""
+        with self._stats_lock:
+            self._counters = {}
+        if self.response_cache:
+            self.response_cache.reset_stats(urlparse(self.base_url).netloc)
+        if self.rate_limiter:
+            self.rate_limiter.reset_stats(urlparse(self.base_url).netloc)
+        if self.circuit_breaker_enabled:
+            get_circuit_breaker(urlparse(self.base_url).netloc).reset_stats()
+        firecrawl = getattr(self, 'firecrawl', None)
+        if firecrawl is not None and hasattr(firecrawl, 'reset_stats'):
+            firecrawl.reset_stats()
+    
     def _normalize_price(self, price_text):
         """
         Fiyat metinlerini normalleştirir ve sayısal değere dönüştürür.
@@ -0,0 +1,160 @@
+import logging
+import os
+import sys
+import time
+
+# Ana dizini ekle
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from src.config import (
+    FIRECRAWL_API_URL, FIRECRAWL_BATCH_SIZE, FIRECRAWL_BATCH_POLL_INTERVAL, FIRECRAWL_BATCH_TIMEOUT
+)
+from src.scrapers.response_cache import normalize_url
+from src.scrapers.http_client import get_http_client
+
+logger = logging.getLogger(__name__)
+
+
+class FirecrawlBatchClient:
+    """
+    Firecrawl toplu tarama (batch scrape) API'si için istemci.
+
+    URL'ler gruplar halinde iş olarak gönderilir, tüm işler birlikte sorgulanır ve
+    tamamlanan sayfalar beklenmeden sırayla döndürülür. api_url ayarı ile yerel
+    bir sahte (mock) Firecrawl sunucusuna (src/scrapers/mock_firecrawl.py) yönlendirilebilir.
+    """
+
+    def __init__(self, api_key, api_url=None, batch_size=None, poll_interval=None, timeout=None):
+        """
+        Args:
+            api_key (str): Firecrawl API anahtarı
+            api_url (str, optional): API kök adresi (varsayılan: FIRECRAWL_API_URL)
+            batch_size (int, optional): Bir işte gönderilecek azami URL sayısı
+            poll_interval (float, optional): İş durumu sorguları arasındaki süre (saniye)
+            timeout (float, optional): Tüm işler için azami bekleme süresi (saniye)
+        """
+        self.api_url = (api_url or FIRECRAWL_API_URL).rstrip('/')
+        self.batch_size = batch_size or FIRECRAWL_BATCH_SIZE
+        self.poll_interval = poll_interval or FIRECRAWL_BATCH_POLL_INTERVAL
+        self.timeout = timeout or FIRECRAWL_BATCH_TIMEOUT
+        # İşler uzun süre sorgulandığından API bağlantısı paylaşılan havuzdan kullanılır
+        self.session = get_http_client().session
+        self.headers = {
+            'Authorization': f'Bearer {api_key}',
+            'Content-Type': 'application/json'
+        }
+
+    def submit(self, urls, params=None):
+        """
+        URL'leri toplu tarama işi olarak gönderir.
+
+        Args:
+            urls (list): Taranacak URL'ler
+            params (dict, optional): Firecrawl parametreleri (formats, jsonOptions vb.)
+
+        Returns:
+            str: İş kimliği
+        """
+        payload = dict(params or {})
+        payload['urls'] = list(urls)
+        response = self.session.post(f"{self.api_url}/v1/batch/scrape", json=payload, headers=self.headers, timeout=30)
+        response.raise_for_status()
+        result = response.json()
+        if not result.get('success') or not result.get('id'):
+            raise RuntimeError(f"Firecrawl toplu tarama işi oluşturulamadı: {result}")
+        return result['id']
+
+    def get_status(self, job_id):
+        """
+        İşin durumunu ve şu ana kadar tamamlanan sayfaları döndürür.
+
+        Sonuçlar sayfalı geliyorsa 'next' bağlantıları izlenerek birleştirilir.
+
+        Args:
+            job_id (str): İş kimliği
+
+        Returns:
+            dict: status, total, completed ve data alanlarını içeren durum
+        """
+        response = self.session.get(f"{self.api_url}/v1/batch/scrape/{job_id}", headers=self.headers, timeout=30)
+        response.raise_for_status()
+        status = response.json()
+        data = list(status.get('data') or [])
+
+        next_url = status.get('next')
+        while next_url:
+            response = self.session.get(next_url, headers=self.headers, timeout=30)
+            response.raise_for_status()
+            page = response.json()
+            data.extend(page.get('data') or [])
+            next_url = page.get('next')
+
+        status['data'] = data
+        return status
+
+    @staticmethod
+    def _source_url(document):
+        metadata = document.get('metadata') or {}
+        return metadata.get('sourceURL') or metadata.get('url') or document.get('url')
+
+    def iter_results(self, urls, params=None):
+        """
+        URL'leri toplu olarak tarar ve tamamlanan her sayfayı hemen döndürür.
+
+        Tüm gruplar önce gönderilir, ardından işler birlikte sorgulanır; böylece
+        bir grubun bitmesi diğerlerini bekletmez.
+
+        Args:
+            urls (list): Taranacak URL'ler
+            params (dict, optional): Firecrawl parametreleri
+
+        Yields:
+            tuple: (URL, Firecrawl belgesi)
+        """
+        urls = list(dict.fromkeys(urls))
+        if not urls:
+            return
+
+        jobs = {}
+        for start in range(0, len(urls), self.batch_size):
+            chunk = urls[start:start + self.batch_size]
+            try:
+                job_id = self.submit(chunk, params)
+                jobs[job_id] = set()
+                logger.info(f"Firecrawl toplu tarama işi gönderildi: {job_id} ({len(chunk)} URL)")
+            except Exception as e:
+                logger.error(f"Firecrawl toplu tarama işi gönderilemedi: {str(e)}")
+
+        requested = {normalize_url(url): url for url in urls}
+        deadline = time.monotonic() + self.timeout
+        while jobs:
+            for job_id in list(jobs):
+                try:
+                    status = self.get_status(job_id)
+                except Exception as e:
+                    logger.error(f"Firecrawl iş durumu alınamadı {job_id}: {str(e)}")
+                    continue
+
+                seen = jobs[job_id]
+                for document in status.get('data', []):
+                    source_url = self._source_url(document)
+                    if not source_url:
+                        continue
+                    key = normalize_url(source_url)
+                    if key in seen:
+                        continue
+                    seen.add(key)
+                    yield requested.get(key, source_url), document
+
+                if status.get('status') in ('completed', 'failed', 'cancelled'):
+                    logger.info(f"Firecrawl toplu tarama işi bitti: {job_id} ({status.get('status')}, "
+                                f"{len(seen)}/{status.get('total', '?')} sayfa)")
+                    del jobs[job_id]
+
+            if not jobs:
+                break
+            if time.monotonic() >= deadline:
+                logger.warning(f"Firecrawl toplu tarama {self.timeout} saniye içinde bitmedi, "
+                               f"{len(jobs)} iş bekleniyor")
+                break
+            time.sleep(self.poll_interval)
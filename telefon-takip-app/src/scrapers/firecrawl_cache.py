@@ -0,0 +1,194 @@
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import sys
+import threading
+import time
+from concurrent.futures import Future
+
+# Ana dizini ekle
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from src.config import SCRAPER_CACHE_DIR, FIRECRAWL_CACHE_TTL, FIRECRAWL_CACHE_ENABLED
+from src.scrapers.response_cache import normalize_url
+
+logger = logging.getLogger(__name__)
+
+# Aynı anahtar için süren Firecrawl çağrıları (süreç genelinde paylaşılır)
+_inflight = {}
+_inflight_lock = threading.Lock()
+
+_db_lock = threading.Lock()
+_db_conn = None
+
+
+def _get_connection():
+    """Firecrawl önbellek veritabanı bağlantısını döndürür (kilit altında çağrılmalıdır)"""
+    global _db_conn
+    if _db_conn is None:
+        os.makedirs(SCRAPER_CACHE_DIR, exist_ok=True)
+        _db_conn = sqlite3.connect(os.path.join(SCRAPER_CACHE_DIR, 'firecrawl.db'), check_same_thread=False)
+        _db_conn.execute('PRAGMA journal_mode=WAL')
+        _db_conn.execute('''
+        CREATE TABLE IF NOT EXISTS firecrawl_results (
+            key TEXT PRIMARY KEY,
+            url TEXT,
+            result TEXT,
+            latency REAL,
+            stored_at REAL
+        )
+        ''')
+        _db_conn.commit()
+    return _db_conn
+
+
+def make_cache_key(url, params=None):
+    """
+    URL ve istek parametrelerinden önbellek anahtarı üretir.
+
+    Args:
+        url (str): Taranan URL
+        params (dict, optional): Firecrawl parametreleri (formats, jsonOptions vb.)
+
+    Returns:
+        str: Önbellek anahtarı
+    """
+    payload = normalize_url(url) + '|' + json.dumps(params or {}, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class CachedFirecrawlApp:
+    """
+    FirecrawlApp için önbellekli sarmalayıcı.
+
+    scrape_url sonuçları URL ve parametrelere göre diskte saklanır ve süreleri
+    dolana kadar yeniden kullanılır. Aynı anda aynı sayfa için yapılan istekler
+    tek bir API çağrısını paylaşır.
+    """
+
+    def __init__(self, client, ttl=None, enabled=None):
+        """
+        Args:
+            client (FirecrawlApp): Asıl Firecrawl istemcisi
+            ttl (int, optional): Saniye cinsinden varsayılan geçerlilik süresi
+            enabled (bool, optional): Disk önbelleğini kullan (varsayılan: FIRECRAWL_CACHE_ENABLED).
+                Kapalıyken de eşzamanlı aynı istekler tek çağrıyı paylaşır.
+        """
+        self.client = client
+        self.ttl = ttl or FIRECRAWL_CACHE_TTL
+        self.enabled = FIRECRAWL_CACHE_ENABLED if enabled is None else enabled
+        self._stats_lock = threading.Lock()
+        self.reset_stats()
+
+    def __getattr__(self, name):
+        # Önbelleklenmeyen metotlar doğrudan asıl istemciye yönlendirilir
+        return getattr(self.client, name)
+
+    def _count(self, field, amount=1):
+        with self._stats_lock:
+            self._stats[field] += amount
+
+    def reset_stats(self):
+        """Çalıştırma istatistiklerini sıfırlar"""
+        with self._stats_lock:
+            self._stats = {'hits': 0, 'misses': 0, 'shared': 0, 'latency_saved': 0.0, 'api_time': 0.0}
+
+    def stats(self):
+        """
+        Önbellek istatistiklerini döndürür.
+
+        Returns:
+            dict: hits, misses, shared, hit_rate, latency_saved (sn), api_time (sn)
+        """
+        with self._stats_lock:
+            stats = dict(self._stats)
+        lookups = stats['hits'] + stats['misses'] + stats['shared']
+        stats['hit_rate'] = round((stats['hits'] + stats['shared']) / lookups, 3) if lookups else 0.0
+        stats['latency_saved'] = round(stats['latency_saved'], 2)
+        stats['api_time'] = round(stats['api_time'], 2)
+        return stats
+
+    def get_cached(self, url, params=None, ttl=None):
+        """
+        Önbellekteki geçerli sonucu döndürür.
+
+        Returns:
+            tuple: (sonuç, API gecikmesi) veya (None, 0)
+        """
+        if not self.enabled:
+            return None, 0
+        key = make_cache_key(url, params)
+        with _db_lock:
+            row = _get_connection().execute(
+                'SELECT result, latency, stored_at FROM firecrawl_results WHERE key = ?', (key,)
+            ).fetchone()
+        if row is None or time.time() - row[2] > (ttl or self.ttl):
+            return None, 0
+        return json.loads(row[0]), row[1]
+
+    def store(self, url, params, result, latency):
+        """Firecrawl sonucunu önbelleğe yazar"""
+        if not self.enabled:
+            return
+        try:
+            body = json.dumps(result, ensure_ascii=False)
+        except (TypeError, ValueError) as e:
+            logger.debug(f"Firecrawl sonucu önbelleğe yazılamadı {url}: {e}")
+            return
+        with _db_lock:
+            conn = _get_connection()
+            conn.execute('''
+            INSERT OR REPLACE INTO firecrawl_results (key, url, result, latency, stored_at)
+            VALUES (?, ?, ?, ?, ?)
+            ''', (make_cache_key(url, params), url, body, latency, time.time()))
+            conn.commit()
+
+    def scrape_url(self, url, params=None, ttl=None):
+        """
+        Sayfayı Firecrawl ile tarar; geçerli önbellek kaydı varsa API çağrılmaz.
+
+        Args:
+            url (str): Taranacak URL
+            params (dict, optional): Firecrawl parametreleri
+            ttl (int, optional): Bu çağrı için geçerlilik süresi (saniye)
+
+        Returns:
+            dict: Firecrawl sonucu
+        """
+        result, latency = self.get_cached(url, params, ttl)
+        if result is not None:
+            self._count('hits')
+            self._count('latency_saved', latency)
+            return result
+
+        key = make_cache_key(url, params)
+        with _inflight_lock:
+            future = _inflight.get(key)
+            owner = future is None
+            if owner:
+                future = Future()
+                _inflight[key] = future
+
+        if not owner:
+            # Aynı sayfa için süren çağrının sonucunu bekle; ayrı bir API çağrısı yapılmaz
+            self._count('shared')
+            return future.result()
+
+        self._count('misses')
+        try:
+            started = time.monotonic()
+            result = self.client.scrape_url(url=url, params=params)
+            latency = time.monotonic() - started
+            self._count('api_time', latency)
+            if result:
+                self.store(url, params, result, latency)
+            future.set_result(result)
+            return result
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with _inflight_lock:
+                _inflight.pop(key, None)
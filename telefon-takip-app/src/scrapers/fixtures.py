@@ -0,0 +1,257 @@
+import gzip
+import hashlib
+import json
+import logging
+import os
+import sys
+import threading
+from datetime import datetime
+from urllib.parse import urlparse
+
+import requests
+
+# Ana dizini ekle
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from src.scrapers.response_cache import normalize_url
+
+logger = logging.getLogger(__name__)
+
+# Arşiv biçimi değiştiğinde artırılır; farklı sürümdeki arşivler okunmaz
+FIXTURE_FORMAT_VERSION = 1
+
+# Kaydedilen yanıt başlıkları (diğerleri yeniden oynatmada anlamsızdır)
+RECORDED_HEADERS = ('content-type', 'etag', 'last-modified', 'cache-control', 'retry-after', 'location')
+
+
+def fixture_key(method, url, body=None):
+    """
+    İsteği arşivde tanımlayan anahtarı üretir.
+
+    Args:
+        method (str): HTTP metodu
+        url (str): İstek URL'si
+        body (bytes/str, optional): İstek gövdesi (POST istekleri için)
+
+    Returns:
+        str: SHA-1 anahtarı
+    """
+    digest = hashlib.sha1(f"{method.upper()} {normalize_url(url)}".encode('utf-8'))
+    if body:
+        digest.update(b'\n')
+        digest.update(body if isinstance(body, bytes) else body.encode('utf-8'))
+    return digest.hexdigest()
+
+
+class FixtureArchive:
+    """
+    Kaydedilmiş HTTP yanıtlarından oluşan sürümlü arşiv.
+
+    Arşiv bir dizindir: manifest.json istekleri ve yanıt bilgilerini, bodies/
+    dizini gzip ile sıkıştırılmış yanıt gövdelerini içerir.
+    """
+
+    def __init__(self, path):
+        """
+        Args:
+            path (str): Arşiv dizini
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self.entries = {}
+        self.created_at = None
+        self._bodies = {}
+
+    @property
+    def manifest_path(self):
+        return os.path.join(self.path, 'manifest.json')
+
+    def load(self):
+        """
+        Arşivi diskten okur.
+
+        Returns:
+            FixtureArchive: Arşivin kendisi
+
+        Raises:
+            ValueError: Arşiv sürümü desteklenmiyorsa
+        """
+        with open(self.manifest_path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+        if manifest.get('version') != FIXTURE_FORMAT_VERSION:
+            raise ValueError(f"Desteklenmeyen arşiv sürümü: {manifest.get('version')} "
+                             f"(beklenen: {FIXTURE_FORMAT_VERSION})")
+        self.created_at = manifest.get('created_at')
+        self.entries = {entry['key']: entry for entry in manifest.get('entries', [])}
+        return self
+
+    def add(self, method, url, body, status, headers, content):
+        """
+        Yanıtı arşive ekler (aynı istek varsa üzerine yazar).
+
+        Args:
+            method (str): HTTP metodu
+            url (str): İstek URL'si
+            body (bytes/str): İstek gövdesi
+            status (int): Yanıt durum kodu
+            headers (dict): Yanıt başlıkları
+            content (bytes): Yanıt gövdesi
+        """
+        key = fixture_key(method, url, body)
+        entry = {
+            'key': key,
+            'method': method.upper(),
+            'url': url,
+            'host': urlparse(url).netloc.lower(),
+            'status': status,
+            'headers': {name: value for name, value in headers.items() if name.lower() in RECORDED_HEADERS},
+            'size': len(content),
+            'recorded_at': datetime.now().isoformat()
+        }
+        with self._lock:
+            self.entries[key] = entry
+            self._bodies[key] = content
+
+    def get(self, method, url, body=None):
+        """
+        İsteğe ait kaydı döndürür.
+
+        Returns:
+            tuple: (kayıt bilgileri, yanıt gövdesi) veya kayıt yoksa (None, None)
+        """
+        key = fixture_key(method, url, body)
+        entry = self.entries.get(key)
+        if entry is None:
+            return None, None
+        with self._lock:
+            content = self._bodies.get(key)
+        if content is None:
+            with gzip.open(os.path.join(self.path, 'bodies', f"{key}.gz"), 'rb') as f:
+                content = f.read()
+            with self._lock:
+                self._bodies[key] = content
+        return entry, content
+
+    def hosts(self):
+        """Arşivdeki hostları ve kayıt sayılarını döndürür"""
+        counts = {}
+        for entry in self.entries.values():
+            counts[entry['host']] = counts.get(entry['host'], 0) + 1
+        return counts
+
+    def save(self):
+        """Arşivi diske yazar"""
+        os.makedirs(os.path.join(self.path, 'bodies'), exist_ok=True)
+        with self._lock:
+            bodies = dict(self._bodies)
+            entries = sorted(self.entries.values(), key=lambda entry: (entry['host'], entry['url']))
+        for key, content in bodies.items():
+            with gzip.open(os.path.join(self.path, 'bodies', f"{key}.gz"), 'wb') as f:
+                f.write(content)
+        manifest = {
+            'version': FIXTURE_FORMAT_VERSION,
+            'created_at': self.created_at or datetime.now().isoformat(),
+            'entries': entries
+        }
+        with open(self.manifest_path, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=2)
+        logger.info(f"{len(entries)} kayıt arşive yazıldı: {self.path}")
+
+
+def replay_url(base_url, url):
+    """
+    Gerçek URL'yi yeniden oynatma sunucusundaki karşılığına çevirir.
+
+    Örnek: https://www.teknosa.com/x?page=2 -> {base_url}/https/www.teknosa.com/x?page=2
+    """
+    parsed = urlparse(url)
+    rewritten = f"{base_url.rstrip('/')}/{parsed.scheme}/{parsed.netloc}{parsed.path or '/'}"
+    return f"{rewritten}?{parsed.query}" if parsed.query else rewritten
+
+
+def original_url(path):
+    """
+    Yeniden oynatma sunucusuna gelen yolu gerçek URL'ye çevirir (replay_url'nin tersi).
+
+    Returns:
+        str: Gerçek URL, yol geçerli değilse None
+    """
+    parts = path.lstrip('/').split('/', 2)
+    if len(parts) < 2 or parts[0] not in ('http', 'https'):
+        return None
+    return f"{parts[0]}://{parts[1]}/{parts[2] if len(parts) > 2 else ''}"
+
+
+_original_send = None
+_send_lock = threading.Lock()
+
+
+def _install_send(wrapper):
+    """requests.Session.send'i sarmalayıcı ile değiştirir (oturum ve SDK istekleri dahil)"""
+    global _original_send
+    with _send_lock:
+        if _original_send is not None:
+            raise RuntimeError("Kayıt veya yeniden oynatma modu zaten etkin")
+        _original_send = requests.Session.send
+        original = _original_send
+
+        def send(session, request, **kwargs):
+            return wrapper(original, session, request, **kwargs)
+
+        requests.Session.send = send
+
+
+def uninstall():
+    """Kayıt veya yeniden oynatma modunu kapatır"""
+    global _original_send
+    with _send_lock:
+        if _original_send is not None:
+            requests.Session.send = _original_send
+            _original_send = None
+
+
+def install_recorder(archive):
+    """
+    Süreçteki tüm requests yanıtlarını arşive kaydetmeye başlar.
+
+    Firecrawl SDK'sının kendi açtığı oturumlar da dahil olmak üzere tüm istekler kaydedilir.
+
+    Args:
+        archive (FixtureArchive): Yanıtların ekleneceği arşiv
+    """
+    def record(send, session, request, **kwargs):
+        response = send(session, request, **kwargs)
+        try:
+            archive.add(request.method, request.url, request.body, response.status_code,
+                        response.headers, response.content)
+        except Exception as e:
+            logger.warning(f"Yanıt kaydedilemedi {request.url}: {str(e)}")
+        return response
+
+    _install_send(record)
+    logger.info(f"HTTP yanıtları kaydediliyor: {archive.path}")
+
+
+def install_replay(base_url):
+    """
+    Süreçteki tüm requests isteklerini yeniden oynatma sunucusuna yönlendirir.
+
+    Yanıtın url alanı gerçek URL olarak bırakılır; scraper'lar farkı görmez.
+
+    Args:
+        base_url (str): Yeniden oynatma sunucusunun adresi
+    """
+    base_url = base_url.rstrip('/')
+
+    def replay(send, session, request, **kwargs):
+        url = request.url
+        if url.startswith(base_url):
+            return send(session, request, **kwargs)
+        request.url = replay_url(base_url, url)
+        response = send(session, request, **kwargs)
+        request.url = url
+        response.url = url
+        return response
+
+    _install_send(replay)
+    logger.info(f"HTTP istekleri yeniden oynatma sunucusuna yönlendiriliyor: {base_url}")
@@ -0,0 +1,153 @@
+import logging
+import os
+import sys
+
+from bs4 import BeautifulSoup, SoupStrainer
+
+# Ana dizini ekle
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from src.config import HTML_PARSER_BACKEND
+
+logger = logging.getLogger(__name__)
+
+# lxml ve selectolax isteğe bağlıdır; yüklü değilse html.parser kullanılır
+try:
+    import lxml  # noqa: F401
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+try:
+    from selectolax.lexbor import LexborHTMLParser as HTMLParser
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    try:
+        # Eski selectolax sürümleri (Modest motoru)
+        from selectolax.parser import HTMLParser
+        SELECTOLAX_AVAILABLE = True
+    except ImportError:
+        SELECTOLAX_AVAILABLE = False
+
+BACKENDS = ('html.parser', 'lxml', 'selectolax')
+
+_warned_backends = set()
+
+
+def available_backends():
+    """
+    Bu ortamda kullanılabilen ayrıştırıcıları döndürür.
+
+    Returns:
+        list: Ayrıştırıcı adları
+    """
+    backends = ['html.parser']
+    if LXML_AVAILABLE:
+        backends.append('lxml')
+    if SELECTOLAX_AVAILABLE:
+        backends.append('selectolax')
+    return backends
+
+
+def resolve_backend(backend=None):
+    """
+    İstenen ayrıştırıcıyı, yüklü değilse html.parser'ı döndürür.
+
+    Args:
+        backend (str, optional): 'html.parser', 'lxml' veya 'selectolax' (varsayılan: HTML_PARSER_BACKEND)
+
+    Returns:
+        str: Kullanılacak ayrıştırıcı adı
+    """
+    backend = backend or HTML_PARSER_BACKEND
+    if backend not in BACKENDS:
+        raise ValueError(f"Bilinmeyen HTML ayrıştırıcı: {backend} (seçenekler: {', '.join(BACKENDS)})")
+    if backend in available_backends():
+        return backend
+    if backend not in _warned_backends:
+        _warned_backends.add(backend)
+        logger.warning(f"{backend} ayrıştırıcısı yüklü değil, html.parser kullanılıyor")
+    return 'html.parser'
+
+
+class SelectolaxNode:
+    """
+    selectolax düğümlerini scraper'ların kullandığı BeautifulSoup arayüzüyle sunar.
+
+    Yalnızca scraper'ların çağırdığı işlemler desteklenir: select, select_one,
+    find, find_all, text, get_text, get ve öznitelik erişimi.
+    """
+
+    __slots__ = ('_node',)
+
+    def __init__(self, node):
+        self._node = node
+
+    @staticmethod
+    def _selector(name=None, class_=None):
+        selector = name or '*'
+        if class_:
+            selector += ''.join(f'.{cls}' for cls in class_.split())
+        return selector
+
+    def select(self, selector):
+        return [SelectolaxNode(node) for node in self._node.css(selector)]
+
+    def select_one(self, selector):
+        node = self._node.css_first(selector)
+        return SelectolaxNode(node) if node is not None else None
+
+    def find(self, name=None, class_=None):
+        return self.select_one(self._selector(name, class_))
+
+    def find_all(self, name=None, class_=None):
+        return self.select(self._selector(name, class_))
+
+    @property
+    def text(self):
+        return self._node.text(deep=True) or ''
+
+    def get_text(self, separator='', strip=False):
+        return self._node.text(deep=True, separator=separator, strip=strip) or ''
+
+    @property
+    def attrs(self):
+        return dict(getattr(self._node, 'attributes', None) or {})
+
+    def get(self, name, default=None):
+        value = self.attrs.get(name)
+        return default if value is None else value
+
+    def has_attr(self, name):
+        return name in self.attrs
+
+    def __getitem__(self, name):
+        return self.attrs[name]
+
+
+def parse_html(html, backend=None, parse_only=None):
+    """
+    HTML içeriğini seçilen ayrıştırıcıyla ayrıştırır.
+
+    Dönen nesne her ayrıştırıcı için aynı seçici arayüzünü (select, select_one,
+    find, find_all, text, get) sunar.
+
+    parse_only verilirse html.parser ve lxml yalnızca bu sınıflara sahip öğeleri
+    ve alt ağaçlarını oluşturur; üst ağaçlar (başlık, altbilgi, betikler) atlanır.
+    Seçiciler bu öğelerden başlamalıdır. selectolax tüm sayfayı zaten düşük
+    maliyetle ayrıştırdığından parse_only'yi yok sayar.
+
+    Args:
+        html (str/bytes): HTML içeriği
+        backend (str, optional): Ayrıştırıcı adı (varsayılan: HTML_PARSER_BACKEND)
+        parse_only (list, optional): Tutulacak CSS sınıfları
+
+    Returns:
+        BeautifulSoup veya SelectolaxNode: Ayrıştırılmış belge
+    """
+    backend = resolve_backend(backend)
+    if backend == 'selectolax':
+        return SelectolaxNode(HTMLParser(html))
+    if parse_only:
+        return BeautifulSoup(html, backend, parse_only=SoupStrainer(class_=list(parse_only)))
+    return BeautifulSoup(html, backend)
@@ -0,0 +1,395 @@
+import atexit
+import logging
+import os
+import socket
+import sys
+import threading
+import time
+from http.client import HTTPMessage
+from http.cookiejar import CookieJar, DefaultCookiePolicy
+
+import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests.cookies import extract_cookies_to_jar
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.exceptions import ConnectTimeoutError, NewConnectionError
+
+# HTTP/2 isteğe bağlıdır; httpx ve h2 yüklü değilse HTTP/1.1 kullanılır
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+try:
+    import h2  # noqa: F401
+    H2_AVAILABLE = True
+except ImportError:
+    H2_AVAILABLE = False
+
+# Ana dizini ekle
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from src.config import (
+    HTTP_POOL_CONNECTIONS, HTTP_POOL_MAXSIZE, HTTP_DNS_CACHE_TTL, HTTP2_ENABLED, HTTP2_HOSTS,
+    SCRAPER_RECORD_FIXTURES, SCRAPER_REPLAY_URL
+)
+from src.scrapers.fixtures import FixtureArchive, install_recorder, install_replay
+
+logger = logging.getLogger(__name__)
+
+
+class DNSCache:
+    """
+    Host adlarının çözümlenmiş adreslerini belirli bir süre saklayan önbellek.
+
+    Yalnızca CachedDNSAdapter'ın açtığı bağlantılarda kullanılır; socket.getaddrinfo
+    değiştirilmez, süreçteki diğer kütüphaneler (Supabase, Firecrawl, Selenium)
+    etkilenmez. Sorgu hataları önbelleğe alınmaz.
+    """
+
+    def __init__(self, ttl):
+        """
+        Args:
+            ttl (float): Sonuçların geçerlilik süresi (saniye)
+        """
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._entries = {}
+        self._stats = {'hits': 0, 'misses': 0}
+
+    def resolve(self, host, port):
+        """
+        Host'un adreslerini döndürür.
+
+        Returns:
+            list: IP adresleri (getaddrinfo sırasıyla)
+
+        Raises:
+            socket.gaierror: Host çözümlenemezse
+        """
+        key = (host, port)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > now:
+                self._stats['hits'] += 1
+                return entry[1]
+            self._stats['misses'] += 1
+
+        addresses = list(dict.fromkeys(
+            info[4][0] for info in socket.getaddrinfo(host, port, 0, socket.SOCK_STREAM)
+        ))
+        with self._lock:
+            self._entries[key] = (now + self.ttl, addresses)
+        return addresses
+
+    def stats(self):
+        with self._lock:
+            stats = dict(self._stats)
+            stats['entries'] = len(self._entries)
+        return stats
+
+
+def _cached_dns_connection(connection_cls, dns_cache):
+    """Bağlanırken adresi DNS önbelleğinden alan bağlantı sınıfı oluşturur"""
+
+    class CachedDNSConnection(connection_cls):
+        def _new_conn(self):
+            host = self._dns_host
+            try:
+                addresses = dns_cache.resolve(host, self.port)
+            except OSError:
+                # Çözümleme hatası urllib3'ün kendi hata türüyle bildirilsin
+                return super()._new_conn()
+
+            # TLS doğrulaması ve SNI için self.host değişmez, yalnızca bağlanılan adres değişir
+            last_error = None
+            for address in addresses:
+                self._dns_host = address
+                try:
+                    return super()._new_conn()
+                except (NewConnectionError, ConnectTimeoutError) as e:
+                    last_error = e
+                finally:
+                    self._dns_host = host
+            raise last_error
+
+    return CachedDNSConnection
+
+
+class CachedDNSAdapter(HTTPAdapter):
+    """Bağlantı havuzundaki yeni bağlantılar için DNS önbelleği kullanan adaptör"""
+
+    def __init__(self, dns_cache=None, **kwargs):
+        """
+        Args:
+            dns_cache (DNSCache, optional): Kullanılacak önbellek (None: her bağlantıda çözümle)
+        """
+        # HTTPAdapter.__init__ init_poolmanager'ı çağırdığından önce atanır
+        self.dns_cache = dns_cache
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        if self.dns_cache is None:
+            return
+        self.poolmanager.pool_classes_by_scheme = {
+            'http': type('CachedDNSHTTPConnectionPool', (HTTPConnectionPool,), {
+                'ConnectionCls': _cached_dns_connection(HTTPConnection, self.dns_cache)
+            }),
+            'https': type('CachedDNSHTTPSConnectionPool', (HTTPSConnectionPool,), {
+                'ConnectionCls': _cached_dns_connection(HTTPSConnection, self.dns_cache)
+            })
+        }
+
+
+class _RejectCookiesPolicy(DefaultCookiePolicy):
+    """Çerezleri httpx istemcisinde saklamaz; çerezleri requests oturumu yönetir"""
+
+    def set_ok(self, cookie, request):
+        return False
+
+
+class _HTTPXRaw:
+    """
+    requests'in yanıt üzerinde kullandığı urllib3 yanıtı alanlarını sağlar.
+
+    Session.send Set-Cookie başlıklarını raw._original_response.msg üzerinden
+    oturumun çerez kavanozuna aktarır; içerik zaten okunmuş olduğundan
+    gövde okuma işlemleri desteklenmez.
+    """
+
+    def __init__(self, message, http_version):
+        self._original_response = self
+        self.msg = message
+        self.http_version = http_version
+
+    def release_conn(self):
+        pass
+
+    def close(self):
+        pass
+
+
+class HTTP2Adapter(BaseAdapter):
+    """
+    İstekleri httpx üzerinden gönderen requests adaptörü.
+
+    Protokol TLS el sıkışmasında (ALPN) seçilir: h2 sunan hostlarla tek bağlantı
+    üzerinde çoklanmış HTTP/2, sunmayanlarla HTTP/1.1 kullanılır. Yönlendirmeler,
+    çerezler ve kayıt/yeniden oynatma requests oturumunda kalır. Oturumun proxy
+    ve sertifika doğrulama ayarları yerine httpx'in ortam ayarları geçerlidir;
+    stream=True isteklerin gövdesi de yanıt dönmeden okunur.
+    """
+
+    # HTTP/2'de yasak olan bağlantıya özgü başlıklar
+    HOP_BY_HOP_HEADERS = ('connection', 'keep-alive', 'proxy-connection', 'transfer-encoding', 'upgrade')
+
+    def __init__(self, http2=True, max_connections=None):
+        """
+        Args:
+            http2 (bool): HTTP/2 görüşülsün mü (h2 gerekir; False: yalnızca HTTP/1.1)
+            max_connections (int, optional): Açık tutulacak azami bağlantı sayısı
+        """
+        super().__init__()
+        limits = httpx.Limits(
+            max_connections=max_connections, max_keepalive_connections=max_connections
+        )
+        self.client = httpx.Client(
+            http2=http2, limits=limits, follow_redirects=False,
+            cookies=CookieJar(policy=_RejectCookiesPolicy())
+        )
+        self._lock = threading.Lock()
+        self._versions = {}
+
+    @staticmethod
+    def _timeout(timeout):
+        """requests zaman aşımını (sayı veya (bağlanma, okuma) ikilisi) httpx'e çevirir"""
+        if isinstance(timeout, tuple):
+            connect, read = timeout
+            return httpx.Timeout(read, connect=connect)
+        return httpx.Timeout(timeout)
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        headers = [
+            (name, value) for name, value in request.headers.items()
+            if name.lower() not in self.HOP_BY_HOP_HEADERS
+        ]
+        try:
+            result = self.client.request(
+                request.method, request.url, headers=headers, content=request.body,
+                timeout=self._timeout(timeout)
+            )
+        except httpx.ConnectTimeout as e:
+            raise requests.exceptions.ConnectTimeout(e, request=request)
+        except httpx.TimeoutException as e:
+            raise requests.exceptions.ReadTimeout(e, request=request)
+        except (httpx.NetworkError, httpx.ProtocolError) as e:
+            raise requests.exceptions.ConnectionError(e, request=request)
+        except httpx.HTTPError as e:
+            raise requests.exceptions.RequestException(e, request=request)
+
+        host = result.url.host
+        with self._lock:
+            versions = self._versions.setdefault(host, {})
+            versions[result.http_version] = versions.get(result.http_version, 0) + 1
+        return self._build_response(request, result)
+
+    def _build_response(self, request, result):
+        response = requests.Response()
+        response.status_code = result.status_code
+        response.reason = result.reason_phrase
+
+        headers = CaseInsensitiveDict()
+        message = HTTPMessage()
+        for name, value in result.headers.multi_items():
+            # Tekrarlanan başlıklar urllib3'teki gibi birleştirilir; çerezler için ayrı tutulur
+            message[name] = value
+            headers[name] = f"{headers[name]}, {value}" if name in headers else value
+        response.headers = headers
+        response.encoding = get_encoding_from_headers(headers)
+        response.raw = _HTTPXRaw(message, result.http_version)
+        response._content = result.content
+        response.url = request.url
+        response.request = request
+        response.connection = self
+        extract_cookies_to_jar(response.cookies, request, response.raw)
+        return response
+
+    def stats(self, host=None):
+        """
+        Görüşülen protokol sürümlerini döndürür.
+
+        Args:
+            host (str, optional): Yalnızca bu host (varsayılan: tüm hostlar)
+
+        Returns:
+            dict: Host -> {'HTTP/2': yanıt sayısı, 'HTTP/1.1': yanıt sayısı}; host
+                verilirse yalnızca o host'un sayıları
+        """
+        with self._lock:
+            if host is not None:
+                return dict(self._versions.get(host.lower().split(':')[0], {}))
+            return {name: dict(versions) for name, versions in self._versions.items()}
+
+    def close(self):
+        self.client.close()
+
+
+class HTTPClient:
+    """
+    Süreç genelinde paylaşılan, kalıcı bağlantılı (keep-alive) HTTP oturumu.
+
+    Tüm scraper'lar aynı bağlantı havuzunu kullandığından her host için TLS el
+    sıkışması bir kez yapılır ve bağlantılar çalıştırmalar arasında açık kalır.
+    requests/urllib3 HTTP/2 desteklemez; HTTP2_ENABLED açıksa HTTPS istekleri
+    (HTTP2_HOSTS verilmişse yalnızca o hostlar) HTTP2Adapter ile gönderilir.
+    """
+
+    def __init__(self, pool_connections=None, pool_maxsize=None, dns_cache_ttl=None, http2=None,
+                 http2_hosts=None):
+        """
+        Args:
+            pool_connections (int, optional): Bağlantı havuzu tutulacak azami host sayısı
+            pool_maxsize (int, optional): Host başına açık tutulacak azami bağlantı sayısı
+            dns_cache_ttl (float, optional): DNS önbelleği süresi (saniye, 0: kapalı)
+            http2 (bool, optional): HTTPS isteklerinde HTTP/2 kullanılsın mı (varsayılan: HTTP2_ENABLED)
+            http2_hosts (list, optional): HTTP/2 kullanılacak hostlar (varsayılan: HTTP2_HOSTS, boş: tümü)
+        """
+        self.pool_connections = pool_connections or HTTP_POOL_CONNECTIONS
+        self.pool_maxsize = pool_maxsize or HTTP_POOL_MAXSIZE
+        ttl = HTTP_DNS_CACHE_TTL if dns_cache_ttl is None else dns_cache_ttl
+        self.dns_cache = DNSCache(ttl) if ttl > 0 else None
+
+        self.session = requests.Session()
+        self.adapter = CachedDNSAdapter(
+            self.dns_cache, pool_connections=self.pool_connections, pool_maxsize=self.pool_maxsize
+        )
+        self.session.mount('http://', self.adapter)
+        self.session.mount('https://', self.adapter)
+
+        self.http2_adapter = None
+        if HTTP2_ENABLED if http2 is None else http2:
+            self._mount_http2(HTTP2_HOSTS if http2_hosts is None else http2_hosts)
+
+    def _mount_http2(self, hosts):
+        """HTTP/2 adaptörünü HTTPS isteklerine (hosts verilmişse yalnızca onlara) bağlar"""
+        if not (HTTPX_AVAILABLE and H2_AVAILABLE):
+            logger.warning("HTTP/2 için httpx ve h2 gerekli (pip install 'httpx[http2]'); HTTP/1.1 kullanılıyor")
+            return
+
+        self.http2_adapter = HTTP2Adapter(max_connections=self.pool_connections * self.pool_maxsize)
+        prefixes = [f"https://{host}/" for host in hosts] or ['https://']
+        for prefix in prefixes:
+            self.session.mount(prefix, self.http2_adapter)
+        logger.info(f"HTTP/2 etkin: {', '.join(hosts) if hosts else 'tüm HTTPS hostları'}")
+
+    def stats(self, host=None):
+        """
+        Bağlantı havuzu istatistiklerini döndürür.
+
+        Args:
+            host (str, optional): Yalnızca bu host (varsayılan: tüm hostlar)
+
+        Returns:
+            dict: Host -> {'connections': açılan bağlantı, 'requests': yapılan istek}; host
+                verilirse yalnızca o host'un istatistikleri
+        """
+        pools = self.adapter.poolmanager.pools
+        hosts = {}
+        for key in pools.keys():
+            pool = pools.get(key)
+            if pool is None:
+                continue
+            entry = hosts.setdefault(pool.host, {'connections': 0, 'requests': 0})
+            entry['connections'] += pool.num_connections
+            entry['requests'] += pool.num_requests
+
+        if host is not None:
+            stats = hosts.get(host.lower().split(':')[0], {'connections': 0, 'requests': 0})
+            if self.dns_cache:
+                stats['dns_cache'] = self.dns_cache.stats()
+            if self.http2_adapter:
+                stats['http_versions'] = self.http2_adapter.stats(host)
+            return stats
+        return hosts
+
+    def close(self):
+        self.session.close()
+
+
+_client = None
+_client_lock = threading.Lock()
+
+
+def _configure_fixtures():
+    """Ayarlara göre kayıt veya yeniden oynatma modunu etkinleştirir"""
+    if SCRAPER_REPLAY_URL:
+        install_replay(SCRAPER_REPLAY_URL)
+    elif SCRAPER_RECORD_FIXTURES:
+        archive = FixtureArchive(SCRAPER_RECORD_FIXTURES)
+        if os.path.exists(archive.manifest_path):
+            # Mevcut arşive eklenir; aynı istekler güncellenir
+            archive.load()
+        install_recorder(archive)
+        atexit.register(archive.save)
+
+
+def get_http_client():
+    """
+    Süreç genelinde paylaşılan HTTP istemcisini döndürür.
+
+    Returns:
+        HTTPClient: Paylaşılan istemci
+    """
+    global _client
+    with _client_lock:
+        if _client is None:
+            _configure_fixtures()
+            _client = HTTPClient()
+            logger.info(f"HTTP bağlantı havuzu oluşturuldu (host başına {_client.pool_maxsize} bağlantı)")
+        return _client
@@ -0,0 +1,259 @@
+"""
+Firecrawl toplu tarama (batch scrape) API'sini taklit eden yerel sahte sunucu.
+
+FirecrawlBatchClient api_url ile bu sunucuya yönlendirildiğinde gerçek API'ye
+hiç istek yapılmaz ve kredi harcanmaz. İşler birkaç sorguda kademeli olarak
+tamamlanır, sonuçlar 'next' bağlantılarıyla sayfalı döner ve başarısız URL'ler
+gerçek API'deki gibi sonuçlarda yer almaz, /errors ucunda listelenir.
+
+Kullanım:
+    python src/scrapers/mock_firecrawl.py --pages pages.json --port 3002 --page-size 10 --polls 3
+    FIRECRAWL_API_URL=http://127.0.0.1:3002 python src/main.py
+"""
+import argparse
+import json
+import logging
+import os
+import sys
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+# Ana dizini ekle
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+logger = logging.getLogger(__name__)
+
+
+class MockFirecrawlServer:
+    """
+    Toplu tarama uçlarını (POST /v1/batch/scrape, GET /v1/batch/scrape/{id},
+    GET /v1/batch/scrape/{id}/errors) sunan çok iş parçacıklı HTTP sunucusu.
+
+    Her iş `polls_to_complete` durum sorgusunda tamamlanır; arada URL'lerin bir
+    kısmı hazır olarak döner. Sayfası tanımlı olmayan veya `failed` içinde
+    verilen URL'ler başarısız sayılır.
+    """
+
+    def __init__(self, pages, failed=(), page_size=10, polls_to_complete=1, host='127.0.0.1', port=0):
+        """
+        Args:
+            pages (dict): URL -> sayfanın 'json' çıktısı
+            failed (iterable): Başarısız olacak URL'ler
+            page_size (int): Bir yanıtta döndürülecek azami belge sayısı
+            polls_to_complete (int): İşin tamamlanması için gereken durum sorgusu sayısı
+            host (str): Dinlenecek adres
+            port (int): Dinlenecek port (0: boş bir port seçilir)
+        """
+        self.pages = dict(pages)
+        self.failed = set(failed)
+        self.page_size = page_size
+        self.polls_to_complete = max(polls_to_complete, 1)
+        self._lock = threading.Lock()
+        self._jobs = {}
+        self._stats = {'submits': 0, 'polls': 0, 'next_pages': 0, 'error_requests': 0}
+        self._server = ThreadingHTTPServer((host, port), self._make_handler())
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def _count(self, field):
+        with self._lock:
+            self._stats[field] += 1
+
+    def _create_job(self, urls):
+        job_id = uuid.uuid4().hex
+        with self._lock:
+            self._jobs[job_id] = {'urls': list(urls), 'polls': 0}
+            self._stats['submits'] += 1
+        return job_id
+
+    def _job_state(self, job_id, poll):
+        """
+        İşin hazır belgelerini ve durumunu döndürür.
+
+        Args:
+            job_id (str): İş kimliği
+            poll (bool): Yeni bir durum sorgusu sayılsın mı (sayfa istekleri sayılmaz)
+
+        Returns:
+            tuple: (hazır belgeler, başarısız URL'ler, durum, toplam) ya da iş yoksa None
+        """
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None:
+                return None
+            if poll:
+                job['polls'] += 1
+                self._stats['polls'] += 1
+            polls = job['polls']
+            urls = job['urls']
+
+        ready = urls[:len(urls) * min(polls, self.polls_to_complete) // self.polls_to_complete]
+        documents, failed = [], []
+        for url in ready:
+            if url in self.failed or url not in self.pages:
+                failed.append(url)
+            else:
+                documents.append({
+                    'json': self.pages[url],
+                    'metadata': {'sourceURL': url, 'statusCode': 200}
+                })
+        status = 'completed' if len(ready) == len(urls) else 'scraping'
+        return documents, failed, status, len(urls)
+
+    def _make_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def _reply(self, status, payload):
+                content = json.dumps(payload).encode('utf-8')
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(content)))
+                self.end_headers()
+                self.wfile.write(content)
+
+            def _authorized(self):
+                if not (self.headers.get('Authorization') or '').startswith('Bearer '):
+                    self._reply(401, {'success': False, 'error': 'Unauthorized'})
+                    return False
+                return True
+
+            def do_POST(self):
+                length = int(self.headers.get('Content-Length') or 0)
+                body = self.rfile.read(length) if length else b''
+                if not self._authorized():
+                    return
+                if urlsplit(self.path).path.rstrip('/') != '/v1/batch/scrape':
+                    self._reply(404, {'success': False, 'error': 'Not found'})
+                    return
+                try:
+                    urls = json.loads(body or b'{}').get('urls') or []
+                except ValueError:
+                    urls = []
+                if not urls:
+                    self._reply(400, {'success': False, 'error': 'urls gerekli'})
+                    return
+
+                job_id = server._create_job(urls)
+                self._reply(200, {'success': True, 'id': job_id, 'url': f"{server.url}/v1/batch/scrape/{job_id}"})
+
+            def do_GET(self):
+                if not self._authorized():
+                    return
+                parts = urlsplit(self.path)
+                segments = parts.path.strip('/').split('/')
+                if segments[:3] != ['v1', 'batch', 'scrape'] or len(segments) not in (4, 5):
+                    self._reply(404, {'success': False, 'error': 'Not found'})
+                    return
+                job_id = segments[3]
+
+                if len(segments) == 5:
+                    if segments[4] != 'errors':
+                        self._reply(404, {'success': False, 'error': 'Not found'})
+                        return
+                    server._count('error_requests')
+                    state = server._job_state(job_id, poll=False)
+                    if state is None:
+                        self._reply(404, {'success': False, 'error': 'Job not found'})
+                        return
+                    self._reply(200, {
+                        'errors': [{'id': uuid.uuid4().hex, 'url': url, 'error': 'Scrape failed'} for url in state[1]],
+                        'robotsBlocked': []
+                    })
+                    return
+
+                query = parse_qs(parts.query)
+                skip = int(query.get('skip', ['0'])[0])
+                if skip:
+                    server._count('next_pages')
+                state = server._job_state(job_id, poll=not skip)
+                if state is None:
+                    self._reply(404, {'success': False, 'error': 'Job not found'})
+                    return
+
+                documents, _, status, total = state
+                page = documents[skip:skip + server.page_size]
+                payload = {
+                    'success': True,
+                    'status': status,
+                    'total': total,
+                    'completed': len(documents),
+                    'creditsUsed': len(documents),
+                    'data': page
+                }
+                if skip + server.page_size < len(documents):
+                    payload['next'] = f"{server.url}/v1/batch/scrape/{job_id}?skip={skip + server.page_size}"
+                self._reply(200, payload)
+
+            def log_message(self, format, *args):
+                logger.debug(f"{self.address_string()} - {format % args}")
+
+        return Handler
+
+    def start(self):
+        """Sunucuyu arka planda başlatır"""
+        self._thread = threading.Thread(target=self._server.serve_forever, name='mock-firecrawl', daemon=True)
+        self._thread.start()
+        logger.info(f"Sahte Firecrawl sunucusu başlatıldı: {self.url} ({len(self.pages)} sayfa)")
+        return self
+
+    def stop(self):
+        """Sunucuyu durdurur"""
+        self._server.shutdown()
+        self._server.server_close()
+
+    def stats(self):
+        """
+        İstek istatistiklerini döndürür.
+
+        Returns:
+            dict: submits, polls, next_pages, error_requests
+        """
+        with self._lock:
+            return dict(self._stats)
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+        return False
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Firecrawl toplu tarama API'sini taklit eder")
+    parser.add_argument('--pages', required=True, help="URL -> json çıktısı eşlemesini içeren JSON dosyası")
+    parser.add_argument('--failed', nargs='*', default=[], help="Başarısız olacak URL'ler")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=3002)
+    parser.add_argument('--page-size', type=int, default=10, help="Yanıt başına azami belge sayısı")
+    parser.add_argument('--polls', type=int, default=1, help="İşin tamamlanması için gereken sorgu sayısı")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    with open(args.pages, encoding='utf-8') as f:
+        pages = json.load(f)
+    server = MockFirecrawlServer(
+        pages, failed=args.failed, page_size=args.page_size, polls_to_complete=args.polls,
+        host=args.host, port=args.port
+    )
+    server.start()
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,144 @@
+import atexit
+import logging
+import multiprocessing
+import os
+import sys
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+# Ana dizini ekle
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from src.config import PARSE_POOL_WORKERS, PARSE_POOL_MIN_ITEMS, PARSE_POOL_START_METHOD
+
+logger = logging.getLogger(__name__)
+
+# İşçi süreçte (sınıf, ayarlar) başına bir kez oluşturulan ayrıştırıcı nesneler
+_worker_parsers = {}
+
+
+def default_start_method():
+    """
+    Varsayılan süreç başlatma yöntemini döndürür.
+
+    fork, iş parçacıkları (planlayıcı, SocketIO, iş havuzları) ve açık SQLite
+    bağlantıları olan süreci kopyaladığından kullanılmaz. forkserver işçileri tek
+    iş parçacıklı temiz bir sunucu süreçten oluşturur; yoksa spawn kullanılır.
+    """
+    return 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+
+
+def extract_details(scraper_cls, settings, url, html):
+    """
+    Detay sayfasını ayrıştırır; yalnızca HTML'e, ayrıştırıcıya ve sınıfın seçicilerine ihtiyaç duyar.
+
+    Ayrıştırıcı nesne __init__ çağrılmadan oluşturulur (HTTP oturumu, önbellek,
+    kayıt deposu veya Firecrawl istemcisi açılmaz) ve süreç içinde yeniden kullanılır.
+
+    Args:
+        scraper_cls (type): Sayfanın ait olduğu scraper sınıfı
+        settings (dict): Scraper'ın parse_settings() çıktısı
+        url (str): Detay sayfasının URL'si
+        html (bytes): Sayfanın UTF-8 kodlu HTML içeriği
+
+    Returns:
+        tuple: (telefonun özellikleri, kullanılan yol, süre ms)
+    """
+    key = (scraper_cls, tuple(sorted(settings.items())))
+    parser = _worker_parsers.get(key)
+    if parser is None:
+        parser = _worker_parsers[key] = scraper_cls.for_parsing(settings)
+    return parser._extract_details(url, html.decode('utf-8'))
+
+
+class ParsePool:
+    """
+    HTML ayrıştırmayı ayrı süreçlerde çalıştıran havuz.
+
+    Sayfalar iş parçacıklarıyla çekilir ancak ayrıştırma GIL'e takılır; havuz
+    ham HTML'i işçi süreçlere gönderir ve yalnızca çıkarılan kaydı geri alır.
+    Süreçler ilk kullanımda başlatılır.
+    """
+
+    def __init__(self, workers=None, min_items=None, start_method=None):
+        """
+        Args:
+            workers (int, optional): İşçi süreç sayısı (varsayılan: işlemci çekirdeği sayısı)
+            min_items (int, optional): Havuzun kullanılacağı en az sayfa sayısı
+            start_method (str, optional): multiprocessing başlatma yöntemi (varsayılan: forkserver, yoksa spawn)
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self.min_items = PARSE_POOL_MIN_ITEMS if min_items is None else min_items
+        self.start_method = start_method or default_start_method()
+        self._lock = threading.Lock()
+        self._executor = None
+
+    def should_use(self, item_count):
+        """Bu kadar sayfa için havuzun kullanılmaya değip değmediğini döndürür"""
+        return self.workers > 1 and item_count >= self.min_items
+
+    def _get_executor(self):
+        with self._lock:
+            if self._executor is None:
+                context = multiprocessing.get_context(self.start_method)
+                self._executor = ProcessPoolExecutor(max_workers=self.workers, mp_context=context)
+                logger.info(f"Ayrıştırma havuzu {self.workers} süreçle başlatıldı")
+            return self._executor
+
+    def start(self):
+        """Süreçleri önceden başlatır (ilk sayfanın bekleme süresini kısaltır)"""
+        self._get_executor()
+
+    def parse(self, scraper_cls, settings, url, html):
+        """
+        Detay sayfasını işçi süreçte ayrıştırır ve sonucu bekler.
+
+        Args:
+            scraper_cls (type): Sayfanın ait olduğu scraper sınıfı
+            settings (dict): Scraper'ın parse_settings() çıktısı
+            url (str): Detay sayfasının URL'si
+            html (str): Sayfanın HTML içeriği
+
+        Returns:
+            tuple: (telefonun özellikleri, kullanılan yol: 'structured' veya 'selector', süre ms)
+
+        Raises:
+            BrokenProcessPool: İşçi süreç beklenmedik şekilde sonlandıysa (havuz yeniden oluşturulur)
+        """
+        executor = self._get_executor()
+        try:
+            return executor.submit(extract_details, scraper_cls, settings, url, html.encode('utf-8')).result()
+        except BrokenProcessPool:
+            with self._lock:
+                if self._executor is executor:
+                    self._executor = None
+            executor.shutdown(wait=False, cancel_futures=True)
+            logger.error("Ayrıştırma havuzundaki bir süreç sonlandı, havuz yeniden oluşturulacak")
+            raise
+
+    def close(self):
+        """Süreçleri kapatır"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_parse_pool():
+    """
+    Süreç genelinde paylaşılan ayrıştırma havuzunu döndürür.
+
+    Returns:
+        ParsePool: Paylaşılan havuz
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ParsePool(workers=PARSE_POOL_WORKERS, start_method=PARSE_POOL_START_METHOD)
+            atexit.register(_pool.close)
+        return _pool
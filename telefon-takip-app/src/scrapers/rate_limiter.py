@@ -0,0 +1,235 @@
+import logging
+import os
+import sys
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlparse
+
+# Ana dizini ekle
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from src.config import (
+    SCRAPER_RATE_INITIAL, SCRAPER_RATE_MIN, SCRAPER_RATE_MAX, SCRAPER_RATE_BURST,
+    SCRAPER_RATE_INCREASE, SCRAPER_RATE_BACKOFF, SCRAPER_SLOW_RESPONSE_SECONDS, SCRAPER_MAX_RETRY_AFTER
+)
+
+logger = logging.getLogger(__name__)
+
+# Hız düşürmeyi gerektiren durum kodları
+THROTTLE_STATUS_CODES = (429, 503)
+
+
+def parse_retry_after(value):
+    """
+    Retry-After başlığını saniyeye çevirir.
+
+    Args:
+        value (str): Saniye sayısı veya HTTP tarihi
+
+    Returns:
+        float: Beklenecek süre (saniye), çözümlenemezse None
+    """
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+class HostRateLimiter:
+    """
+    Tek bir host için uyarlanabilir token bucket.
+
+    Sağlıklı yanıtlarda hız her istekte sabit miktarda artırılır; 429/503 veya
+    yavaş yanıtlarda hız çarpımsal olarak düşürülür (AIMD). Retry-After başlığı
+    gelirse süre dolana kadar yeni istek yapılmaz.
+    """
+
+    def __init__(self, host, rate=None, min_rate=None, max_rate=None, burst=None,
+                 increase=None, backoff=None, slow_threshold=None):
+        """
+        Args:
+            host (str): Host adı
+            rate (float, optional): Başlangıç hızı (istek/saniye)
+            min_rate (float, optional): En düşük hız
+            max_rate (float, optional): En yüksek hız
+            burst (int, optional): Birikebilecek azami token sayısı
+            increase (float, optional): Sağlıklı yanıt başına hız artışı
+            backoff (float, optional): Kısıtlamada hızın çarpılacağı katsayı (0-1)
+            slow_threshold (float, optional): Bu süreyi aşan yanıtlar yavaş sayılır (saniye)
+        """
+        self.host = host
+        self.min_rate = min_rate or SCRAPER_RATE_MIN
+        self.max_rate = max_rate or SCRAPER_RATE_MAX
+        self.rate = min(max(rate or SCRAPER_RATE_INITIAL, self.min_rate), self.max_rate)
+        self.burst = burst or SCRAPER_RATE_BURST
+        self.increase = SCRAPER_RATE_INCREASE if increase is None else increase
+        self.backoff = backoff or SCRAPER_RATE_BACKOFF
+        self.slow_threshold = slow_threshold or SCRAPER_SLOW_RESPONSE_SECONDS
+
+        self._lock = threading.Lock()
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._stats = {}
+        self.reset_stats()
+
+    def _refill(self, now):
+        """Geçen süreye göre token ekler (kilit altında çağrılmalıdır)"""
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self):
+        """
+        İstek için bir token alır; gerekirse token birikene kadar bekler.
+
+        Returns:
+            float: Beklenen süre (saniye)
+        """
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if now < self._blocked_until:
+                    delay = self._blocked_until - now
+                elif self._tokens >= 1:
+                    self._tokens -= 1
+                    self._stats['requests'] += 1
+                    self._stats['wait_time'] += waited
+                    return waited
+                else:
+                    delay = (1 - self._tokens) / self.rate
+            time.sleep(delay)
+            waited += delay
+
+    def record(self, status_code, elapsed, retry_after=None):
+        """
+        Yanıtın sonucuna göre hızı ayarlar.
+
+        Args:
+            status_code (int): HTTP durum kodu (bağlantı hatası / zaman aşımında None)
+            elapsed (float): Yanıt süresi (saniye)
+            retry_after (str, optional): Retry-After başlığı
+        """
+        with self._lock:
+            previous = self.rate
+            if status_code in THROTTLE_STATUS_CODES:
+                self.rate = max(self.min_rate, self.rate * self.backoff)
+                self._stats[f'throttled_{status_code}'] += 1
+                delay = parse_retry_after(retry_after)
+                if delay is not None:
+                    delay = min(delay, SCRAPER_MAX_RETRY_AFTER)
+                    self._blocked_until = max(self._blocked_until, time.monotonic() + delay)
+                    self._stats['retry_after'] += 1
+                # Biriken tokenlar yeni hızla birlikte sıfırlanır, ani istek patlaması olmaz
+                self._tokens = 0.0
+            elif status_code is None or elapsed > self.slow_threshold:
+                self.rate = max(self.min_rate, self.rate * self.backoff)
+                self._stats['slow'] += 1
+            elif status_code < 500:
+                self.rate = min(self.max_rate, self.rate + self.increase)
+
+            if self.rate < previous:
+                logger.info(f"{self.host} istek hızı düşürüldü: {previous:.2f} -> {self.rate:.2f} istek/sn "
+                            f"(durum: {status_code}, süre: {elapsed:.2f} sn)")
+
+    def reset_stats(self):
+        """Kısıtlama sayaçlarını sıfırlar (mevcut hız korunur)"""
+        with self._lock:
+            self._stats = {
+                'requests': 0, 'wait_time': 0.0, 'throttled_429': 0, 'throttled_503': 0,
+                'retry_after': 0, 'slow': 0
+            }
+
+    def stats(self):
+        """
+        Mevcut hızı ve kısıtlama olaylarını döndürür.
+
+        Returns:
+            dict: rate, min_rate, max_rate, requests, wait_time, throttled_429, throttled_503,
+                retry_after, slow, blocked_for
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats['rate'] = round(self.rate, 2)
+            stats['blocked_for'] = round(max(self._blocked_until - time.monotonic(), 0.0), 2)
+        stats['min_rate'] = self.min_rate
+        stats['max_rate'] = self.max_rate
+        stats['wait_time'] = round(stats['wait_time'], 2)
+        return stats
+
+
+class RateLimiter:
+    """Host başına HostRateLimiter nesnelerini yönetir"""
+
+    def __init__(self, **defaults):
+        """
+        Args:
+            **defaults: Yeni oluşturulan HostRateLimiter nesnelerine verilecek ayarlar
+        """
+        self.defaults = defaults
+        self._lock = threading.Lock()
+        self._hosts = {}
+
+    def for_host(self, host):
+        """Host'un hız sınırlayıcısını döndürür, yoksa oluşturur"""
+        host = host.lower()
+        with self._lock:
+            limiter = self._hosts.get(host)
+            if limiter is None:
+                limiter = self._hosts[host] = HostRateLimiter(host, **self.defaults)
+            return limiter
+
+    def acquire(self, url):
+        """URL'nin host'u için token alır, beklenen süreyi döndürür"""
+        return self.for_host(urlparse(url).netloc).acquire()
+
+    def record(self, url, status_code, elapsed, retry_after=None):
+        """URL'nin host'u için yanıt sonucunu kaydeder"""
+        self.for_host(urlparse(url).netloc).record(status_code, elapsed, retry_after)
+
+    def reset_stats(self, host):
+        """Host'a ait kısıtlama sayaçlarını sıfırlar"""
+        self.for_host(host).reset_stats()
+
+    def stats(self, host=None):
+        """
+        Hız sınırlayıcı istatistiklerini döndürür.
+
+        Args:
+            host (str, optional): Yalnızca bu host (varsayılan: tüm hostlar)
+
+        Returns:
+            dict: Host istatistikleri veya host -> istatistik sözlüğü
+        """
+        if host:
+            return self.for_host(host).stats()
+        with self._lock:
+            limiters = list(self._hosts.values())
+        return {limiter.host: limiter.stats() for limiter in limiters}
+
+
+_limiter = None
+_limiter_lock = threading.Lock()
+
+
+def get_rate_limiter():
+    """
+    Süreç genelinde paylaşılan hız sınırlayıcıyı döndürür.
+
+    Aynı siteye farklı scraper nesnelerinden yapılan istekler aynı kovayı kullanır.
+
+    Returns:
+        RateLimiter: Paylaşılan hız sınırlayıcı
+    """
+    global _limiter
+    with _limiter_lock:
+        if _limiter is None:
+            _limiter = RateLimiter()
+        return _limiter
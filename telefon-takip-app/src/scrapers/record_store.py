@@ -0,0 +1,206 @@
+import json
+import logging
+import os
+import sqlite3
+import sys
+import threading
+import time
+
+# Ana dizini ekle
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from src.config import SCRAPER_CACHE_DIR
+from src.scrapers.response_cache import normalize_url
+
+logger = logging.getLogger(__name__)
+
+
+class RecordStore:
+    """
+    Çalıştırmalar arasında korunan scraper durumu.
+
+    URL başına HTTP doğrulayıcılarını (ETag / Last-Modified), sayfadan en son
+    çıkarılan kaydı ve ürünün liste kartının parmak izini saklar; böylece
+    değişmeyen sayfalar yeniden ayrıştırılmaz, kartı değişmeyen ürünlerin detay
+    sayfaları hiç çekilmez. Aynı ürünün kartı farklı liste kaynaklarında (HTML,
+    Firecrawl) farklı alanlarla gelebildiğinden parmak izleri kaynak başına saklanır.
+    """
+
+    def __init__(self, db_path):
+        """
+        Args:
+            db_path (str): SQLite dosyasının yolu
+        """
+        self.db_path = db_path
+        self._lock = threading.Lock()
+
+        os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('''
+        CREATE TABLE IF NOT EXISTS validators (
+            url TEXT PRIMARY KEY,
+            etag TEXT,
+            last_modified TEXT,
+            updated_at REAL
+        )
+        ''')
+        self._conn.execute('''
+        CREATE TABLE IF NOT EXISTS records (
+            url TEXT PRIMARY KEY,
+            site TEXT,
+            record TEXT,
+            updated_at REAL
+        )
+        ''')
+        columns = [row[1] for row in self._conn.execute('PRAGMA table_info(cards)')]
+        if columns and 'listing' not in columns:
+            # Eski şemada parmak izi liste kaynağından bağımsızdı; bir kez yeniden hesaplanır
+            logger.info("Liste kartı tablosu liste kaynağı başına parmak izine taşınıyor")
+            self._conn.execute('DROP TABLE cards')
+        self._conn.execute('''
+        CREATE TABLE IF NOT EXISTS cards (
+            url TEXT,
+            listing TEXT,
+            site TEXT,
+            fingerprint TEXT,
+            updated_at REAL,
+            PRIMARY KEY (url, listing)
+        )
+        ''')
+        self._conn.commit()
+
+    def get_validators(self, url):
+        """
+        URL için saklanan HTTP doğrulayıcılarını döndürür.
+
+        Returns:
+            dict: {'etag': ..., 'last_modified': ...} veya None
+        """
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT etag, last_modified FROM validators WHERE url = ?', (normalize_url(url),)
+            ).fetchone()
+        if not row or not (row[0] or row[1]):
+            return None
+        return {'etag': row[0], 'last_modified': row[1]}
+
+    def set_validators(self, url, etag=None, last_modified=None):
+        """URL için HTTP doğrulayıcılarını saklar"""
+        if not etag and not last_modified:
+            return
+        with self._lock:
+            self._conn.execute('''
+            INSERT OR REPLACE INTO validators (url, etag, last_modified, updated_at)
+            VALUES (?, ?, ?, ?)
+            ''', (normalize_url(url), etag, last_modified, time.time()))
+            self._conn.commit()
+
+    def get_record(self, url):
+        """
+        URL'den en son çıkarılan kaydı döndürür.
+
+        Returns:
+            dict: Kayıt veya None
+        """
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT record FROM records WHERE url = ?', (normalize_url(url),)
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def set_record(self, url, site, record):
+        """URL'den çıkarılan kaydı saklar"""
+        with self._lock:
+            self._conn.execute('''
+            INSERT OR REPLACE INTO records (url, site, record, updated_at)
+            VALUES (?, ?, ?, ?)
+            ''', (normalize_url(url), site, json.dumps(record, ensure_ascii=False), time.time()))
+            self._conn.commit()
+
+    def get_cards(self, urls, listing):
+        """
+        URL'lerin liste kartı parmak izlerini ve kayıtlarını toplu olarak döndürür.
+
+        Args:
+            urls (list): Ürün URL'leri
+            listing (str): Liste kaynağı ('html', 'firecrawl')
+
+        Returns:
+            dict: URL -> (parmak izi, kayıt, kaydın güncellenme zamanı); kaydı olmayan URL'ler
+                dahil edilmez, bu kaynakta kartı olmayanların parmak izi None olur
+        """
+        keys = {normalize_url(url): url for url in urls}
+        key_list = list(keys)
+        cards = {}
+        with self._lock:
+            for start in range(0, len(key_list), 500):
+                chunk = key_list[start:start + 500]
+                placeholders = ','.join('?' * len(chunk))
+                rows = self._conn.execute(f'''
+                SELECT records.url, cards.fingerprint, records.record, records.updated_at
+                FROM records LEFT JOIN cards ON cards.url = records.url AND cards.listing = ?
+                WHERE records.url IN ({placeholders})
+                ''', [listing] + chunk).fetchall()
+                for key, fingerprint, record, updated_at in rows:
+                    cards[keys[key]] = (fingerprint, json.loads(record), updated_at)
+        return cards
+
+    def set_card(self, url, site, listing, fingerprint, record):
+        """Ürünün liste kaynağındaki kart parmak izini ve detay sayfasından çıkarılan kaydı birlikte saklar"""
+        now = time.time()
+        key = normalize_url(url)
+        with self._lock:
+            self._conn.execute('''
+            INSERT OR REPLACE INTO records (url, site, record, updated_at)
+            VALUES (?, ?, ?, ?)
+            ''', (key, site, json.dumps(record, ensure_ascii=False), now))
+            self._conn.execute('''
+            INSERT OR REPLACE INTO cards (url, listing, site, fingerprint, updated_at)
+            VALUES (?, ?, ?, ?, ?)
+            ''', (key, listing, site, fingerprint, now))
+            self._conn.commit()
+
+    def update_prices(self, site, listing, items):
+        """
+        Fiyat taramasında görülen kartların parmak izlerini ve kayıtlarını günceller.
+
+        Özelliklerin yaşı (kaydın güncellenme zamanı) değiştirilmez; böylece fiyat
+        taramaları özellik yenilemesini geciktirmez. Yalnızca taramanın liste
+        kaynağındaki parmak izi güncellenir, diğer kaynakların kartları korunur.
+
+        Args:
+            site (str): Site adı
+            listing (str): Liste kaynağı ('html', 'firecrawl')
+            items (list): (URL, yeni parmak izi, fiyatı güncellenmiş kayıt) demetleri
+        """
+        now = time.time()
+        with self._lock:
+            for url, fingerprint, record in items:
+                key = normalize_url(url)
+                self._conn.execute(
+                    'UPDATE records SET record = ? WHERE url = ?', (json.dumps(record, ensure_ascii=False), key)
+                )
+                self._conn.execute('''
+                INSERT OR REPLACE INTO cards (url, listing, site, fingerprint, updated_at)
+                VALUES (?, ?, ?, ?, ?)
+                ''', (key, listing, site, fingerprint, now))
+            self._conn.commit()
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_record_store():
+    """
+    Süreç genelinde paylaşılan kayıt deposunu döndürür.
+
+    Returns:
+        RecordStore: Paylaşılan depo
+    """
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = RecordStore(os.path.join(SCRAPER_CACHE_DIR, 'records.db'))
+        return _store
@@ -0,0 +1,208 @@
+"""
+Kaydedilmiş HTTP yanıtlarını yerel olarak sunan yeniden oynatma sunucusu.
+
+Scraper'lar SCRAPER_REPLAY_URL ile bu sunucuya yönlendirildiğinde canlı sitelere
+hiç istek yapılmaz. Gecikme ve hata enjeksiyonu ile yavaş veya kararsız siteler
+taklit edilebilir.
+
+Kullanım:
+    python src/scrapers/replay_server.py --archive fixtures/2024-06 --port 8765 --latency-ms 150 --error-rate 0.05
+    SCRAPER_REPLAY_URL=http://127.0.0.1:8765 python src/main.py
+"""
+import argparse
+import logging
+import os
+import random
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urljoin
+
+# Ana dizini ekle
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from src.scrapers.fixtures import FixtureArchive, original_url, replay_url
+
+logger = logging.getLogger(__name__)
+
+
+class ReplayServer:
+    """
+    Arşivdeki yanıtları sunan çok iş parçacıklı HTTP sunucusu.
+
+    İstek yolu gerçek URL'yi içerir ({şema}/{host}/{yol}); sunucu kaydı bulup
+    gövdesini ve başlıklarını döndürür. Kaydı olmayan istekler 404 alır.
+    """
+
+    def __init__(self, archive, host='127.0.0.1', port=0, latency=0.0, jitter=0.0,
+                 error_rate=0.0, error_status=503, seed=None):
+        """
+        Args:
+            archive (FixtureArchive): Yüklenmiş arşiv
+            host (str): Dinlenecek adres
+            port (int): Dinlenecek port (0: boş bir port seçilir)
+            latency (float): Her yanıttan önce beklenecek sabit süre (saniye)
+            jitter (float): Sabit süreye eklenecek azami rastgele süre (saniye)
+            error_rate (float): Kayıt yerine hata döndürülecek isteklerin oranı (0-1)
+            error_status (int): Enjekte edilen hatanın durum kodu
+            seed (int, optional): Tekrarlanabilir hata/gecikme dağılımı için rastgele tohum
+        """
+        self.archive = archive
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._stats = {}
+        self._server = ThreadingHTTPServer((host, port), self._make_handler())
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def _count(self, host, field, amount=1):
+        with self._lock:
+            counters = self._stats.setdefault(host, {'requests': 0, 'hits': 0, 'misses': 0, 'not_modified': 0,
+                                                     'injected_errors': 0, 'bytes': 0})
+            counters[field] += amount
+
+    def _draw(self):
+        """Bu istek için gecikmeyi ve hata enjekte edilip edilmeyeceğini belirler"""
+        with self._lock:
+            delay = self.latency + (self._random.uniform(0, self.jitter) if self.jitter else 0.0)
+            fail = self.error_rate > 0 and self._random.random() < self.error_rate
+        return delay, fail
+
+    def _make_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def _reply(self, status, headers=None, content=b''):
+                self.send_response(status)
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.send_header('Content-Length', str(len(content)))
+                self.end_headers()
+                if self.command != 'HEAD':
+                    self.wfile.write(content)
+
+            def _handle(self):
+                length = int(self.headers.get('Content-Length') or 0)
+                body = self.rfile.read(length) if length else None
+
+                url = original_url(self.path)
+                if url is None:
+                    self._reply(400, content=b'Gecersiz yeniden oynatma yolu')
+                    return
+                host = url.split('/')[2].lower()
+                server._count(host, 'requests')
+
+                delay, fail = server._draw()
+                if delay:
+                    time.sleep(delay)
+                if fail:
+                    server._count(host, 'injected_errors')
+                    self._reply(server.error_status)
+                    return
+
+                entry, content = server.archive.get(self.command, url, body)
+                if entry is None:
+                    server._count(host, 'misses')
+                    logger.debug(f"Kayıt bulunamadı: {self.command} {url}")
+                    self._reply(404, content=b'Kayit bulunamadi')
+                    return
+
+                headers = dict(entry['headers'])
+                location = next((name for name in headers if name.lower() == 'location'), None)
+                if location:
+                    # Yönlendirmeler de sunucu üzerinden izlenmeli
+                    headers[location] = replay_url(server.url, urljoin(url, headers[location]))
+
+                etag = next((value for name, value in headers.items() if name.lower() == 'etag'), None)
+                if etag and self.headers.get('If-None-Match') == etag:
+                    server._count(host, 'not_modified')
+                    self._reply(304, {'ETag': etag})
+                    return
+
+                server._count(host, 'hits')
+                server._count(host, 'bytes', len(content))
+                self._reply(entry['status'], headers, content)
+
+            do_GET = _handle
+            do_POST = _handle
+            do_HEAD = _handle
+
+            def log_message(self, format, *args):
+                logger.debug(f"{self.address_string()} - {format % args}")
+
+        return Handler
+
+    def start(self):
+        """Sunucuyu arka planda başlatır"""
+        self._thread = threading.Thread(target=self._server.serve_forever, name='replay-server', daemon=True)
+        self._thread.start()
+        logger.info(f"Yeniden oynatma sunucusu başlatıldı: {self.url} ({len(self.archive.entries)} kayıt)")
+        return self
+
+    def stop(self):
+        """Sunucuyu durdurur"""
+        self._server.shutdown()
+        self._server.server_close()
+
+    def reset_stats(self):
+        with self._lock:
+            self._stats = {}
+
+    def stats(self):
+        """
+        Host başına istek istatistiklerini döndürür.
+
+        Returns:
+            dict: Host -> requests, hits, misses, not_modified, injected_errors, bytes
+        """
+        with self._lock:
+            return {host: dict(counters) for host, counters in self._stats.items()}
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+        return False
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Kaydedilmiş HTTP yanıtlarını sunar")
+    parser.add_argument('--archive', required=True, help="Arşiv dizini")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--latency-ms', type=float, default=0, help="Yanıt başına sabit gecikme (ms)")
+    parser.add_argument('--jitter-ms', type=float, default=0, help="Eklenecek azami rastgele gecikme (ms)")
+    parser.add_argument('--error-rate', type=float, default=0, help="Hata döndürülecek isteklerin oranı (0-1)")
+    parser.add_argument('--error-status', type=int, default=503, help="Enjekte edilen hatanın durum kodu")
+    parser.add_argument('--seed', type=int, help="Rastgele tohum")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    server = ReplayServer(
+        FixtureArchive(args.archive).load(), host=args.host, port=args.port,
+        latency=args.latency_ms / 1000, jitter=args.jitter_ms / 1000,
+        error_rate=args.error_rate, error_status=args.error_status, seed=args.seed
+    )
+    server.start()
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == '__main__':
+    main()
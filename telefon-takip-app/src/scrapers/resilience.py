@@ -0,0 +1,194 @@
+import logging
+import os
+import random
+import sys
+import threading
+import time
+
+import requests
+
+# Ana dizini ekle
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from src.config import (
+    SCRAPER_RETRY_ATTEMPTS, SCRAPER_RETRY_BASE_DELAY, SCRAPER_RETRY_MAX_DELAY,
+    SCRAPER_CIRCUIT_FAILURE_THRESHOLD, SCRAPER_CIRCUIT_RECOVERY_TIMEOUT
+)
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitOpenError(requests.exceptions.RequestException):
+    """Devre açıkken yapılmak istenen istek için fırlatılır"""
+
+
+class RetryPolicy:
+    """
+    Geçici hatalar için yeniden deneme politikası.
+
+    Bekleme süreleri üstel olarak büyür ve tam rastgele (full jitter) seçilir;
+    böylece aynı anda başarısız olan istekler aynı anda yeniden denenmez.
+    """
+
+    # Geçici kabul edilen HTTP durum kodları
+    RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+    # Geçici kabul edilen bağlantı hataları
+    RETRY_EXCEPTIONS = (
+        requests.exceptions.Timeout,
+        requests.exceptions.ConnectionError,
+        requests.exceptions.ChunkedEncodingError
+    )
+
+    def __init__(self, max_attempts=None, base_delay=None, max_delay=None, retry_status_codes=None):
+        """
+        Args:
+            max_attempts (int, optional): İlk deneme dahil azami deneme sayısı
+            base_delay (float, optional): İlk yeniden denemeden önceki azami bekleme (saniye)
+            max_delay (float, optional): Tek bir bekleme için üst sınır (saniye)
+            retry_status_codes (tuple, optional): Yeniden denenecek durum kodları
+        """
+        self.max_attempts = max(max_attempts or SCRAPER_RETRY_ATTEMPTS, 1)
+        self.base_delay = SCRAPER_RETRY_BASE_DELAY if base_delay is None else base_delay
+        self.max_delay = SCRAPER_RETRY_MAX_DELAY if max_delay is None else max_delay
+        self.retry_status_codes = retry_status_codes or self.RETRY_STATUS_CODES
+
+    def should_retry_status(self, status_code):
+        return status_code in self.retry_status_codes
+
+    def should_retry_exception(self, error):
+        return isinstance(error, self.RETRY_EXCEPTIONS)
+
+    def delay(self, attempt):
+        """
+        Yeniden denemeden önce beklenecek süreyi döndürür.
+
+        Args:
+            attempt (int): Başarısız olan denemenin sırası (1'den başlar)
+
+        Returns:
+            float: Bekleme süresi (saniye)
+        """
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** (attempt - 1))))
+
+
+class CircuitBreaker:
+    """
+    Site başına devre kesici.
+
+    Art arda belirli sayıda başarısız istekten sonra devre açılır ve istekler hiç
+    yapılmadan reddedilir. Bekleme süresi dolunca tek bir deneme isteğine izin
+    verilir (yarı açık); başarılı olursa devre kapanır, başarısız olursa yeniden açılır.
+    """
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(self, name, failure_threshold=None, recovery_timeout=None):
+        """
+        Args:
+            name (str): Devrenin adı (host)
+            failure_threshold (int, optional): Devreyi açan art arda hata sayısı
+            recovery_timeout (float, optional): Açık devrenin deneme isteğine izin vermeden önce beklediği süre (saniye)
+        """
+        self.name = name
+        self.failure_threshold = failure_threshold or SCRAPER_CIRCUIT_FAILURE_THRESHOLD
+        self.recovery_timeout = recovery_timeout or SCRAPER_CIRCUIT_RECOVERY_TIMEOUT
+        self._lock = threading.Lock()
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._stats = {}
+        self.reset_stats()
+
+    @property
+    def state(self):
+        with self._lock:
+            return self._state
+
+    def allow_request(self):
+        """
+        İsteğin yapılıp yapılamayacağını döndürür.
+
+        Returns:
+            bool: Devre kapalıysa veya deneme isteği zamanı geldiyse True
+        """
+        with self._lock:
+            if self._state == self.CLOSED:
+                return True
+            if self._state == self.OPEN and time.monotonic() - self._opened_at >= self.recovery_timeout:
+                self._state = self.HALF_OPEN
+                self._probe_in_flight = False
+            if self._state == self.HALF_OPEN and not self._probe_in_flight:
+                # Yalnızca tek bir deneme isteğine izin ver
+                self._probe_in_flight = True
+                self._stats['probes'] += 1
+                logger.info(f"{self.name} devresi yarı açık, deneme isteği yapılıyor")
+                return True
+            self._stats['rejected'] += 1
+            return False
+
+    def record_success(self):
+        """Başarılı isteği kaydeder, devre açıksa kapatır"""
+        with self._lock:
+            if self._state != self.CLOSED:
+                logger.info(f"{self.name} devresi kapandı, istekler yeniden başlıyor")
+            self._state = self.CLOSED
+            self._failures = 0
+            self._probe_in_flight = False
+
+    def record_failure(self):
+        """Başarısız isteği kaydeder, eşik aşılırsa devreyi açar"""
+        with self._lock:
+            self._failures += 1
+            self._stats['failures'] += 1
+            if self._state == self.HALF_OPEN or (
+                self._state == self.CLOSED and self._failures >= self.failure_threshold
+            ):
+                self._state = self.OPEN
+                self._opened_at = time.monotonic()
+                self._probe_in_flight = False
+                self._stats['opened'] += 1
+                logger.warning(f"{self.name} devresi açıldı ({self._failures} art arda hata), "
+                               f"{self.recovery_timeout:.0f} sn boyunca istek yapılmayacak")
+
+    def reset_stats(self):
+        """Sayaçları sıfırlar (devre durumu korunur)"""
+        with self._lock:
+            self._stats = {'failures': 0, 'opened': 0, 'rejected': 0, 'probes': 0}
+
+    def stats(self):
+        """
+        Devre durumunu ve sayaçları döndürür.
+
+        Returns:
+            dict: state, consecutive_failures, failures, opened, rejected, probes
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats['state'] = self._state
+            stats['consecutive_failures'] = self._failures
+        return stats
+
+
+_breakers = {}
+_breakers_lock = threading.Lock()
+
+
+def get_circuit_breaker(host):
+    """
+    Host'un süreç genelinde paylaşılan devre kesicisini döndürür.
+
+    Args:
+        host (str): Host adı
+
+    Returns:
+        CircuitBreaker: Devre kesici
+    """
+    host = host.lower()
+    with _breakers_lock:
+        breaker = _breakers.get(host)
+        if breaker is None:
+            breaker = _breakers[host] = CircuitBreaker(host)
+        return breaker
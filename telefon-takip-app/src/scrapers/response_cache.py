@@ -0,0 +1,220 @@
+import hashlib
+import logging
+import os
+import sqlite3
+import sys
+import threading
+import time
+import zlib
+from urllib.parse import urlparse, urlunparse, parse_qsl, urlencode
+
+# Ana dizini ekle
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from src.config import SCRAPER_CACHE_DIR, SCRAPER_CACHE_MAX_MB, SCRAPER_CACHE_TTLS
+
+logger = logging.getLogger(__name__)
+
+# Önbellek anahtarına dahil edilmeyen izleme parametreleri
+TRACKING_PARAMS = ('utm_', 'gclid', 'fbclid', 'yclid', 'msclkid')
+
+
+def normalize_url(url):
+    """
+    URL'yi önbellek anahtarı olarak kullanılabilecek biçime getirir.
+
+    Şema ve host küçük harfe çevrilir, varsayılan portlar, parça (#) ve izleme
+    parametreleri atılır, sorgu parametreleri sıralanır.
+
+    Args:
+        url (str): Normalleştirilecek URL
+
+    Returns:
+        str: Normalleştirilmiş URL
+    """
+    parsed = urlparse(url.strip())
+    scheme = parsed.scheme.lower()
+    netloc = parsed.netloc.lower()
+    if (scheme == 'http' and netloc.endswith(':80')) or (scheme == 'https' and netloc.endswith(':443')):
+        netloc = netloc.rsplit(':', 1)[0]
+
+    query = sorted(
+        (key, value) for key, value in parse_qsl(parsed.query, keep_blank_values=True)
+        if not key.lower().startswith(TRACKING_PARAMS)
+    )
+    return urlunparse((scheme, netloc, parsed.path or '/', parsed.params, urlencode(query), ''))
+
+
+class ResponseCache:
+    """
+    Sayfa içeriklerini diskte sıkıştırılmış olarak saklayan önbellek.
+
+    Kayıtlar kaynak türüne göre farklı sürelerle geçerlidir (ör. liste sayfaları kısa,
+    özellik sayfaları uzun). Toplam boyut sınırı aşıldığında en uzun süredir
+    kullanılmayan kayıtlar silinir.
+    """
+
+    def __init__(self, db_path, max_size_bytes, ttls=None):
+        """
+        Args:
+            db_path (str): SQLite önbellek dosyasının yolu
+            max_size_bytes (int): Sıkıştırılmış içeriklerin azami toplam boyutu
+            ttls (dict, optional): Kaynak türü -> saniye cinsinden geçerlilik süresi.
+                'default' anahtarı tanımsız türler için kullanılır.
+        """
+        self.db_path = db_path
+        self.max_size_bytes = max_size_bytes
+        self.ttls = ttls or {'default': 3600}
+        self._lock = threading.Lock()
+        self._stats = {}
+
+        os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('''
+        CREATE TABLE IF NOT EXISTS responses (
+            key TEXT PRIMARY KEY,
+            url TEXT NOT NULL,
+            host TEXT,
+            resource_type TEXT,
+            body BLOB,
+            size INTEGER,
+            stored_at REAL,
+            last_access REAL
+        )
+        ''')
+        self._conn.execute('CREATE INDEX IF NOT EXISTS idx_responses_last_access ON responses(last_access)')
+        self._conn.commit()
+        self._total_size = self._conn.execute('SELECT COALESCE(SUM(size), 0) FROM responses').fetchone()[0]
+
+    @staticmethod
+    def _key(url):
+        return hashlib.sha1(normalize_url(url).encode('utf-8')).hexdigest()
+
+    def _ttl(self, resource_type):
+        return self.ttls.get(resource_type, self.ttls.get('default', 3600))
+
+    def _count(self, host, field, amount=1):
+        """İstatistik sayaçlarını host bazında günceller (kilit altında çağrılmalıdır)"""
+        for name in (host, '*'):
+            entry = self._stats.setdefault(name, {'hits': 0, 'misses': 0, 'bytes_saved': 0})
+            entry[field] += amount
+
+    def get(self, url, resource_type='default'):
+        """
+        Önbellekteki geçerli içeriği döndürür.
+
+        Args:
+            url (str): İstenen URL
+            resource_type (str): Kaynak türü (ör. 'listing', 'detail')
+
+        Returns:
+            str: Sayfa içeriği, bulunamazsa veya süresi dolmuşsa None
+        """
+        key = self._key(url)
+        host = urlparse(url).netloc.lower()
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT body, stored_at FROM responses WHERE key = ?', (key,)
+            ).fetchone()
+            if row is None or now - row[1] > self._ttl(resource_type):
+                self._count(host, 'misses')
+                return None
+
+            self._conn.execute('UPDATE responses SET last_access = ? WHERE key = ?', (now, key))
+            self._conn.commit()
+            body = zlib.decompress(row[0]).decode('utf-8')
+            self._count(host, 'hits')
+            self._count(host, 'bytes_saved', len(body))
+            return body
+
+    def set(self, url, body, resource_type='default'):
+        """
+        Sayfa içeriğini önbelleğe yazar.
+
+        Args:
+            url (str): Sayfa URL'si
+            body (str): Sayfa içeriği
+            resource_type (str): Kaynak türü
+        """
+        key = self._key(url)
+        compressed = zlib.compress(body.encode('utf-8'), 6)
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute('SELECT size FROM responses WHERE key = ?', (key,)).fetchone()
+            if row:
+                self._total_size -= row[0]
+            self._conn.execute('''
+            INSERT OR REPLACE INTO responses (key, url, host, resource_type, body, size, stored_at, last_access)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            ''', (key, url, urlparse(url).netloc.lower(), resource_type, compressed, len(compressed), now, now))
+            self._total_size += len(compressed)
+            self._evict()
+            self._conn.commit()
+
+    def _evict(self):
+        """Boyut sınırı aşıldığında en uzun süredir kullanılmayan kayıtları siler (kilit altında)"""
+        if self._total_size <= self.max_size_bytes:
+            return
+
+        # Sürekli silme yapmamak için sınırın %90'ına kadar boşalt
+        target = self.max_size_bytes * 0.9
+        evicted = 0
+        rows = self._conn.execute('SELECT key, size FROM responses ORDER BY last_access ASC').fetchall()
+        for key, size in rows:
+            if self._total_size <= target:
+                break
+            self._conn.execute('DELETE FROM responses WHERE key = ?', (key,))
+            self._total_size -= size
+            evicted += 1
+        logger.info(f"Önbellekten {evicted} kayıt silindi (boyut sınırı: {self.max_size_bytes} bayt)")
+
+    def reset_stats(self, host):
+        """Host'a ait isabet sayaçlarını sıfırlar"""
+        with self._lock:
+            self._stats.pop(host.lower(), None)
+
+    def stats(self, host=None):
+        """
+        Önbellek isabet istatistiklerini döndürür.
+
+        Args:
+            host (str, optional): Yalnızca bu host'a ait sayaçlar (varsayılan: tümü)
+
+        Returns:
+            dict: hits, misses, hit_rate, bytes_saved, entries, size_bytes
+        """
+        with self._lock:
+            counters = dict(self._stats.get(host.lower() if host else '*',
+                                            {'hits': 0, 'misses': 0, 'bytes_saved': 0}))
+            entries = self._conn.execute('SELECT COUNT(*) FROM responses').fetchone()[0]
+            size = self._total_size
+
+        lookups = counters['hits'] + counters['misses']
+        counters['hit_rate'] = round(counters['hits'] / lookups, 3) if lookups else 0.0
+        counters['entries'] = entries
+        counters['size_bytes'] = size
+        return counters
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_response_cache():
+    """
+    Süreç genelinde paylaşılan yanıt önbelleğini döndürür.
+
+    Returns:
+        ResponseCache: Paylaşılan önbellek
+    """
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = ResponseCache(
+                os.path.join(SCRAPER_CACHE_DIR, 'responses.db'),
+                max_size_bytes=SCRAPER_CACHE_MAX_MB * 1024 * 1024,
+                ttls=SCRAPER_CACHE_TTLS
+            )
+        return _cache
@@ -0,0 +1,233 @@
+import json
+import logging
+import re
+
+logger = logging.getLogger(__name__)
+
+# JSON-LD blokları
+JSON_LD_PATTERN = re.compile(
+    r'<script[^>]+type\s*=\s*["\']application/ld\+json["\'][^>]*>(.*?)</script>',
+    re.IGNORECASE | re.DOTALL
+)
+
+# Yalnızca binlik ayırıcı olarak nokta içeren fiyatlar ("24.999", "1.299.000")
+THOUSANDS_PATTERN = re.compile(r'^\d{1,3}(?:\.\d{3})+$')
+
+# Sayfaya gömülü uygulama durumunu tutan değişkenler / script kimlikleri
+EMBEDDED_STATE_NAMES = ('__NEXT_DATA__', '__INITIAL_STATE__', '__PRELOADED_STATE__', '__APOLLO_STATE__')
+
+# Gömülü durumda ürün özelliklerinin bulunabileceği alanlar
+SPEC_LIST_KEYS = ('additionalProperty', 'attributes', 'specifications', 'features', 'specs')
+
+# Gömülü durum ağacında aranacak azami derinlik
+MAX_STATE_DEPTH = 12
+
+_decoder = json.JSONDecoder(strict=False)
+
+
+def _load_json(text):
+    try:
+        return json.loads(text.strip(), strict=False)
+    except ValueError:
+        return None
+
+
+def _is_product(node):
+    node_type = node.get('@type')
+    if isinstance(node_type, list):
+        return 'Product' in node_type
+    return node_type == 'Product'
+
+
+def _walk(node, depth=0):
+    """JSON ağacındaki tüm sözlükleri derinlik sınırı içinde dolaşır"""
+    if depth > MAX_STATE_DEPTH:
+        return
+    if isinstance(node, dict):
+        yield node
+        for value in node.values():
+            if isinstance(value, (dict, list)):
+                yield from _walk(value, depth + 1)
+    elif isinstance(node, list):
+        for item in node:
+            if isinstance(item, (dict, list)):
+                yield from _walk(item, depth + 1)
+
+
+def extract_json_ld(html):
+    """
+    Sayfadaki JSON-LD bloklarını DOM oluşturmadan çözer.
+
+    Args:
+        html (str): Sayfanın HTML içeriği
+
+    Returns:
+        list: Çözülebilen JSON nesneleri
+    """
+    blocks = []
+    for match in JSON_LD_PATTERN.finditer(html):
+        data = _load_json(match.group(1))
+        if data is not None:
+            blocks.append(data)
+    return blocks
+
+
+def extract_embedded_state(html, names=EMBEDDED_STATE_NAMES):
+    """
+    Sayfaya gömülü uygulama durumunu (ör. window.__INITIAL_STATE__ veya __NEXT_DATA__) çözer.
+
+    Args:
+        html (str): Sayfanın HTML içeriği
+        names (tuple): Aranacak değişken / script kimliği adları
+
+    Returns:
+        list: Çözülebilen JSON nesneleri
+    """
+    states = []
+    for name in names:
+        if name not in html:
+            continue
+        # <script id="__NEXT_DATA__" type="application/json">{...}</script>
+        match = re.search(
+            rf'<script[^>]+id\s*=\s*["\']{re.escape(name)}["\'][^>]*>(.*?)</script>', html, re.DOTALL
+        )
+        if match:
+            data = _load_json(match.group(1))
+            if data is not None:
+                states.append(data)
+                continue
+        # window.__INITIAL_STATE__ = {...};
+        match = re.search(rf'{re.escape(name)}\s*=\s*(?=[{{\[])', html)
+        if match:
+            try:
+                data, _ = _decoder.raw_decode(html, match.end())
+                states.append(data)
+            except ValueError:
+                logger.debug(f"Gömülü durum çözülemedi: {name}")
+    return states
+
+
+def parse_price(value):
+    """
+    Yapısal verideki fiyatı sayıya çevirir.
+
+    schema.org fiyatları nokta ondalık ayırıcı kullanır ("24999.00"); gömülü
+    durumda Türkçe biçim ("24.999,00 TL", "24.999") de görülebilir. Her iki ayırıcı
+    varsa sondaki ondalıktır; yalnızca nokta varsa ve üçlü gruplar halindeyse
+    binlik ayırıcı sayılır.
+
+    Returns:
+        float: Fiyat, çözülemezse 0.0
+    """
+    if isinstance(value, dict):
+        value = value.get('value', value.get('price'))
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value)
+    if not isinstance(value, str):
+        return 0.0
+    text = re.sub(r'[^\d.,]', '', value)
+    if ',' in text and '.' in text:
+        thousands = '.' if text.rfind(',') > text.rfind('.') else ','
+        text = text.replace(thousands, '').replace(',', '.')
+    elif ',' in text:
+        text = text.replace(',', '.')
+    elif THOUSANDS_PATTERN.match(text):
+        text = text.replace('.', '')
+    try:
+        return float(text)
+    except ValueError:
+        return 0.0
+
+
+def _offer_price(offers):
+    if isinstance(offers, list):
+        prices = [price for price in (_offer_price(offer) for offer in offers) if price]
+        return min(prices) if prices else 0.0
+    if not isinstance(offers, dict):
+        return parse_price(offers)
+    for key in ('price', 'lowPrice'):
+        if offers.get(key) not in (None, ''):
+            return parse_price(offers[key])
+    specification = offers.get('priceSpecification')
+    if isinstance(specification, list):
+        specification = specification[0] if specification else None
+    if isinstance(specification, dict):
+        return parse_price(specification.get('price'))
+    return 0.0
+
+
+def _text(value):
+    """Ad/marka/görsel alanlarını düz metne çevirir"""
+    if isinstance(value, list):
+        value = value[0] if value else ''
+    if isinstance(value, dict):
+        value = value.get('name') or value.get('url') or value.get('value') or ''
+    return str(value).strip() if value is not None else ''
+
+
+def _specs(node):
+    """Ürünün özellik listesini {etiket: değer} sözlüğüne çevirir"""
+    specs = {}
+    for key in SPEC_LIST_KEYS:
+        items = node.get(key)
+        if isinstance(items, dict):
+            items = [{'name': name, 'value': value} for name, value in items.items()]
+        if not isinstance(items, list):
+            continue
+        for item in items:
+            if not isinstance(item, dict):
+                continue
+            name = _text(item.get('name') or item.get('key') or item.get('label'))
+            value = item.get('value', item.get('values'))
+            if isinstance(value, list):
+                value = ', '.join(_text(v) for v in value)
+            value = _text(value)
+            if name and value:
+                specs[name] = value
+    return specs
+
+
+def _normalize_product(node):
+    price = _offer_price(node.get('offers')) if 'offers' in node else parse_price(node.get('price'))
+    return {
+        'name': _text(node.get('name')),
+        'brand': _text(node.get('brand')),
+        'price': price,
+        'image_url': _text(node.get('image') or node.get('images')),
+        'specs': _specs(node)
+    }
+
+
+def _looks_like_product(node):
+    """Gömülü durumdaki ürün nesnelerini tanır (ad ve fiyat/teklif içeren sözlük)"""
+    return isinstance(node.get('name'), str) and ('offers' in node or 'price' in node)
+
+
+def extract_product(html, state_names=EMBEDDED_STATE_NAMES):
+    """
+    Sayfadaki ürün bilgilerini yapısal veriden çıkarır.
+
+    Önce JSON-LD Product blokları, bulunamazsa gömülü uygulama durumu aranır.
+    Ad ve fiyat içermeyen adaylar atlanır.
+
+    Args:
+        html (str): Sayfanın HTML içeriği
+        state_names (tuple): Aranacak gömülü durum adları
+
+    Returns:
+        dict: name, brand, price, image_url, specs ({etiket: değer}); bulunamazsa None
+    """
+    for block in extract_json_ld(html):
+        for node in _walk(block):
+            if _is_product(node):
+                product = _normalize_product(node)
+                if product['name'] and product['price']:
+                    return product
+
+    for state in extract_embedded_state(html, state_names):
+        for node in _walk(state):
+            if _is_product(node) or _looks_like_product(node):
+                product = _normalize_product(node)
+                if product['name'] and product['price']:
+                    return product
+    return None
@@ -3,14 +3,13 @@ import logging
 from urllib.parse import urljoin
 import os
 import sys
-import requests
-from bs4 import BeautifulSoup
 
 # Ana dizini ekle
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
-from src.scrapers.base_scraper import BaseScraper
-from src.config import TEKNOSA_URL, FIRECRAWL_API_KEY
+from src.scrapers.base_scraper import BaseScraper, FIRECRAWL_DETAIL_PARAMS
+from src.scrapers.firecrawl_cache import CachedFirecrawlApp
+from src.config import TEKNOSA_URL, FIRECRAWL_API_KEY, FIRECRAWL_API_URL
 
 # Firecrawl kütüphanesini import et
 try:
@@ -25,6 +24,21 @@ class TeknosaWebScraper(BaseScraper):
     Teknosa sitesinden telefon verilerini çekmek için scraper sınıfı.
     """
     
+    # Selenium ile açılan sayfalarda beklenecek öğeler
+    listing_ready_selector = '.product-card'
+    detail_ready_selector = '.pdp-title'
+    # Selenium ile açılan sayfalarda engellenecek ürün görseli CDN'i
+    blocked_url_patterns = ['*img-teknosa*.mncdn.com/*']
+    # Hedefli ayrıştırmada tutulacak liste sayfası bölümleri (sayfalama ve ürün kartları)
+    listing_parse_classes = ['pagination', 'product-card']
+    # Hedefli ayrıştırmada tutulacak detay sayfası bölümleri (başlık, fiyat, görsel, özellikler)
+    detail_parse_classes = ['pdp-title', 'price-tag', 'product-image', 'product-feature-list']
+    # Liste sayfalarındaki ürün kartları, ürün adı, fiyat ve rozet
+    listing_item_selector = '.product-card'
+    listing_name_selector = '.prd-title, .product-name'
+    listing_price_selector = '.prc, .price'
+    listing_badge_selector = '.prd-badge, .badge'
+    
     def __init__(self):
         super().__init__(TEKNOSA_URL, "Teknosa")
         self.logger = logging.getLogger("scraper.teknosa")
@@ -33,7 +47,8 @@ class TeknosaWebScraper(BaseScraper):
         
         # Firecrawl istemcisini başlat
         if FIRECRAWL_AVAILABLE and FIRECRAWL_API_KEY:
-            self.firecrawl = FirecrawlApp(api_key=FIRECRAWL_API_KEY)
+            # Sonuçlar önbelleklenir, aynı sayfa için eşzamanlı istekler tek çağrıyı paylaşır
+            self.firecrawl = CachedFirecrawlApp(FirecrawlApp(api_key=FIRECRAWL_API_KEY, api_url=FIRECRAWL_API_URL))
             self.logger.info("Firecrawl API istemcisi başlatıldı")
         else:
             self.firecrawl = None
@@ -43,12 +58,8 @@ class TeknosaWebScraper(BaseScraper):
         """Eski metod - geriye uyumluluk için"""
         return self.scrape_all_phones()
     
-    def scrape_all_phones(self, progress_callback=None):
-        """Tüm telefonları çek"""
-        phones = []
-        page = 1
-        total_pages = 1
-        
+    def iter_phones(self, progress_callback=None):
+        """Tüm telefonları çeker, her kaydı hazır olur olmaz döndürür"""
         try:
             # İlk sayfayı çek ve toplam sayfa sayısını bul
             self.logger.info(f"Teknosa veri çekme başlıyor - URL: {self.phones_url}")
@@ -61,65 +72,23 @@ class TeknosaWebScraper(BaseScraper):
             if self.firecrawl:
                 self.logger.info("Firecrawl ile veri çekme deneniyor...")
                 try:
-                    # Doğrudan scrape_url kullanarak sayfayı çek
-                    scrape_result = self.firecrawl.scrape_url(
-                        url=self.phones_url,
-                        params={
-                            'formats': ['markdown', 'html', 'links']
-                        }
-                    )
+                    # Tüm liste sayfalarını Firecrawl ile tara
+                    product_links = self._crawl_listing_pages_firecrawl(progress_callback=progress_callback)
                     
-                    # Sonuç doğrudan dict olarak gelecek
-                    if scrape_result and 'links' in scrape_result:
-                        links = scrape_result.get('links', [])
-                        self.logger.info(f"Firecrawl ile {len(links)} bağlantı bulundu")
-                        
-                        # Ürün bağlantılarını filtrele
-                        product_links = []
-                        for link in links:
-                            # Link formatı değişti, artık string olarak geliyor
-                            if isinstance(link, str):
-                                href = link
-                                # Teknosa ürün URL'lerini kontrol et
-                                if '/p/' in href and ('telefon' in href.lower() or 'cep-telefon' in href.lower()):
-                                    full_url = href if href.startswith('http') else urljoin(self.base_url, href)
-                                    # Ürün başlığını URL'den çıkarabiliriz
-                                    product_name = href.split('/')[-1].replace('-', ' ').title()
-                                    product_links.append({
-                                        'url': full_url,
-                                        'text': product_name
-                                    })
-                        
+                    if product_links:
                         self.logger.info(f"Firecrawl'dan {len(product_links)} ürün bağlantısı çıkarıldı")
                         
-                        # Her ürün için detayları çek (ilk 10 ürün)
-                        for i, product in enumerate(product_links[:10]):
-                            try:
-                                # İlerleme durumunu güncelle
-                                if progress_callback:
-                                    progress = min(10 + int((i+1) / len(product_links[:10]) * 60), 70)
-                                    progress_callback(progress, 100)
-                                
-                                # Detay sayfasını çek ve telefon listesine ekle
-                                details = self.get_phone_details(product['url'])
-                                if details:
-                                    phone_data = {
-                                        "model": product['text'] or details.get('name', 'Bilinmeyen Model'),
-                                        "price": details.get('price', 0),
-                                        "specs": details.get('specs', {}),
-                                        "source": "Teknosa",
-                                        "source_url": product['url']
-                                    }
-                                    phones.append(phone_data)
-                            except Exception as e:
-                                self.logger.error(f"Ürün detayı çekme hatası: {str(e)}")
-                                continue
+                        # Ürün detaylarını paralel olarak çek, hazır olan kaydı hemen döndür
+                        found = False
+                        for phone in self._iter_product_details(product_links, progress_callback):
+                            found = True
+                            yield phone
                         
-                        if phones:
+                        if found:
                             # Başarıyla veri çekildi
                             if progress_callback:
                                 progress_callback(100, 100, message="Veri çekme işlemi tamamlandı")
-                            return phones
+                            return
                         
                     self.logger.warning("Firecrawl ile verilerden ürün çıkarılamadı")
                 except Exception as e:
@@ -139,58 +108,61 @@ class TeknosaWebScraper(BaseScraper):
             }
             
             try:
-                self.logger.debug(f"İlk sayfa istek yapılıyor: {self.phones_url}?page={page}")
-                response = requests.get(
-                    f"{self.phones_url}?page={page}", 
-                    headers=headers,
-                    timeout=30
-                )
-                self.logger.debug(f"İlk sayfa yanıt kodu: {response.status_code}")
+                # Tüm liste sayfalarını tara ve ürün bağlantılarını topla
+                product_links = self._crawl_listing_pages(headers=headers, progress_callback=progress_callback)
                 
-                if response.status_code != 200:
-                    self.logger.error(f"İlk sayfa çekilemedi. Durum kodu: {response.status_code}")
+                if product_links is None:
+                    self.logger.error("İlk sayfa çekilemedi")
                     if progress_callback:
-                        progress_callback(0, 100, error=f"Teknosa'ya bağlanılamadı. Durum kodu: {response.status_code}")
-                    return []
+                        progress_callback(0, 100, error="Teknosa'ya bağlanılamadı.")
+                    return
                 
-                # Sayfa yapısına göre telefonları çekmeye çalış
-                soup = BeautifulSoup(response.content, 'html.parser')
+                if not product_links:
+                    self.logger.warning("Liste sayfalarında telefon ürünleri bulunamadı")
+                    return
                 
-                # Toplam sayfa sayısını bul (varsa)
-                pagination = soup.select('.pagination .page-item')
-                if pagination:
-                    try:
-                        # Son sayfa numarasını bul
-                        last_page_elem = pagination[-2].text.strip()  # Son element genelde "Next" olur, ondan önceki
-                        total_pages = int(last_page_elem)
-                        self.logger.debug(f"Toplam sayfa sayısı: {total_pages}")
-                    except (ValueError, IndexError) as e:
-                        self.logger.warning(f"Sayfa sayısı belirlenemedi: {e}")
-                        total_pages = 1
-                
-                # Mevcut sayfadaki telefonları çek
-                phone_items = soup.select('.product-card')
-                
-                if not phone_items:
-                    self.logger.warning("İlk sayfada telefon ürünleri bulunamadı")
-                    return []
-                
-                # İsteğe göre daha fazla sayfa çekilebilir
-                # Ancak şimdilik boş döndürelim
-                self.logger.info("Teknosa veri çekme tamamlandı, ancak ürünler işlenemedi")
-                return []
+                # Ürün detaylarını paralel olarak çek, hazır olan kaydı hemen döndür
+                yield from self._iter_product_details(product_links, progress_callback)
                 
+                if progress_callback:
+                    progress_callback(100, 100, message="Veri çekme işlemi tamamlandı")
+                return
+            
             except Exception as e:
                 self.logger.error(f"İlk sayfa yükleme hatası: {str(e)}")
                 if progress_callback:
                     progress_callback(0, 100, error=f"Sayfa yüklenirken hata: {str(e)}")
-                return []
+                return
         
         except Exception as e:
             self.logger.error(f"Sayfa çekme genel hatası: {str(e)}", exc_info=True)
             if progress_callback:
                 progress_callback(0, 100, error=f"Genel hata: {str(e)}")
-            return []
+            return
+    
+    def _firecrawl_product_link(self, href):
+        """Firecrawl bağlantılarından Teknosa ürün sayfalarını seçer"""
+        # Teknosa ürün URL'lerini kontrol et
+        if '/p/' in href and ('telefon' in href.lower() or 'cep-telefon' in href.lower()):
+            full_url = href if href.startswith('http') else urljoin(self.base_url, href)
+            # Ürün başlığını URL'den çıkarabiliriz
+            product_name = href.split('/')[-1].replace('-', ' ').title()
+            return {'url': full_url, 'text': product_name}
+        return None
+    
+    def _get_total_pages(self, soup):
+        """Liste sayfasındaki sayfalama öğelerinden toplam sayfa sayısını bulur"""
+        pagination = soup.select('.pagination .page-item')
+        if not pagination:
+            return 1
+        try:
+            # Son element genelde "Next" olur, ondan önceki son sayfa numarasıdır
+            total_pages = int(pagination[-2].text.strip())
+            self.logger.debug(f"Toplam sayfa sayısı: {total_pages}")
+            return total_pages
+        except (ValueError, IndexError) as e:
+            self.logger.warning(f"Sayfa sayısı belirlenemedi: {e}")
+            return 1
     
     def _generate_test_data(self, count=10, progress_callback=None):
         """Test verisi oluşturur"""
@@ -272,33 +244,42 @@ class TeknosaWebScraper(BaseScraper):
                         self.logger.error(f"Özellik işleme hatası: {str(e)}")
                         continue
             
-            # Önemli özellikleri düzenle
-            processed_specs = {
-                "processor": specs.get("İşlemci", ""),
-                "ram_rom": f"{specs.get('RAM', '')} + {specs.get('Dahili Depolama', '')}",
-                "screen": specs.get("Ekran Boyutu", ""),
-                "battery_charging": f"{specs.get('Batarya Kapasitesi', '')} - {specs.get('Şarj Gücü', '')}",
-                "display_body_ratio": specs.get("Ekran/Gövde Oranı", ""),
-                "front_camera": specs.get("Ön Kamera", ""),
-                "rear_cameras": specs.get("Arka Kamera", ""),
-                "additional_features": ", ".join([
-                    specs.get("NFC", ""),
-                    specs.get("Su Geçirmezlik", ""),
-                    specs.get("Ses Özellikleri", "")
-                ]).strip(", "),
-                "network_connectivity": ", ".join([
-                    specs.get("Mobil Bağlantı", ""),
-                    specs.get("Wi-Fi", ""),
-                    specs.get("Bluetooth", "")
-                ]).strip(", ")
-            }
-            
-            return processed_specs
+            return self._process_specs(specs)
             
         except Exception as e:
             self.logger.error(f"Özellik çekme hatası: {str(e)}")
             return {}
     
+    def _process_specs(self, specs):
+        """
+        Sitenin özellik etiketlerini ortak özellik alanlarına dönüştürür.
+        
+        Args:
+            specs (dict): Etiket -> değer
+            
+        Returns:
+            dict: Düzenlenmiş özellikler
+        """
+        return {
+            "processor": specs.get("İşlemci", ""),
+            "ram_rom": f"{specs.get('RAM', '')} + {specs.get('Dahili Depolama', '')}",
+            "screen": specs.get("Ekran Boyutu", ""),
+            "battery_charging": f"{specs.get('Batarya Kapasitesi', '')} - {specs.get('Şarj Gücü', '')}",
+            "display_body_ratio": specs.get("Ekran/Gövde Oranı", ""),
+            "front_camera": specs.get("Ön Kamera", ""),
+            "rear_cameras": specs.get("Arka Kamera", ""),
+            "additional_features": ", ".join([
+                specs.get("NFC", ""),
+                specs.get("Su Geçirmezlik", ""),
+                specs.get("Ses Özellikleri", "")
+            ]).strip(", "),
+            "network_connectivity": ", ".join([
+                specs.get("Mobil Bağlantı", ""),
+                specs.get("Wi-Fi", ""),
+                specs.get("Bluetooth", "")
+            ]).strip(", ")
+        }
+    
     def get_phone_details(self, url):
         """
         Teknosa'dan belirli bir telefonun detaylarını çeker.
@@ -315,62 +296,33 @@ class TeknosaWebScraper(BaseScraper):
         if self.firecrawl:
             try:
                 # Firecrawl ile ürün detayını çek
-                scrape_result = self.firecrawl.scrape_url(
-                    url=url,
-                    params={
-                        'formats': ['markdown', 'json'],
-                        'jsonOptions': {
-                            'prompt': "Extract the following smartphone information: name, brand, price, screen size, processor, RAM, storage, battery, camera details"
-                        }
-                    }
-                )
+                scrape_result = self.firecrawl.scrape_url(url=url, params=FIRECRAWL_DETAIL_PARAMS)
                 
-                # scrape_result doğrudan dict olarak gelir
+                # scrape_result doğrudan dict olarak dönüyor
                 if scrape_result and 'json' in scrape_result:
-                    json_data = scrape_result['json']
                     self.logger.info("Firecrawl ile telefon detayları alındı")
-                    
-                    # Veriyi işle ve formatla
-                    name = json_data.get('name', '')
-                    price_text = json_data.get('price', '0')
-                    price = self._normalize_price(price_text) if isinstance(price_text, str) else price_text
-                    
-                    # Marka ve model
-                    brand = json_data.get('brand', '')
-                    if not brand and ' ' in name:
-                        brand = name.split(" ")[0]
-                    
-                    # Özellikleri düzenle
-                    processed_specs = {
-                        "processor": json_data.get("processor", ""),
-                        "ram_rom": f"{json_data.get('RAM', '')} + {json_data.get('storage', '')}",
-                        "screen": json_data.get("screen_size", ""),
-                        "battery_charging": json_data.get("battery", ""),
-                        "front_camera": "",
-                        "rear_cameras": json_data.get("camera_details", ""),
-                        "additional_features": "",
-                        "network_connectivity": ""
-                    }
-                    
-                    return {
-                        "name": name,
-                        "brand": brand,
-                        "price": price,
-                        "url": url,
-                        "source": self.site_name,
-                        "specs": processed_specs
-                    }
-            
+                    return self._details_from_firecrawl(url, scrape_result['json'])
+                
                 self.logger.warning("Firecrawl telefon detaylarını çekemedi")
             except Exception as e:
                 self.logger.error(f"Firecrawl ile detay çekme hatası: {str(e)}")
         
         # Normal scraping ile dene
-        try:
-            response = requests.get(url, headers=self.headers, timeout=30)
-            response.raise_for_status()
+        return self._fetch_phone_details(url)
+    
+    def _parse_phone_details(self, url, html):
+        """
+        Detay sayfasının HTML içeriğinden telefon bilgilerini çıkarır.
+        
+        Args:
+            url (str): Telefonun detay sayfasının URL'si
+            html (str): Detay sayfasının HTML içeriği
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+        Returns:
+            dict: Telefonun özellikleri
+        """
+        try:
+            soup = self._parse_html(html, self.detail_parse_classes)
             
             # Temel bilgileri çıkar
             name = ""
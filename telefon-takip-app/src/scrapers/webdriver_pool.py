@@ -0,0 +1,322 @@
+import atexit
+import logging
+import os
+import queue
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from functools import lru_cache
+
+from selenium import webdriver
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service
+from webdriver_manager.chrome import ChromeDriverManager
+
+# Ana dizini ekle
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from src.config import (
+    SELENIUM_POOL_SIZE, SELENIUM_MAX_PAGES_PER_DRIVER, SELENIUM_BLOCK_RESOURCES,
+    SELENIUM_PAGE_LOAD_TIMEOUT, SELENIUM_SCRIPT_TIMEOUT, SELENIUM_ACQUIRE_TIMEOUT
+)
+
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=1)
+def get_chromedriver_path():
+    """
+    ChromeDriver ikili dosyasının yolunu süreç başına bir kez çözer.
+
+    Returns:
+        str: ChromeDriver dosya yolu
+    """
+    path = ChromeDriverManager().install()
+    logger.info(f"ChromeDriver yolu: {path}")
+    return path
+
+
+# Fiyat ve özellik çıkarımı için gereksiz olan kaynaklar
+DEFAULT_BLOCKED_URL_PATTERNS = [
+    # Görseller
+    '*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp', '*.avif', '*.svg', '*.ico',
+    # Yazı tipleri
+    '*.woff', '*.woff2', '*.ttf', '*.otf', '*.eot',
+    # Video
+    '*.mp4', '*.webm',
+    # Analitik ve reklam
+    '*google-analytics.com*', '*googletagmanager.com*', '*doubleclick.net*',
+    '*googlesyndication.com*', '*facebook.net*', '*hotjar.com*', '*criteo.com*',
+    '*criteo.net*', '*clarity.ms*', '*yandex.ru/metrika*', '*tiktok.com*'
+]
+
+
+def build_blocked_url_patterns(blocked=None, allowed=None):
+    """
+    Sürücüde engellenecek URL desenlerini oluşturur.
+
+    Args:
+        blocked (list, optional): Varsayılanlara ek olarak engellenecek desenler
+        allowed (list, optional): Engelleme listesinden çıkarılacak desenler
+
+    Returns:
+        list: Engellenecek URL desenleri
+    """
+    allowed = set(allowed or [])
+    patterns = []
+    for pattern in DEFAULT_BLOCKED_URL_PATTERNS + list(blocked or []):
+        if pattern not in allowed and pattern not in patterns:
+            patterns.append(pattern)
+    return patterns
+
+
+# Sayfanın ağ trafiği bitene kadar beklemeyi belirten hazır olma koşulu
+NETWORK_IDLE = 'networkidle'
+
+
+def _network_idle(idle_time=0.5):
+    """
+    Belge yüklendikten sonra yeni kaynak isteği yapılmadığında sağlanan koşul.
+
+    Args:
+        idle_time (float): Kaynak sayısının değişmeden kalması gereken süre (saniye)
+    """
+    state = {'count': -1, 'since': 0.0}
+
+    def condition(driver):
+        if driver.execute_script("return document.readyState") != 'complete':
+            return False
+        count = driver.execute_script("return performance.getEntriesByType('resource').length")
+        now = time.monotonic()
+        if count != state['count']:
+            state['count'] = count
+            state['since'] = now
+            return False
+        return now - state['since'] >= idle_time
+
+    return condition
+
+
+def wait_for_page_ready(driver, ready_condition=None, max_wait=15):
+    """
+    Sayfa içeriği hazır olana kadar bekler.
+
+    Args:
+        driver (webdriver.Chrome): Sayfayı açmış sürücü
+        ready_condition (str, optional): Beklenecek CSS seçicisi veya NETWORK_IDLE.
+            Belirtilmezse belgenin yüklenmesi beklenir.
+        max_wait (float): Azami bekleme süresi (saniye)
+
+    Returns:
+        tuple: (koşul sağlandı mı, geçen süre)
+    """
+    if ready_condition == NETWORK_IDLE:
+        condition = _network_idle()
+    elif ready_condition:
+        condition = EC.presence_of_element_located((By.CSS_SELECTOR, ready_condition))
+    else:
+        condition = lambda d: d.execute_script("return document.readyState") == 'complete'
+
+    started = time.monotonic()
+    try:
+        WebDriverWait(driver, max_wait, poll_frequency=0.1).until(condition)
+        return True, time.monotonic() - started
+    except TimeoutException:
+        return False, time.monotonic() - started
+
+
+class WebDriverPoolExhausted(TimeoutError):
+    """Havuzdaki tüm sürücüler kullanımdayken bekleme süresi dolduğunda fırlatılır"""
+
+
+class WebDriverPool:
+    """
+    Sıcak tutulan headless Chrome sürücülerinden oluşan havuz.
+
+    Sürücüler istek başına kiralanır ve işlem bitince havuza geri döner.
+    Belirli sayıda sayfa açan veya hata veren sürücü kapatılıp yenisiyle değiştirilir.
+    Takılan bir sayfa yüklemesi sürücüyü sayfa yükleme zaman aşımından uzun
+    meşgul etmez; havuz doluyken kiralama da süresiz beklemez.
+    """
+
+    def __init__(self, size=2, max_pages=50, block_resources=True, page_load_timeout=None,
+                 script_timeout=None, acquire_timeout=None):
+        """
+        Args:
+            size (int): Aynı anda açık tutulabilecek azami sürücü sayısı
+            max_pages (int): Bir sürücünün yenilenmeden önce açabileceği sayfa sayısı
+            block_resources (bool): Görsel, yazı tipi ve izleyicilerin yüklenmesini engelle
+            page_load_timeout (float, optional): driver.get için azami süre (saniye)
+            script_timeout (float, optional): Asenkron betikler için azami süre (saniye)
+            acquire_timeout (float, optional): Boşta sürücü için varsayılan azami bekleme (saniye)
+        """
+        self.size = max(size, 1)
+        self.max_pages = max_pages
+        self.block_resources = block_resources
+        self.page_load_timeout = page_load_timeout or SELENIUM_PAGE_LOAD_TIMEOUT
+        self.script_timeout = script_timeout or SELENIUM_SCRIPT_TIMEOUT
+        self.acquire_timeout = acquire_timeout or SELENIUM_ACQUIRE_TIMEOUT
+        self._idle = queue.LifoQueue()
+        self._lock = threading.Lock()
+        self._created = 0
+        self._page_counts = {}
+
+    def _create_driver(self):
+        """Yeni bir headless Chrome sürücüsü başlatır"""
+        options = Options()
+        options.add_argument('--headless')
+        options.add_argument('--no-sandbox')
+        options.add_argument('--disable-dev-shm-usage')
+        if self.block_resources:
+            # Görselleri tamamen kapat
+            options.add_argument('--blink-settings=imagesEnabled=false')
+            options.add_experimental_option('prefs', {
+                'profile.managed_default_content_settings.images': 2
+            })
+
+        service = Service(get_chromedriver_path())
+        driver = webdriver.Chrome(service=service, options=options)
+        # Takılan sayfa yüklemesi sürücüyü varsayılan 300 sn boyunca meşgul etmesin
+        driver.set_page_load_timeout(self.page_load_timeout)
+        driver.set_script_timeout(self.script_timeout)
+        if self.block_resources:
+            driver.execute_cdp_cmd('Network.enable', {})
+        self._page_counts[id(driver)] = 0
+        logger.debug("Yeni Selenium sürücüsü başlatıldı")
+        return driver
+
+    def _discard(self, driver):
+        """Sürücüyü kapatır ve havuz kapasitesini serbest bırakır"""
+        try:
+            driver.quit()
+        except Exception as e:
+            logger.warning(f"Selenium sürücüsü kapatılırken hata oluştu: {str(e)}")
+        with self._lock:
+            self._created -= 1
+            self._page_counts.pop(id(driver), None)
+
+    def _acquire(self, timeout):
+        """
+        Boşta bir sürücü alır, gerekirse yenisini oluşturur.
+
+        Raises:
+            WebDriverPoolExhausted: Süre içinde boşta sürücü bulunamazsa
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                return self._idle.get_nowait()
+            except queue.Empty:
+                pass
+
+            with self._lock:
+                can_create = self._created < self.size
+                if can_create:
+                    self._created += 1
+            if can_create:
+                try:
+                    return self._create_driver()
+                except Exception:
+                    with self._lock:
+                        self._created -= 1
+                    raise
+
+            # Kapasite dolu; bir sürücünün geri dönmesini bekle
+            wait = min(1.0, deadline - time.monotonic())
+            if wait <= 0:
+                raise WebDriverPoolExhausted(
+                    f"{timeout:g} sn içinde boşta Selenium sürücüsü bulunamadı "
+                    f"(havuzdaki {self.size} sürücünün tümü kullanımda)"
+                )
+            try:
+                return self._idle.get(timeout=wait)
+            except queue.Empty:
+                continue
+
+    def _release(self, driver, broken=False):
+        """Sürücüyü havuza geri verir veya gerekiyorsa yeniler"""
+        with self._lock:
+            pages = self._page_counts.get(id(driver), 0) + 1
+            self._page_counts[id(driver)] = pages
+
+        if broken:
+            logger.warning("Hata veren Selenium sürücüsü yenileniyor")
+            self._discard(driver)
+        elif self.max_pages and pages >= self.max_pages:
+            logger.debug(f"Selenium sürücüsü {pages} sayfa sonrası yenileniyor")
+            self._discard(driver)
+        else:
+            self._idle.put(driver)
+
+    @contextmanager
+    def lease(self, timeout=None, blocked_urls=None):
+        """
+        Havuzdan bir sürücü kiralar.
+
+        Args:
+            timeout (float, optional): Boşta sürücü için azami bekleme süresi
+                (varsayılan: acquire_timeout)
+            blocked_urls (list, optional): Bu kiralama boyunca engellenecek URL desenleri
+                (varsayılan: DEFAULT_BLOCKED_URL_PATTERNS)
+
+        Yields:
+            webdriver.Chrome: Kullanıma hazır sürücü
+
+        Raises:
+            WebDriverPoolExhausted: Süre içinde boşta sürücü bulunamazsa
+        """
+        driver = self._acquire(timeout or self.acquire_timeout)
+        broken = False
+        try:
+            if self.block_resources:
+                # Sürücüler siteler arasında paylaşıldığından desenler her kiralamada yeniden ayarlanır
+                patterns = DEFAULT_BLOCKED_URL_PATTERNS if blocked_urls is None else blocked_urls
+                driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': patterns})
+            yield driver
+        except TimeoutException:
+            # Sayfanın geç yüklenmesi sürücünün bozulduğu anlamına gelmez
+            raise
+        except Exception:
+            # Çöken chromedriver çoğu zaman WebDriverException yerine urllib3 /
+            # bağlantı hatası fırlatır; bu sürücü havuza geri konmaz
+            broken = True
+            raise
+        finally:
+            self._release(driver, broken)
+
+    def close(self):
+        """Boştaki tüm sürücüleri kapatır"""
+        while True:
+            try:
+                driver = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._discard(driver)
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_webdriver_pool():
+    """
+    Süreç genelinde paylaşılan sürücü havuzunu döndürür.
+
+    Returns:
+        WebDriverPool: Paylaşılan havuz
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = WebDriverPool(
+                size=SELENIUM_POOL_SIZE,
+                max_pages=SELENIUM_MAX_PAGES_PER_DRIVER,
+                block_resources=SELENIUM_BLOCK_RESOURCES
+            )
+            atexit.register(_pool.close)
+        return _pool
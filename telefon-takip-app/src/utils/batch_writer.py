@@ -0,0 +1,131 @@
+import logging
+import queue
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+# Yazıcıyı durdurmak için kuyruğa konan işaret
+_STOP = object()
+
+
+class MicroBatchWriter:
+    """
+    Kayıtları küçük gruplar halinde arka planda kalıcı hale getirir.
+
+    Kayıtlar kuyruğa eklenir; grup dolduğunda veya ilk kaydın üzerinden
+    max_latency saniye geçtiğinde flush fonksiyonu çağrılır. Kuyruk sınırlı
+    olduğundan yazma yavaş kalırsa üreticiler bekler ve bellek kullanımı sabit kalır.
+    close() çağrıldıktan sonra eklenen kayıtlar kuyruğa alınmaz, reddedilir.
+    """
+
+    def __init__(self, flush, batch_size=25, max_latency=2.0, on_flush=None, max_pending=None):
+        """
+        Args:
+            flush (callable): Kayıt listesini alıp kaydedilen kayıt sayısını döndüren fonksiyon
+            batch_size (int): Bir gruptaki azami kayıt sayısı
+            max_latency (float): Bir kaydın yazılmadan önce bekleyebileceği azami süre (saniye)
+            on_flush (callable, optional): Her yazmadan sonra (grup, kaydedilen sayı) ile çağrılır
+            max_pending (int, optional): Kuyrukta bekleyebilecek azami kayıt (varsayılan: 4 grup)
+        """
+        self.flush = flush
+        self.batch_size = max(batch_size, 1)
+        self.max_latency = max_latency
+        self.on_flush = on_flush
+        self._queue = queue.Queue(maxsize=max_pending or self.batch_size * 4)
+        self._stats_lock = threading.Lock()
+        self._stats = {'received': 0, 'saved': 0, 'batches': 0, 'failed_batches': 0, 'rejected': 0}
+        # Kuyruğa ekleme ile kapatmayı sıralar; durdurma işaretinden sonra kayıt eklenemez
+        self._add_lock = threading.Lock()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name='batch-writer', daemon=True)
+        self._thread.start()
+
+    def add(self, record):
+        """
+        Kaydı yazma kuyruğuna ekler (kuyruk doluysa yer açılana kadar bekler).
+
+        Returns:
+            bool: Kayıt kuyruğa alındıysa True, yazıcı kapatıldığı için reddedildiyse False
+        """
+        with self._add_lock:
+            if not self._closed:
+                with self._stats_lock:
+                    self._stats['received'] += 1
+                self._queue.put(record)
+                return True
+
+        with self._stats_lock:
+            self._stats['rejected'] += 1
+        logger.warning("Yazıcı kapatıldıktan sonra gelen kayıt reddedildi")
+        return False
+
+    def _write(self, batch):
+        """Grubu yazar ve istatistikleri günceller (yazıcı iş parçacığında çalışır)"""
+        try:
+            saved = self.flush(batch) or 0
+            with self._stats_lock:
+                self._stats['saved'] += saved
+                self._stats['batches'] += 1
+        except Exception as e:
+            saved = 0
+            logger.error(f"Kayıt grubu yazılamadı ({len(batch)} kayıt): {str(e)}", exc_info=True)
+            with self._stats_lock:
+                self._stats['failed_batches'] += 1
+
+        if self.on_flush:
+            try:
+                self.on_flush(batch, saved)
+            except Exception as e:
+                logger.error(f"Yazma bildirimi hatası: {str(e)}")
+
+    def _run(self):
+        batch = []
+        deadline = None
+        while True:
+            timeout = max(deadline - time.monotonic(), 0) if batch else None
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                # Süre doldu, gruptaki kayıtları beklemeden yaz
+                self._write(batch)
+                batch = []
+                continue
+
+            if item is _STOP:
+                if batch:
+                    self._write(batch)
+                return
+
+            batch.append(item)
+            if len(batch) == 1:
+                deadline = time.monotonic() + self.max_latency
+            if len(batch) >= self.batch_size:
+                self._write(batch)
+                batch = []
+
+    def close(self):
+        """
+        Kalan kayıtları yazar ve yazıcıyı durdurur.
+
+        Returns:
+            dict: received, saved, batches, failed_batches, rejected
+        """
+        with self._add_lock:
+            if self._closed:
+                return self.stats()
+            self._closed = True
+            self._queue.put(_STOP)
+        self._thread.join()
+        return self.stats()
+
+    def stats(self):
+        with self._stats_lock:
+            return dict(self._stats)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
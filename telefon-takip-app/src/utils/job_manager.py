@@ -0,0 +1,143 @@
+import copy
+import logging
+import threading
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+logger = logging.getLogger(__name__)
+
+# İşin durumları
+JOB_QUEUED = 'queued'
+JOB_RUNNING = 'running'
+JOB_COMPLETED = 'completed'
+JOB_ERROR = 'error'
+
+ACTIVE_STATES = (JOB_QUEUED, JOB_RUNNING)
+
+
+def _now():
+    return datetime.now().isoformat(timespec='seconds')
+
+
+class JobManager:
+    """
+    Veri güncelleme işlerini arka planda çalıştırır ve durumlarını saklar.
+
+    HTTP isteği işi kuyruğa ekleyip iş kimliğini hemen döndürür; ilerleme, sayılar
+    ve hatalar iş kimliğiyle sorgulanır. Aynı türde, istenen kaynakların tamamını
+    kapsayan bir iş zaten bekliyor veya çalışıyorsa yeni iş açılmaz, mevcut iş döndürülür.
+    """
+
+    def __init__(self, max_workers=2, history_size=100):
+        """
+        Args:
+            max_workers (int): Eşzamanlı çalışabilecek azami iş sayısı
+            history_size (int): Bellekte tutulacak azami iş kaydı (eski bitmiş işler silinir)
+        """
+        self.history_size = history_size
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='job')
+        self._lock = threading.Lock()
+        self._jobs = OrderedDict()
+
+    def _find_active(self, kind, sources):
+        """İstenen kaynakları kapsayan etkin işi döndürür (kilit altında çağrılmalıdır)"""
+        for job in self._jobs.values():
+            if job['kind'] == kind and job['status'] in ACTIVE_STATES and set(sources) <= set(job['sources']):
+                return job
+        return None
+
+    def _prune(self):
+        """Geçmiş sınırını aşan bitmiş işleri siler (kilit altında çağrılmalıdır)"""
+        finished = [job_id for job_id, job in self._jobs.items() if job['status'] not in ACTIVE_STATES]
+        for job_id in finished[:max(len(self._jobs) - self.history_size, 0)]:
+            del self._jobs[job_id]
+
+    def submit(self, kind, sources, target, *args):
+        """
+        İşi kuyruğa ekler.
+
+        target(*args, report=...) biçiminde çağrılır; report(**alanlar) ile işin
+        progress, counts, message veya error alanlarını günceller.
+
+        Args:
+            kind (str): İş türü (ör. 'specs', 'prices')
+            sources (list): İşin kapsadığı kaynaklar
+            target (callable): Çalıştırılacak fonksiyon
+
+        Returns:
+            tuple: (iş kaydının kopyası, yeni iş oluşturulduysa True)
+        """
+        with self._lock:
+            active = self._find_active(kind, sources)
+            if active is not None:
+                logger.info(f"{kind} {sources} için çalışan iş kullanılıyor: {active['id']}")
+                return copy.deepcopy(active), False
+
+            job = {
+                'id': uuid.uuid4().hex,
+                'kind': kind,
+                'sources': list(sources),
+                'status': JOB_QUEUED,
+                'created_at': _now(),
+                'started_at': None,
+                'finished_at': None,
+                'progress': {},
+                'counts': {},
+                'message': None,
+                'error': None
+            }
+            self._jobs[job['id']] = job
+            self._prune()
+            snapshot = copy.deepcopy(job)
+
+        self._executor.submit(self._run, job['id'], target, args)
+        logger.info(f"{kind} {sources} işi kuyruğa eklendi: {job['id']}")
+        return snapshot, True
+
+    def _report(self, job_id, **fields):
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is not None:
+                job.update(fields)
+
+    def _run(self, job_id, target, args):
+        """İşi çalıştırır (iş parçacığında)"""
+        self._report(job_id, status=JOB_RUNNING, started_at=_now())
+        try:
+            target(*args, report=lambda **fields: self._report(job_id, **fields))
+        except Exception as e:
+            logger.error(f"İş hatası ({job_id}): {str(e)}", exc_info=True)
+            self._report(job_id, error=str(e))
+
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is not None:
+                job['status'] = JOB_ERROR if job['error'] else JOB_COMPLETED
+                job['finished_at'] = _now()
+
+    def get(self, job_id):
+        """
+        İşin durumunu döndürür.
+
+        Returns:
+            dict: İş kaydının kopyası; iş bulunamazsa None
+        """
+        with self._lock:
+            job = self._jobs.get(job_id)
+            return copy.deepcopy(job) if job is not None else None
+
+    def list(self, active_only=False):
+        """
+        İşleri yeniden eskiye döndürür.
+
+        Args:
+            active_only (bool): Yalnızca bekleyen veya çalışan işler
+
+        Returns:
+            list: İş kayıtlarının kopyaları
+        """
+        with self._lock:
+            jobs = [job for job in self._jobs.values() if not active_only or job['status'] in ACTIVE_STATES]
+            return copy.deepcopy(list(reversed(jobs)))
@@ -0,0 +1,195 @@
+import logging
+import os
+import sys
+import threading
+import time
+
+try:
+    import fcntl
+    FCNTL_AVAILABLE = True
+except ImportError:
+    FCNTL_AVAILABLE = False
+
+# Ana dizini ekle
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from src.config import SCRAPER_LOCK_DIR, SCRAPER_LOCK_POLL_INTERVAL
+
+logger = logging.getLogger(__name__)
+
+
+class _InFlightRun:
+    """Bu süreçte sürmekte olan bir çalıştırma"""
+
+    def __init__(self, kind):
+        self.kind = kind
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class RunCoordinator:
+    """
+    Aynı kaynağın taramalarının üst üste binmesini önler (single-flight).
+
+    Kaynak başına tek çalıştırma yapılır: süreç içinde iş parçacıkları arasında
+    kayıt tablosu, süreçler arasında kaynak başına kilit dosyası (fcntl.flock)
+    kullanılır. Geç gelen istek, sürmekte olan çalıştırma isteği kapsıyorsa yeni
+    tarama başlatmaz; çalıştırmanın bitmesini bekler ve onun sonucunu alır.
+    Kapsamıyorsa sırasını bekler.
+    """
+
+    def __init__(self, lock_dir=None, poll_interval=None):
+        """
+        Args:
+            lock_dir (str, optional): Kilit dosyalarının dizini
+            poll_interval (float, optional): Başka süreçteki kilidin kontrol aralığı (saniye)
+        """
+        self.lock_dir = lock_dir or SCRAPER_LOCK_DIR
+        self.poll_interval = poll_interval or SCRAPER_LOCK_POLL_INTERVAL
+        self._lock = threading.Lock()
+        self._runs = {}
+        if FCNTL_AVAILABLE:
+            os.makedirs(self.lock_dir, exist_ok=True)
+        else:
+            logger.warning("fcntl kullanılamıyor, taramalar yalnızca bu süreç içinde eşgüdümlenecek")
+
+    @staticmethod
+    def _remaining(deadline):
+        return None if deadline is None else max(deadline - time.monotonic(), 0)
+
+    def _lock_path(self, source):
+        return os.path.join(self.lock_dir, f"{source}.lock")
+
+    def _acquire_file(self, source, kind, attach_to, deadline):
+        """
+        Kaynağın kilit dosyasını alır.
+
+        Returns:
+            file: Alınan kilidin dosyası; başka bir süreçteki kapsayan çalıştırma
+                beklendiyse None
+
+        Raises:
+            TimeoutError: Kilit süre sınırı içinde alınamazsa
+        """
+        lock_file = open(self._lock_path(source), 'a+')
+        waited = False
+        while True:
+            try:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+                break
+            except BlockingIOError:
+                pass
+
+            if not waited:
+                lock_file.seek(0)
+                holder = lock_file.read().split()
+                holder_kind = holder[0] if holder else None
+                logger.info(f"{source} başka bir süreçte taranıyor ({holder_kind}), bekleniyor")
+                waited = True
+                covered = holder_kind in attach_to
+            remaining = self._remaining(deadline)
+            if remaining == 0:
+                lock_file.close()
+                raise TimeoutError(f"{source} kilidi süre sınırı içinde alınamadı")
+            time.sleep(min(self.poll_interval, remaining) if remaining is not None else self.poll_interval)
+
+        if waited and covered:
+            # Diğer sürecin çalıştırması bu isteği kapsıyordu; yeniden taramaya gerek yok
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+            lock_file.close()
+            return None
+
+        lock_file.seek(0)
+        lock_file.truncate()
+        lock_file.write(f"{kind} {os.getpid()}")
+        lock_file.flush()
+        return lock_file
+
+    def run(self, source, kind, fn, attach_to=None, timeout=None):
+        """
+        fn'i kaynak için tek çalıştırma olarak yürütür.
+
+        Args:
+            source (str): Kaynak anahtarı
+            kind (str): Çalıştırma türü (ör. 'specs', 'prices')
+            fn (callable): Taramayı yapan fonksiyon
+            attach_to (tuple, optional): Katılınabilecek çalıştırma türleri (varsayılan: yalnızca kind)
+            timeout (float, optional): Sürmekte olan çalıştırma için azami bekleme (saniye)
+
+        Returns:
+            tuple: (sonuç, katılındıysa True). Başka bir süreçteki çalıştırmaya
+                katılındıysa sonuç None olur.
+
+        Raises:
+            TimeoutError: Sürmekte olan çalıştırma süre sınırı içinde bitmezse
+            Exception: Katılınan çalıştırmanın hatası
+        """
+        attach_to = attach_to or (kind,)
+        deadline = time.monotonic() + timeout if timeout else None
+
+        while True:
+            with self._lock:
+                current = self._runs.get(source)
+                if current is None:
+                    current = self._runs[source] = _InFlightRun(kind)
+                    break
+
+            covered = current.kind in attach_to
+            if covered:
+                logger.info(f"{source} için sürmekte olan {current.kind} çalıştırmasına katılınıyor")
+            else:
+                logger.info(f"{source} için sürmekte olan {current.kind} çalıştırmasının bitmesi bekleniyor")
+            if not current.done.wait(self._remaining(deadline)):
+                raise TimeoutError(f"{source} için sürmekte olan çalıştırma süre sınırı içinde bitmedi")
+            if covered:
+                if current.error is not None:
+                    raise current.error
+                return current.result, True
+
+        lock_file = None
+        try:
+            if FCNTL_AVAILABLE:
+                lock_file = self._acquire_file(source, kind, attach_to, deadline)
+                if lock_file is None:
+                    return None, True
+            current.result = fn()
+            return current.result, False
+        except Exception as e:
+            current.error = e
+            raise
+        finally:
+            if lock_file is not None:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+                lock_file.close()
+            with self._lock:
+                del self._runs[source]
+            current.done.set()
+
+    def active(self):
+        """
+        Bu süreçte sürmekte olan çalıştırmaları döndürür.
+
+        Returns:
+            dict: Kaynak -> çalıştırma türü
+        """
+        with self._lock:
+            return {source: run.kind for source, run in self._runs.items()}
+
+
+_coordinator = None
+_coordinator_lock = threading.Lock()
+
+
+def get_run_coordinator():
+    """
+    Süreç genelinde paylaşılan çalıştırma eşgüdümleyicisini döndürür.
+
+    Returns:
+        RunCoordinator: Paylaşılan eşgüdümleyici
+    """
+    global _coordinator
+    with _coordinator_lock:
+        if _coordinator is None:
+            _coordinator = RunCoordinator()
+        return _coordinator
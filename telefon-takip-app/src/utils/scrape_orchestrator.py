@@ -0,0 +1,228 @@
+import copy
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+logger = logging.getLogger(__name__)
+
+# Çalıştırma türleri: yalnızca liste sayfalarından fiyat veya detay sayfalarıyla birlikte tam tarama
+JOB_PRICES = 'prices'
+JOB_SPECS = 'specs'
+
+
+class ScrapeOrchestrator:
+    """
+    Kayıtlı scraper'ları ayrı iş parçacıklarında eşzamanlı çalıştırır.
+
+    Her site kendi süre sınırına sahiptir; süresi dolan sitenin sonuçları
+    beklenmez ve diğer sitelerin sonuçları birleştirilerek döndürülür. sink
+    verilirse kayıtlar biriktirilmez, ayrıştırılır ayrıştırılmaz sink'e aktarılır.
+    job, scraper'ın hangi tarama yöntemiyle çalıştırılacağını belirler. coordinator
+    verilirse aynı kaynağın başka yerden başlatılmış taraması sürerken yeni tarama
+    başlatılmaz, sürmekte olan çalıştırmanın sonucu kullanılır. run() döndüğünde
+    çalıştırmanın iptal işareti konur; süresi dolup arka planda kalan iş parçacıkları
+    sink'i bir daha çağırmaz.
+    """
+
+    def __init__(self, scrapers, display_names=None, timeouts=None, default_timeout=900, emit=None, sink=None,
+                 job=JOB_SPECS, coordinator=None):
+        """
+        Args:
+            scrapers (dict): Kaynak anahtarı -> scraper nesnesi
+            display_names (dict, optional): Kaynak anahtarı -> durum nesnesinde kullanılacak ad
+            timeouts (dict, optional): Kaynak anahtarı -> saniye cinsinden azami süre
+            default_timeout (int): Süresi tanımlanmamış kaynaklar için azami süre
+            emit (callable, optional): Durum değiştiğinde çağrılır, durum nesnesinin kopyasını alır
+            sink (callable, optional): Her telefon kaydı için çağrılır (birden fazla iş parçacığından)
+            job (str): JOB_PRICES (yalnızca liste fiyatları) veya JOB_SPECS (detaylarla tam tarama)
+            coordinator (RunCoordinator, optional): Kaynak başına tek çalıştırma eşgüdümleyicisi
+        """
+        self.scrapers = scrapers
+        self.display_names = display_names or {}
+        self.timeouts = timeouts or {}
+        self.default_timeout = default_timeout
+        self.emit = emit
+        self.sink = sink
+        self.job = job
+        self.coordinator = coordinator
+        self._lock = threading.Lock()
+        self.status = {}
+        self._counts = {}
+        self._cancel = threading.Event()
+
+    def _display_name(self, source):
+        return self.display_names.get(source, source)
+
+    def _publish(self):
+        """Durum nesnesinin anlık kopyasını yayınlar (kilit altında çağrılmalıdır)"""
+        if self.emit:
+            try:
+                self.emit(copy.deepcopy(self.status))
+            except Exception as e:
+                logger.error(f"Durum yayınlama hatası: {str(e)}")
+
+    def _update(self, source, **fields):
+        """Bir kaynağın durumunu iş parçacığı güvenli şekilde günceller"""
+        name = self._display_name(source)
+        with self._lock:
+            entry = self.status.get(name)
+            # Süresi dolmuş kaynağın geç gelen güncellemelerini yok say
+            if entry is None or entry['status'] == 'timeout':
+                return
+            entry.update(fields)
+            self._publish()
+
+    def _timed_out(self, source):
+        with self._lock:
+            entry = self.status.get(self._display_name(source))
+            return entry is not None and entry['status'] == 'timeout'
+
+    def _make_progress_callback(self, source):
+        def progress_callback(current, total, error=None, message=None):
+            fields = {
+                'progress': int((current / total) * 100) if total else 0,
+                'count': self._counts.get(source, 0)
+            }
+            if error:
+                fields['error'] = error
+            self._update(source, **fields)
+        return progress_callback
+
+    def _run_scraper(self, source):
+        """
+        Tek bir scraper'ı, eşgüdümleyici varsa onun üzerinden çalıştırır (iş parçacığı içinde).
+
+        Fiyat taraması sürmekte olan tam taramaya da katılabilir; tam tarama
+        yalnızca başka bir tam taramaya katılır.
+
+        Returns:
+            tuple: (biriktirilen telefonlar, toplam telefon sayısı); sink varsa liste boştur.
+                Başka bir süreçteki çalıştırmaya katılındıysa sayı None olur.
+        """
+        if self.coordinator is None:
+            return self._scrape(source)
+
+        attach_to = (JOB_PRICES, JOB_SPECS) if self.job == JOB_PRICES else (JOB_SPECS,)
+        self._update(source, status='in_progress')
+        result, attached = self.coordinator.run(
+            source, self.job, lambda: self._scrape(source), attach_to=attach_to,
+            timeout=self.timeouts.get(source, self.default_timeout)
+        )
+        if attached:
+            logger.info(f"{self._display_name(source)} için sürmekte olan çalıştırmanın sonucu kullanıldı")
+            return result if result is not None else ([], None)
+        return result
+
+    def _scrape(self, source):
+        """Scraper'ı çalıştırır ve kayıtları toplar ya da sink'e aktarır"""
+        name = self._display_name(source)
+        # Sonraki çalıştırmanın işareti değil, bu çalıştırmanınki izlenir
+        cancel = self._cancel
+        logger.info(f"{name} verilerini çekme işlemi başlatılıyor ({self.job})...")
+        self._update(source, status='in_progress')
+
+        scraper = self.scrapers[source]
+        scraper.reset_stats()
+        phones = []
+        self._counts[source] = 0
+        iterate = scraper.iter_prices if self.job == JOB_PRICES else scraper.iter_phones
+        iterator = iterate(progress_callback=self._make_progress_callback(source))
+        try:
+            for phone in iterator:
+                if cancel.is_set():
+                    logger.info(f"{name} çalıştırma sona erdiği için veri çekme durduruldu")
+                    break
+                if self._timed_out(source):
+                    logger.info(f"{name} süre sınırını aştığı için veri çekme durduruldu")
+                    break
+                self._counts[source] += 1
+                if self.sink:
+                    self.sink(phone)
+                else:
+                    phones.append(phone)
+        finally:
+            iterator.close()
+        logger.info(f"{name} çalıştırma istatistikleri: {scraper.get_stats()}")
+        return phones, self._counts[source]
+
+    def run(self, sources=None):
+        """
+        Scraper'ları eşzamanlı çalıştırır ve sonuçları birleştirir.
+
+        Args:
+            sources (list, optional): Çalıştırılacak kaynaklar (varsayılan: tümü)
+
+        Returns:
+            tuple: (tüm telefonlar listesi, son durum nesnesi); sink verildiyse liste boştur,
+                sayılar durum nesnesindeki 'count' alanlarındadır
+        """
+        sources = list(sources or self.scrapers.keys())
+        self._cancel = threading.Event()
+
+        with self._lock:
+            self.status = {
+                self._display_name(source): {'status': 'pending', 'progress': 0, 'error': None, 'count': 0}
+                for source in sources
+            }
+            self._publish()
+
+        results = {}
+        started = time.monotonic()
+        executor = ThreadPoolExecutor(max_workers=max(len(sources), 1), thread_name_prefix='scraper')
+        try:
+            deadlines = {}
+            pending = {}
+            for source in sources:
+                future = executor.submit(self._run_scraper, source)
+                pending[future] = source
+                deadlines[future] = started + self.timeouts.get(source, self.default_timeout)
+
+            while pending:
+                next_deadline = min(deadlines[f] for f in pending)
+                done, _ = wait(list(pending), timeout=max(next_deadline - time.monotonic(), 0),
+                               return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    source = pending.pop(future)
+                    name = self._display_name(source)
+                    try:
+                        phones, count = future.result()
+                        results[source] = phones
+                        fields = {'status': 'completed', 'progress': 100, 'count': count or 0}
+                        if count == 0:
+                            fields['error'] = f"{name} sitesinden telefon verisi çekilemedi."
+                        self._update(source, **fields)
+                        if count is None:
+                            logger.info(f"{name} başka bir süreçteki çalıştırmayla güncellendi.")
+                        else:
+                            logger.info(f"{name} verilerini çekme tamamlandı. {count} adet telefon bulundu.")
+                    except Exception as e:
+                        logger.error(f"{name} veri çekme hatası: {str(e)}", exc_info=True)
+                        self._update(source, status='error', error=str(e))
+
+                now = time.monotonic()
+                for future in [f for f in pending if deadlines[f] <= now]:
+                    source = pending.pop(future)
+                    name = self._display_name(source)
+                    timeout = self.timeouts.get(source, self.default_timeout)
+                    logger.warning(f"{name} veri çekme işlemi {timeout} saniyelik süre sınırını aştı")
+                    self._update(source, status='timeout',
+                                 error=f"{name} veri çekme işlemi {timeout} saniye içinde tamamlanamadı.")
+        finally:
+            # Süresi dolan iş parçacıkları beklenmez; iptal işaretini görünce sink'e
+            # kayıt aktarmadan sonlanırlar
+            self._cancel.set()
+            executor.shutdown(wait=False)
+
+        elapsed = time.monotonic() - started
+        logger.info(f"Tüm kaynaklar {elapsed:.1f} saniyede tamamlandı")
+
+        # Sonuçları kaynak sırasına göre birleştir
+        all_phones = []
+        for source in sources:
+            all_phones.extend(results.get(source, []))
+
+        with self._lock:
+            status = copy.deepcopy(self.status)
+        return all_phones, status
@@ -0,0 +1,123 @@
+import logging
+import threading
+import time
+from collections import deque
+from datetime import datetime
+
+logger = logging.getLogger(__name__)
+
+
+class SourceScheduler:
+    """
+    Her kaynak ve çalıştırma türü için ayrı zamanlanmış iş oluşturur.
+
+    Yavaş bir site diğerlerini geciktirmez ve her site kendi sıklığında taranır.
+    İşler birleştirilir (coalesce): gecikmiş çalıştırmalar tek seferde yapılır ve
+    aynı iş en fazla bir kez eşzamanlı çalışır. Aynı kaynağın farklı türdeki işleri
+    de üst üste binmez; kaynak meşgulken gelen çalıştırma atlanır. Her çalıştırmanın
+    süresi ve sonucu kaydedilir.
+    """
+
+    def __init__(self, scheduler, run, schedules, history_size=20):
+        """
+        Args:
+            scheduler: APScheduler planlayıcısı
+            run (callable): run(kaynak, tür) -> sonuç durumu ('completed', 'timeout', 'error')
+            schedules (dict): Kaynak -> {tür: {'minutes' veya 'hours': aralık, 'jitter': saniye}}
+            history_size (int): Süre istatistikleri için saklanacak son çalıştırma sayısı
+        """
+        self.scheduler = scheduler
+        self.run = run
+        self.schedules = schedules
+        self.history_size = history_size
+        self._lock = threading.Lock()
+        self._source_locks = {}
+        self._history = {}
+
+    @staticmethod
+    def job_id(source, job):
+        return f"{job}_{source}"
+
+    def add_jobs(self, sources):
+        """
+        Kaynaklar için zamanlanmış işleri ekler.
+
+        Args:
+            sources (iterable): Kaynak anahtarları
+        """
+        for source in sources:
+            self._source_locks.setdefault(source, threading.Lock())
+            for job, schedule in self.schedules.get(source, {}).items():
+                interval = {key: schedule[key] for key in ('minutes', 'hours') if key in schedule}
+                self.scheduler.add_job(
+                    self._run_job, 'interval', args=[source, job], id=self.job_id(source, job),
+                    jitter=schedule.get('jitter') or None, coalesce=True, max_instances=1,
+                    misfire_grace_time=None, replace_existing=True, **interval
+                )
+                logger.info(f"{source} için {job} işi zamanlandı: {interval}, jitter {schedule.get('jitter', 0)} sn")
+
+    def _entry(self, source, job):
+        """Çalıştırma geçmişi kaydını döndürür (kilit altında çağrılmalıdır)"""
+        key = (source, job)
+        entry = self._history.get(key)
+        if entry is None:
+            entry = self._history[key] = {
+                'durations': deque(maxlen=self.history_size),
+                'runs': 0,
+                'skipped': 0,
+                'last_status': None,
+                'last_run': None
+            }
+        return entry
+
+    def _run_job(self, source, job):
+        """Zamanlanmış işi çalıştırır ve süresini kaydeder"""
+        source_lock = self._source_locks[source]
+        if not source_lock.acquire(blocking=False):
+            logger.info(f"{source} kaynağında başka bir çalıştırma sürdüğü için {job} işi atlandı")
+            with self._lock:
+                self._entry(source, job)['skipped'] += 1
+            return
+
+        started = time.monotonic()
+        started_at = datetime.now()
+        status = 'error'
+        try:
+            status = self.run(source, job)
+        except Exception as e:
+            logger.error(f"{source} {job} işi hatası: {str(e)}", exc_info=True)
+        finally:
+            source_lock.release()
+            duration = time.monotonic() - started
+            with self._lock:
+                entry = self._entry(source, job)
+                entry['durations'].append(duration)
+                entry['runs'] += 1
+                entry['last_status'] = status
+                entry['last_run'] = started_at.isoformat(timespec='seconds')
+            logger.info(f"{source} {job} işi {duration:.1f} saniyede tamamlandı ({status})")
+
+    def stats(self):
+        """
+        Kaynak başına çalıştırma sürelerini ve sonraki çalıştırma zamanlarını döndürür.
+
+        Returns:
+            dict: Kaynak -> tür -> {'runs', 'skipped', 'last_status', 'last_run', 'next_run',
+                'last_duration', 'avg_duration', 'max_duration'} (süreler saniye cinsinden)
+        """
+        stats = {}
+        for source, schedules in self.schedules.items():
+            for job in schedules:
+                with self._lock:
+                    entry = self._entry(source, job)
+                    durations = list(entry['durations'])
+                    job_stats = {key: entry[key] for key in ('runs', 'skipped', 'last_status', 'last_run')}
+
+                scheduled = self.scheduler.get_job(self.job_id(source, job))
+                next_run = getattr(scheduled, 'next_run_time', None)
+                job_stats['next_run'] = next_run.isoformat(timespec='seconds') if next_run else None
+                job_stats['last_duration'] = round(durations[-1], 1) if durations else None
+                job_stats['avg_duration'] = round(sum(durations) / len(durations), 1) if durations else None
+                job_stats['max_duration'] = round(max(durations), 1) if durations else None
+                stats.setdefault(source, {})[job] = job_stats
+        return stats
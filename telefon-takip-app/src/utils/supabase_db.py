@@ -84,6 +84,53 @@ class SupabaseDB:
             logging.error(f"Telefon ekleme hatası: {str(e)}")
             return None
     
+    def update_prices(self, phones):
+        """
+        Var olan telefonların fiyatlarını kaynak URL'sine göre günceller.
+        
+        Yeni satır eklenmez; veritabanında bulunmayan ürünler bir sonraki tam
+        taramada özellikleriyle birlikte eklenir. Fiyatı değişen telefonlar için
+        fiyat geçmişine kayıt eklenir.
+        
+        Args:
+            phones (list): 'source_url', 'price' ve 'source' alanlarını içeren telefon kayıtları
+            
+        Returns:
+            int: Fiyatı güncellenen telefon sayısı
+        """
+        updated = 0
+        for phone in phones:
+            source_url = phone.get("source_url")
+            if not source_url:
+                continue
+            try:
+                response = self.supabase.table("phones").select("id,price").eq("source_url", source_url).execute()
+                if not response or not response.data:
+                    logging.debug(f"Fiyat güncellemesi için kayıt bulunamadı: {source_url}")
+                    continue
+                
+                price = phone.get("price")
+                for row in response.data:
+                    if row.get("price") is not None and float(row["price"]) == float(price):
+                        continue
+                    self.supabase.table("phones").update({
+                        "price": price,
+                        "updated_at": datetime.now().isoformat()
+                    }).eq("id", row["id"]).execute()
+                    self.supabase.table("price_history").insert({
+                        "phone_id": row["id"],
+                        "price": price,
+                        "date": datetime.now().date().isoformat(),
+                        "source": phone.get("source", "")
+                    }).execute()
+                    updated += 1
+            except Exception as e:
+                logging.error(f"Fiyat güncelleme hatası ({source_url}): {str(e)}")
+                continue
+        
+        logging.info(f"{updated}/{len(phones)} telefonun fiyatı güncellendi")
+        return updated
+    
     def search_phones(self, keyword=None, min_price=None, max_price=None, brands=None, sources=None):
         """
         Telefonları filtreler
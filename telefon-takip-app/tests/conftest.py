@@ -0,0 +1,83 @@
+import os
+import sys
+import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+# Testler `src.` paketini proje kökünden içe aktarır
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Paylaşılan önbellek, kayıt deposu ve kilit dosyaları proje dizinine yazılmasın
+os.environ.setdefault('SCRAPER_CACHE_DIR', tempfile.mkdtemp(prefix='telefon-takip-test-'))
+
+from src.scrapers.base_scraper import BaseScraper
+from src.scrapers.record_store import RecordStore
+from src.scrapers.resilience import RetryPolicy
+
+
+class FakeScraper(BaseScraper):
+    """Detay sayfası isteklerini sayan, ağa çıkmayan scraper"""
+
+    def __init__(self, record_store):
+        super().__init__("https://www.example.com", "Örnek")
+        self.record_store = record_store
+        self.incremental = True
+        self.firecrawl_batch = None
+        self.parse_pool = None
+        self.fetched = []
+
+    def get_phone_details(self, url):
+        self.fetched.append(url)
+        return {'name': url.rsplit('/', 1)[-1], 'price': 0, 'specs': {'RAM': '8 GB'}}
+
+    def _parse_phone_details(self, url, html):
+        return {}
+
+    def get_phone_list(self):
+        return []
+
+    def iter_phones(self, progress_callback=None):
+        return iter(())
+
+
+@pytest.fixture
+def scraper(tmp_path):
+    return FakeScraper(RecordStore(str(tmp_path / 'records.db')))
+
+
+@pytest.fixture
+def fast_scraper(scraper):
+    """Hız sınırı olmadan, beklemeden yeniden deneyen scraper"""
+    scraper.rate_limiter = None
+    scraper.retry_policy = RetryPolicy(max_attempts=3, base_delay=0, max_delay=0)
+    return scraper
+
+
+@pytest.fixture
+def flaky_server():
+    """Sıradaki durum kodlarını döndüren, bittiğinde 200 veren yerel sunucu"""
+    statuses = []
+    requests_seen = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            requests_seen.append(self.path)
+            status = statuses.pop(0) if statuses else 200
+            content = b'<html>tamam</html>'
+            self.send_response(status)
+            self.send_header('Content-Length', str(len(content)))
+            self.end_headers()
+            self.wfile.write(content)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    host, port = server.server_address[:2]
+    yield f"http://{host}:{port}", statuses, requests_seen
+    server.shutdown()
+    server.server_close()
@@ -0,0 +1,90 @@
+import threading
+import time
+
+from src.utils.batch_writer import MicroBatchWriter
+from src.utils.scrape_orchestrator import ScrapeOrchestrator
+
+
+class StubScraper:
+    """Kayıtları sırayla üreten, istenirse bir işaret gelene kadar bekleyen scraper"""
+
+    def __init__(self, records, hold=None):
+        self.records = records
+        self.hold = hold
+        self.finished = threading.Event()
+
+    def reset_stats(self):
+        pass
+
+    def get_stats(self):
+        return {}
+
+    def iter_phones(self, progress_callback=None):
+        try:
+            for record in self.records:
+                if self.hold is not None:
+                    self.hold.wait(5)
+                yield record
+        finally:
+            self.finished.set()
+
+
+def test_add_after_close_is_rejected():
+    written = []
+    writer = MicroBatchWriter(lambda batch: written.extend(batch) or len(batch), batch_size=10)
+    assert writer.add({'model': 'A'}) is True
+    writer.close()
+
+    assert writer.add({'model': 'B'}) is False
+    assert written == [{'model': 'A'}]
+    assert writer.stats() == {'received': 1, 'saved': 1, 'batches': 1, 'failed_batches': 0, 'rejected': 1}
+    # İkinci kapatma yazıcıyı yeniden durdurmaya çalışmaz
+    assert writer.close()['rejected'] == 1
+
+
+def test_producer_blocked_on_full_queue_is_written_before_close():
+    release = threading.Event()
+    written = []
+
+    def flush(batch):
+        release.wait(5)
+        written.extend(batch)
+        return len(batch)
+
+    writer = MicroBatchWriter(flush, batch_size=1, max_pending=1)
+    writer.add(1)
+    # Yazıcı ilk kayıtta beklerken ikinci kayıt kuyruğu doldurur, üçüncüsü bekler
+    time.sleep(0.1)
+    writer.add(2)
+    producer = threading.Thread(target=writer.add, args=(3,))
+    producer.start()
+    time.sleep(0.1)
+    closer = threading.Thread(target=writer.close)
+    closer.start()
+
+    release.set()
+    producer.join(5)
+    closer.join(5)
+
+    assert written == [1, 2, 3]
+    assert writer.stats()['rejected'] == 0
+
+
+def test_timed_out_source_stops_feeding_sink_after_run_ends():
+    hold = threading.Event()
+    slow = StubScraper([{'model': 'geç'}], hold=hold)
+    received = []
+    orchestrator = ScrapeOrchestrator(
+        {'slow': slow, 'fast': StubScraper([{'model': 'hızlı'}])},
+        timeouts={'slow': 0.2}, sink=received.append
+    )
+
+    _, status = orchestrator.run()
+    assert status['slow']['status'] == 'timeout'
+
+    # Sonraki çalıştırma durumu sıfırlasa da önceki çalıştırmadan kalan iş parçacığı sink'i çağırmaz
+    orchestrator.run(['fast'])
+    hold.set()
+    assert slow.finished.wait(5)
+
+    assert received == [{'model': 'hızlı'}, {'model': 'hızlı'}]
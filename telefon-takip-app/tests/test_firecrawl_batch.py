@@ -0,0 +1,56 @@
+import pytest
+
+from src.scrapers.firecrawl_batch import FirecrawlBatchClient
+from src.scrapers.mock_firecrawl import MockFirecrawlServer
+
+PAGES = {f"https://www.example.com/p/telefon-{i}": {'name': f"Telefon {i}", 'price': 1000 * i} for i in range(1, 6)}
+FAILED = "https://www.example.com/p/bozuk"
+
+
+@pytest.fixture
+def server():
+    with MockFirecrawlServer(PAGES, failed=[FAILED], page_size=2, polls_to_complete=3) as server:
+        yield server
+
+
+def make_client(server, **kwargs):
+    options = dict(api_url=server.url, batch_size=4, poll_interval=0.01, timeout=10)
+    options.update(kwargs)
+    return FirecrawlBatchClient('fc-test', **options)
+
+
+def test_iter_results_polls_paginates_and_skips_failed(server):
+    urls = list(PAGES) + [FAILED]
+
+    results = list(make_client(server).iter_results(urls, {'formats': ['json']}))
+
+    assert [url for url, _ in results].count(FAILED) == 0
+    assert sorted(url for url, _ in results) == sorted(PAGES)
+    assert all(document['json'] == PAGES[url] for url, document in results)
+
+    stats = server.stats()
+    # 6 URL, 4'lük gruplar halinde iki işe bölünür
+    assert stats['submits'] == 2
+    # Her iş tamamlanana kadar en az üç kez sorgulanır
+    assert stats['polls'] >= 6
+    # İlk işin 4 belgesinden 2'si 'next' sayfasıyla gelir
+    assert stats['next_pages'] >= 1
+
+
+def test_get_status_follows_next_links(server):
+    client = make_client(server)
+    job_id = client.submit(list(PAGES))
+
+    statuses = [client.get_status(job_id) for _ in range(3)]
+
+    assert [status['status'] for status in statuses] == ['scraping', 'scraping', 'completed']
+    assert len(statuses[0]['data']) < len(statuses[1]['data']) < len(PAGES)
+    assert sorted(document['metadata']['sourceURL'] for document in statuses[-1]['data']) == sorted(PAGES)
+    assert 'next' in statuses[-1]
+
+
+def test_iter_results_stops_at_timeout():
+    with MockFirecrawlServer(PAGES, polls_to_complete=10 ** 6) as server:
+        results = list(make_client(server, poll_interval=0.05, timeout=0.2).iter_results(list(PAGES)))
+
+    assert results == []
@@ -0,0 +1,116 @@
+import socket
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+pytest.importorskip('httpx')
+
+from src.scrapers import http_client
+from src.scrapers.http_client import CachedDNSAdapter, HTTP2Adapter, HTTPClient
+from src.scrapers.resilience import RetryPolicy
+
+
+@pytest.fixture
+def cookie_server():
+    """Çerez, yönlendirme, tekrarlanan başlık ve yavaş yanıt sunan yerel sunucu"""
+    seen = []
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def do_GET(self):
+            seen.append((self.path, self.headers.get('Cookie')))
+            if self.path == '/slow':
+                time.sleep(0.5)
+            status, headers, content = 200, [], 'tamam ğüş'.encode('utf-8')
+            if self.path == '/login':
+                status, headers = 302, [('Location', '/home'), ('Set-Cookie', 'sid=abc; Path=/')]
+            elif self.path == '/home':
+                headers = [('X-Tag', 'a'), ('X-Tag', 'b')]
+            self.send_response(status)
+            self.send_header('Content-Type', 'text/html; charset=utf-8')
+            self.send_header('Content-Length', str(len(content)))
+            for name, value in headers:
+                self.send_header(name, value)
+            self.end_headers()
+            self.wfile.write(content)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    host, port = server.server_address[:2]
+    yield f"http://{host}:{port}", seen
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def session():
+    """httpx adaptörüyle (HTTP/1.1) gönderen oturum"""
+    adapter = HTTP2Adapter(http2=False)
+    session = requests.Session()
+    session.mount('http://', adapter)
+    yield session, adapter
+    session.close()
+
+
+def test_adapter_keeps_redirects_and_cookies_in_session(cookie_server, session):
+    url, seen = cookie_server
+    session, adapter = session
+
+    response = session.get(f"{url}/login", timeout=5)
+
+    assert response.status_code == 200
+    assert response.text == 'tamam ğüş'
+    assert response.headers['x-tag'] == 'a, b'
+    assert [r.status_code for r in response.history] == [302]
+    assert session.cookies.get('sid') == 'abc'
+    # Çerez httpx'te değil requests oturumunda saklanır ve oradan gönderilir
+    assert seen[1] == ('/home', 'sid=abc')
+    assert adapter.stats('127.0.0.1') == {'HTTP/1.1': 2}
+
+
+def test_adapter_maps_errors_to_retryable_requests_exceptions(cookie_server, session):
+    url, _ = cookie_server
+    session, _ = session
+
+    with pytest.raises(requests.exceptions.ReadTimeout) as timeout:
+        session.get(f"{url}/slow", timeout=0.1)
+
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        closed_port = sock.getsockname()[1]
+    with pytest.raises(requests.exceptions.ConnectionError) as refused:
+        session.get(f"http://127.0.0.1:{closed_port}/", timeout=1)
+
+    assert isinstance(timeout.value, RetryPolicy.RETRY_EXCEPTIONS)
+    assert isinstance(refused.value, RetryPolicy.RETRY_EXCEPTIONS)
+
+
+def test_http2_is_opt_in_and_limited_to_configured_hosts(monkeypatch):
+    monkeypatch.setattr(http_client, 'H2_AVAILABLE', True)
+    monkeypatch.setattr(http_client, 'HTTP2Adapter', lambda max_connections=None: HTTP2Adapter(http2=False))
+
+    default = HTTPClient(dns_cache_ttl=0)
+    assert default.http2_adapter is None
+    assert isinstance(default.session.get_adapter('https://www.vatanbilgisayar.com/'), CachedDNSAdapter)
+
+    client = HTTPClient(dns_cache_ttl=0, http2=True, http2_hosts=['www.teknosa.com'])
+    assert client.session.get_adapter('https://www.teknosa.com/cep-telefonu') is client.http2_adapter
+    assert isinstance(client.session.get_adapter('https://www.vatanbilgisayar.com/'), CachedDNSAdapter)
+    client.close()
+
+
+def test_http2_without_h2_falls_back_to_http1(monkeypatch):
+    monkeypatch.setattr(http_client, 'H2_AVAILABLE', False)
+
+    client = HTTPClient(dns_cache_ttl=0, http2=True)
+
+    assert client.http2_adapter is None
+    assert isinstance(client.session.get_adapter('https://www.teknosa.com/'), CachedDNSAdapter)
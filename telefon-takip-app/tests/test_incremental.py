@@ -0,0 +1,125 @@
+import time
+
+import pytest
+
+
+def card(index, price="24.999 TL", badge=""):
+    return {'url': f"https://www.example.com/p/telefon-{index}", 'text': f"Telefon {index}",
+            'price': price, 'badge': badge}
+
+
+def run(scraper, links):
+    scraper.fetched = []
+    scraper.reset_stats()
+    return {record['source_url']: record for record in scraper._iter_product_details(links)}
+
+
+def test_unchanged_cards_reuse_stored_records(scraper):
+    links = [card(1), card(2)]
+    first = run(scraper, links)
+    assert len(scraper.fetched) == 2
+
+    second = run(scraper, links)
+    assert scraper.fetched == []
+    assert second == first
+    assert second[links[0]['url']]['price'] == 24999.0
+    assert scraper.get_stats()['incremental']['reused'] == 2
+
+
+def test_changed_card_is_refetched(scraper):
+    run(scraper, [card(1), card(2)])
+
+    records = run(scraper, [card(1, price="22.999 TL"), card(2)])
+
+    assert scraper.fetched == [card(1)['url']]
+    assert records[card(1)['url']]['price'] == 22999.0
+    stats = scraper.get_stats()['incremental']
+    assert stats['changed'] == 1
+    assert stats['reused'] == 1
+
+
+def test_new_and_stale_cards_are_refetched(scraper, monkeypatch):
+    run(scraper, [card(1)])
+
+    scraper.max_spec_age = 60
+    later = time.time() + 120
+    monkeypatch.setattr(time, 'time', lambda: later)
+    run(scraper, [card(1), card(2)])
+
+    assert sorted(scraper.fetched) == [card(1)['url'], card(2)['url']]
+    stats = scraper.get_stats()['incremental']
+    assert stats['stale'] == 1
+    assert stats['new'] == 1
+
+
+LISTING_HTML = '''
+<html><body>
+  <div class="card"><a href="/p/telefon-1"><span class="name">Telefon 1 128 GB</span></a><span class="price">{price}</span></div>
+  <div class="card"><a href="/p/telefon-2"><span class="name">Telefon 2 256 GB</span></a><span class="price">31.999 TL</span></div>
+</body></html>
+'''
+
+
+class FakeFirecrawl:
+    def __init__(self):
+        self.html = LISTING_HTML.format(price="24.999 TL")
+
+    def scrape_url(self, url, params=None, ttl=None):
+        return {'html': self.html, 'links': ["https://www.example.com/p/telefon-1",
+                                             "https://www.example.com/p/telefon-2",
+                                             "https://www.example.com/kampanyalar"]}
+
+
+@pytest.fixture
+def listing_scraper(scraper, monkeypatch):
+    """Aynı liste sayfasını Firecrawl ve HTML yoluyla sunan scraper"""
+    scraper.phones_url = "https://www.example.com/telefonlar"
+    scraper.listing_item_selector = '.card'
+    scraper.listing_name_selector = '.name'
+    scraper.listing_price_selector = '.price'
+    scraper.firecrawl = FakeFirecrawl()
+    scraper._firecrawl_product_link = lambda href: (
+        {'url': href, 'text': href.rsplit('/', 1)[-1].replace('-', ' ').title()} if '/p/' in href else None
+    )
+    monkeypatch.setattr(scraper, '_fetch_html_with_fallback', lambda url, **kwargs: scraper.firecrawl.html)
+    return scraper
+
+
+def firecrawl_run(scraper):
+    scraper.fetched = []
+    scraper.reset_stats()
+    links = scraper._crawl_listing_pages_firecrawl()
+    return {record['source_url']: record for record in scraper._iter_product_details(links)}
+
+
+def test_firecrawl_cards_carry_listing_price(listing_scraper):
+    records = firecrawl_run(listing_scraper)
+
+    assert records[card(1)['url']]['model'] == "Telefon 1 128 GB"
+    assert records[card(1)['url']]['price'] == 24999.0
+
+    listing_scraper.firecrawl.html = LISTING_HTML.format(price="22.999 TL")
+    records = firecrawl_run(listing_scraper)
+
+    # Fiyatı değişen kart yeniden çekilir, kayıtta liste fiyatı kullanılır
+    assert listing_scraper.fetched == [card(1)['url']]
+    assert records[card(1)['url']]['price'] == 22999.0
+
+
+def test_price_run_does_not_invalidate_firecrawl_cards(listing_scraper):
+    firecrawl_run(listing_scraper)
+
+    listing_scraper.firecrawl.html = LISTING_HTML.format(price="22.999 TL")
+    prices = {record['source_url']: record['price'] for record in listing_scraper.iter_prices()}
+    assert prices[card(1)['url']] == 22999.0
+
+    records = firecrawl_run(listing_scraper)
+
+    # Fiyat taraması yalnızca HTML kartlarının parmak izini günceller; Firecrawl
+    # kartı fiyatı değişen ürün dışında yeniden çekilmez
+    assert listing_scraper.fetched == [card(1)['url']]
+    assert records[card(2)['url']]['price'] == 31999.0
+    assert listing_scraper.get_stats()['incremental']['reused'] == 1
+
+    firecrawl_run(listing_scraper)
+    assert listing_scraper.fetched == []
@@ -0,0 +1,83 @@
+import threading
+import time
+
+import pytest
+
+from src.utils.job_manager import JOB_COMPLETED, JOB_ERROR, JobManager
+
+
+def wait_finished(manager, job_id, timeout=5):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        job = manager.get(job_id)
+        if job['status'] in (JOB_COMPLETED, JOB_ERROR):
+            return job
+        time.sleep(0.01)
+    pytest.fail(f"İş {timeout} saniyede bitmedi: {job_id}")
+
+
+@pytest.fixture
+def manager():
+    return JobManager(max_workers=2, history_size=3)
+
+
+def blocking_target(release):
+    def target(*args, report):
+        report(progress={'percent': 50})
+        release.wait(5)
+        report(counts={'saved': len(args)})
+    return target
+
+
+def test_covered_request_reuses_active_job(manager):
+    release = threading.Event()
+    job, created = manager.submit('specs', ['teknosa', 'vatan'], blocking_target(release))
+    same, same_created = manager.submit('specs', ['vatan'], blocking_target(release))
+    release.set()
+
+    assert created and not same_created
+    assert same['id'] == job['id']
+    assert len(manager.list()) == 1
+
+
+def test_other_kind_or_wider_sources_create_new_job(manager):
+    release = threading.Event()
+    job, _ = manager.submit('specs', ['teknosa'], blocking_target(release))
+    prices, prices_created = manager.submit('prices', ['teknosa'], blocking_target(release))
+    wider, wider_created = manager.submit('specs', ['teknosa', 'vatan'], blocking_target(release))
+    release.set()
+
+    assert prices_created and wider_created
+    assert len({job['id'], prices['id'], wider['id']}) == 3
+
+
+def test_finished_job_is_not_reused(manager):
+    job, _ = manager.submit('specs', ['teknosa'], lambda report: report(message='bitti'))
+    finished = wait_finished(manager, job['id'])
+
+    again, created = manager.submit('specs', ['teknosa'], lambda report: None)
+
+    assert finished['status'] == JOB_COMPLETED
+    assert finished['message'] == 'bitti'
+    assert created and again['id'] != job['id']
+
+
+def test_error_is_recorded(manager):
+    def target(report):
+        raise RuntimeError('site çöktü')
+
+    job, _ = manager.submit('specs', ['teknosa'], target)
+    finished = wait_finished(manager, job['id'])
+
+    assert finished['status'] == JOB_ERROR
+    assert finished['error'] == 'site çöktü'
+
+
+def test_history_is_pruned(manager):
+    ids = []
+    for source in ('a', 'b', 'c', 'd', 'e'):
+        job, _ = manager.submit('specs', [source], lambda report: None)
+        wait_finished(manager, job['id'])
+        ids.append(job['id'])
+
+    assert [job['id'] for job in manager.list()] == ids[::-1][:3]
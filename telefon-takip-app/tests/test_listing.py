@@ -0,0 +1,66 @@
+import threading
+import time
+
+import pytest
+
+
+class PagedFirecrawl:
+    """Sayfa başına iki ürün döndüren, eşzamanlı çağrıları ölçen sahte Firecrawl"""
+
+    def __init__(self, last_page):
+        self.last_page = last_page
+        self.pages = []
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def scrape_url(self, url, params=None, ttl=None):
+        page = int(url.rsplit('=', 1)[-1])
+        with self._lock:
+            self.pages.append(page)
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        time.sleep(0.05)
+        with self._lock:
+            self.active -= 1
+        # Son sayfadan sonrası son sayfanın tekrarıdır
+        number = min(page, self.last_page)
+        return {'html': '<html></html>', 'links': [f"https://www.example.com/p/{number}-{i}" for i in range(2)]}
+
+
+@pytest.fixture
+def listing_scraper(scraper):
+    scraper.phones_url = "https://www.example.com/telefonlar"
+    scraper.max_concurrency_per_host = 3
+    scraper.max_products = 0
+    scraper._get_total_pages = lambda soup: 10
+    scraper._firecrawl_product_link = lambda href: {'url': href, 'text': ''} if '/p/' in href else None
+    return scraper
+
+
+def test_firecrawl_listing_fetches_pages_in_concurrent_windows(listing_scraper):
+    listing_scraper.firecrawl = PagedFirecrawl(last_page=10)
+
+    links = listing_scraper._crawl_listing_pages_firecrawl()
+
+    assert len(links) == 20
+    assert sorted(listing_scraper.firecrawl.pages) == list(range(1, 11))
+    assert listing_scraper.firecrawl.pages[0] == 1
+    assert listing_scraper.firecrawl.max_active == 3
+    assert listing_scraper.get_stats()['listing']['pages'] == 10
+
+
+def test_firecrawl_listing_stops_at_duplicate_page(listing_scraper):
+    listing_scraper.firecrawl = PagedFirecrawl(last_page=4)
+
+    links = listing_scraper._crawl_listing_pages_firecrawl()
+
+    assert len(links) == 8
+    # Sayfa 5, 4'ün tekrarıdır; 2-4 ve 5-7 pencerelerinden sonra durulur
+    assert max(listing_scraper.firecrawl.pages) == 7
+
+
+def test_firecrawl_listing_without_first_page(listing_scraper):
+    listing_scraper.firecrawl = type('EmptyFirecrawl', (), {'scrape_url': lambda self, **kwargs: None})()
+
+    assert listing_scraper._crawl_listing_pages_firecrawl() is None
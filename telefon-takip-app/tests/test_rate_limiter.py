@@ -0,0 +1,39 @@
+import time
+
+import pytest
+
+from src.scrapers.rate_limiter import HostRateLimiter, parse_retry_after
+
+
+def test_rate_limiter_backs_off_and_recovers():
+    limiter = HostRateLimiter('example.com', rate=4, min_rate=1, max_rate=5, burst=1, increase=0.5, backoff=0.5)
+
+    limiter.record(429, 0.1)
+    assert limiter.stats()['rate'] == 2
+    limiter.record(200, 0.1)
+    assert limiter.stats()['rate'] == 2.5
+    for _ in range(10):
+        limiter.record(503, 0.1)
+    assert limiter.stats()['rate'] == 1
+
+
+def test_rate_limiter_honours_retry_after():
+    limiter = HostRateLimiter('example.com', rate=100, burst=1)
+    limiter.record(429, 0.1, retry_after='1')
+
+    assert limiter.acquire() >= 0.9
+    assert limiter.stats()['retry_after'] == 1
+
+
+def test_rate_limiter_spaces_requests():
+    limiter = HostRateLimiter('example.com', rate=20, max_rate=20, burst=1)
+    started = time.monotonic()
+    for _ in range(4):
+        limiter.acquire()
+    # İlk istek birikmiş tokenla, sonraki üçü 1/20 sn aralıkla yapılır
+    assert time.monotonic() - started >= 0.14
+
+
+@pytest.mark.parametrize('value, expected', [('5', 5.0), ('Wed, 21 Oct 2015 07:28:00 GMT', 0.0), ('yarın', None), (None, None)])
+def test_parse_retry_after(value, expected):
+    assert parse_retry_after(value) == expected
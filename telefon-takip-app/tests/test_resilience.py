@@ -0,0 +1,80 @@
+import time
+
+import pytest
+
+from src.scrapers.resilience import CircuitBreaker, CircuitOpenError, RetryPolicy
+
+
+def test_request_retries_transient_errors(fast_scraper, flaky_server):
+    url, statuses, seen = flaky_server
+    statuses.extend([503, 502])
+
+    response = fast_scraper._request(f"{url}/retry")
+
+    assert response.status_code == 200
+    assert len(seen) == 3
+    assert fast_scraper.get_stats()['retry']['retries'] == 2
+
+
+def test_request_gives_up_after_max_attempts(fast_scraper, flaky_server):
+    url, statuses, seen = flaky_server
+    statuses.extend([503] * 5)
+
+    response = fast_scraper._request(f"{url}/gave-up")
+
+    assert response.status_code == 503
+    assert len(seen) == 3
+    assert fast_scraper.get_stats()['retry']['gave_up'] == 1
+
+
+def test_request_does_not_retry_client_errors(fast_scraper, flaky_server):
+    url, statuses, seen = flaky_server
+    statuses.append(404)
+
+    assert fast_scraper._request(f"{url}/missing").status_code == 404
+    assert len(seen) == 1
+
+
+def test_retry_delay_is_bounded():
+    policy = RetryPolicy(base_delay=1, max_delay=4)
+    for attempt in range(1, 10):
+        assert 0 <= policy.delay(attempt) <= min(4, 2 ** (attempt - 1))
+
+
+def test_circuit_opens_and_recovers():
+    breaker = CircuitBreaker('example.com', failure_threshold=2, recovery_timeout=0.05)
+    breaker.record_failure()
+    assert breaker.allow_request()
+    breaker.record_failure()
+
+    assert breaker.state == CircuitBreaker.OPEN
+    assert not breaker.allow_request()
+
+    time.sleep(0.06)
+    # Yarı açık devrede yalnızca tek deneme isteğine izin verilir
+    assert breaker.allow_request()
+    assert not breaker.allow_request()
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.stats()['rejected'] == 2
+
+
+def test_failed_probe_reopens_circuit():
+    breaker = CircuitBreaker('example.com', failure_threshold=1, recovery_timeout=0.05)
+    breaker.record_failure()
+    time.sleep(0.06)
+    assert breaker.allow_request()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+
+
+def test_request_fails_fast_when_circuit_open(fast_scraper, flaky_server, monkeypatch):
+    url, _, seen = flaky_server
+    breaker = CircuitBreaker('flaky', failure_threshold=1, recovery_timeout=60)
+    breaker.record_failure()
+    monkeypatch.setattr('src.scrapers.base_scraper.get_circuit_breaker', lambda host: breaker)
+    fast_scraper.circuit_breaker_enabled = True
+
+    with pytest.raises(CircuitOpenError):
+        fast_scraper._request(f"{url}/open")
+    assert seen == []
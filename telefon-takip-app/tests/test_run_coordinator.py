@@ -0,0 +1,136 @@
+import threading
+
+import pytest
+
+from src.utils.run_coordinator import RunCoordinator
+
+
+@pytest.fixture
+def coordinator(tmp_path):
+    return RunCoordinator(lock_dir=str(tmp_path), poll_interval=0.01)
+
+
+def start_owner(coordinator, kind='specs', result='sonuç', error=None):
+    """Kaynağı meşgul eden ve serbest bırakılana kadar bekleyen bir çalıştırma başlatır"""
+    started, release = threading.Event(), threading.Event()
+    outcome = {}
+
+    def fn():
+        started.set()
+        release.wait(5)
+        if error is not None:
+            raise error
+        return result
+
+    def run():
+        try:
+            outcome['value'] = coordinator.run('teknosa', kind, fn)
+        except Exception as e:
+            outcome['error'] = e
+
+    thread = threading.Thread(target=run)
+    thread.start()
+    assert started.wait(5)
+    return release, thread, outcome
+
+
+def test_attaches_to_covering_run(coordinator):
+    release, thread, outcome = start_owner(coordinator)
+    calls = []
+    attached = {}
+
+    def attach():
+        attached['value'] = coordinator.run('teknosa', 'specs', lambda: calls.append(1))
+
+    attacher = threading.Thread(target=attach)
+    attacher.start()
+    attacher.join(0.1)
+    assert attacher.is_alive()
+    assert coordinator.active() == {'teknosa': 'specs'}
+    release.set()
+    thread.join(5)
+    attacher.join(5)
+
+    assert outcome['value'] == ('sonuç', False)
+    assert attached['value'] == ('sonuç', True)
+    assert calls == []
+    assert coordinator.active() == {}
+
+
+def test_uncovered_kind_waits_then_runs(coordinator):
+    release, thread, _ = start_owner(coordinator, kind='prices')
+    results = {}
+
+    waiter = threading.Thread(target=lambda: results.setdefault('value', coordinator.run('teknosa', 'specs', lambda: 'yeni')))
+    waiter.start()
+    waiter.join(0.1)
+    assert waiter.is_alive()
+
+    release.set()
+    thread.join(5)
+    waiter.join(5)
+    assert results['value'] == ('yeni', False)
+
+
+def test_attach_times_out(coordinator):
+    release, thread, _ = start_owner(coordinator)
+    try:
+        with pytest.raises(TimeoutError):
+            coordinator.run('teknosa', 'specs', lambda: 'yeni', timeout=0.05)
+    finally:
+        release.set()
+        thread.join(5)
+
+
+def test_attacher_gets_owner_error(coordinator):
+    release, thread, outcome = start_owner(coordinator, error=RuntimeError('site çöktü'))
+    errors = []
+
+    def attach():
+        try:
+            coordinator.run('teknosa', 'specs', lambda: 'yeni')
+        except RuntimeError as e:
+            errors.append(e)
+
+    attacher = threading.Thread(target=attach)
+    attacher.start()
+    attacher.join(0.1)
+    release.set()
+    thread.join(5)
+    attacher.join(5)
+
+    assert isinstance(outcome['error'], RuntimeError)
+    assert [str(e) for e in errors] == ['site çöktü']
+
+
+def test_attaches_across_coordinators(coordinator, tmp_path):
+    # Ayrı eşgüdümleyiciler yalnızca kilit dosyasını paylaşır (başka süreç gibi)
+    other = RunCoordinator(lock_dir=str(tmp_path), poll_interval=0.01)
+    release, thread, _ = start_owner(coordinator, kind='specs')
+    calls = []
+    results = {}
+
+    attacher = threading.Thread(
+        target=lambda: results.setdefault('value', other.run('teknosa', 'prices', lambda: calls.append(1),
+                                                              attach_to=('prices', 'specs')))
+    )
+    attacher.start()
+    attacher.join(0.1)
+    assert attacher.is_alive()
+    release.set()
+    thread.join(5)
+    attacher.join(5)
+
+    assert results['value'] == (None, True)
+    assert calls == []
+
+
+def test_file_lock_timeout(coordinator, tmp_path):
+    other = RunCoordinator(lock_dir=str(tmp_path), poll_interval=0.01)
+    release, thread, _ = start_owner(coordinator)
+    try:
+        with pytest.raises(TimeoutError):
+            other.run('teknosa', 'specs', lambda: 'yeni', timeout=0.05)
+    finally:
+        release.set()
+        thread.join(5)
@@ -0,0 +1,106 @@
+import contextlib
+
+import pytest
+
+from src.scrapers import base_scraper
+from src.scrapers.rate_limiter import RateLimiter
+from src.scrapers.resilience import CircuitBreaker
+
+
+@pytest.fixture
+def selenium_calls(fast_scraper, monkeypatch):
+    """Selenium yedeğini açar ve tarayıcı yerine çağrıları kaydeder"""
+    calls = []
+    monkeypatch.setattr(base_scraper, 'SELENIUM_FALLBACK_ENABLED', True)
+    monkeypatch.setattr(fast_scraper, '_fetch_html_with_selenium',
+                        lambda url, resource_type='default', *args: calls.append(url) or '<html>selenium</html>')
+    return calls
+
+
+def test_transient_failure_falls_back_to_selenium(fast_scraper, flaky_server, selenium_calls):
+    url, statuses, seen = flaky_server
+    statuses.extend([503] * 3)
+
+    html = fast_scraper._fetch_html_with_fallback(f"{url}/down", resource_type='detail')
+
+    assert html == '<html>selenium</html>'
+    assert selenium_calls == [f"{url}/down"]
+
+
+def test_client_error_does_not_fall_back(fast_scraper, flaky_server, selenium_calls):
+    url, statuses, _ = flaky_server
+    statuses.extend([404, 403])
+
+    assert fast_scraper._fetch_html_with_fallback(f"{url}/missing") is None
+    assert fast_scraper._fetch_html_with_fallback(f"{url}/forbidden") is None
+    assert selenium_calls == []
+
+
+def test_open_circuit_does_not_fall_back(fast_scraper, flaky_server, selenium_calls, monkeypatch):
+    url, _, seen = flaky_server
+    breaker = CircuitBreaker('flaky', failure_threshold=1, recovery_timeout=60)
+    breaker.record_failure()
+    monkeypatch.setattr(base_scraper, 'get_circuit_breaker', lambda host: breaker)
+    fast_scraper.circuit_breaker_enabled = True
+
+    for index in range(5):
+        assert fast_scraper._fetch_html_with_fallback(f"{url}/p/{index}") is None
+
+    assert seen == []
+    assert selenium_calls == []
+
+
+def test_fetch_reports_failure_reason(fast_scraper, flaky_server):
+    url, statuses, _ = flaky_server
+    statuses.extend([404, 500, 500, 500])
+
+    assert fast_scraper._fetch_html_result(f"{url}/a") == (None, base_scraper.FETCH_CLIENT_ERROR)
+    assert fast_scraper._fetch_html_result(f"{url}/b") == (None, base_scraper.FETCH_TRANSIENT)
+    assert fast_scraper._fetch_html_result(f"{url}/c") == ('<html>tamam</html>', None)
+
+
+def test_selenium_skips_browser_when_circuit_open(scraper, monkeypatch):
+    breaker = CircuitBreaker('www.example.com', failure_threshold=1, recovery_timeout=60)
+    breaker.record_failure()
+    monkeypatch.setattr(base_scraper, 'get_circuit_breaker', lambda host: breaker)
+    monkeypatch.setattr(base_scraper, 'get_webdriver_pool', lambda: pytest.fail("tarayıcı açılmamalı"))
+    scraper.circuit_breaker_enabled = True
+
+    assert scraper._fetch_html_with_selenium("https://www.example.com/p/1", 'detail') is None
+
+
+class FakeDriver:
+    page_source = '<html>selenium</html>'
+
+    def __init__(self, fail=False):
+        self.fail = fail
+
+    def get(self, url):
+        if self.fail:
+            raise RuntimeError('sayfa yüklenemedi')
+
+
+class FakePool:
+    def __init__(self, driver):
+        self.driver = driver
+
+    @contextlib.contextmanager
+    def lease(self, **kwargs):
+        yield self.driver
+
+
+@pytest.mark.parametrize('fail', [False, True])
+def test_selenium_uses_rate_limiter_and_breaker(scraper, monkeypatch, fail):
+    breaker = CircuitBreaker('www.example.com', failure_threshold=5, recovery_timeout=60)
+    limiter = RateLimiter(rate=100, burst=1)
+    monkeypatch.setattr(base_scraper, 'get_circuit_breaker', lambda host: breaker)
+    monkeypatch.setattr(base_scraper, 'get_webdriver_pool', lambda: FakePool(FakeDriver(fail)))
+    monkeypatch.setattr(base_scraper, 'wait_for_page_ready', lambda driver, selector, max_wait: (True, 0.0))
+    scraper.circuit_breaker_enabled = True
+    scraper.rate_limiter = limiter
+
+    html = scraper._fetch_html_with_selenium("https://www.example.com/p/1", 'detail')
+
+    assert html == (None if fail else '<html>selenium</html>')
+    assert limiter.stats('www.example.com')['requests'] == 1
+    assert breaker.stats()['consecutive_failures'] == (1 if fail else 0)
@@ -0,0 +1,21 @@
+import pytest
+
+from src.scrapers.structured_data import parse_price
+
+
+@pytest.mark.parametrize('value, expected', [
+    ("24.999", 24999.0),
+    ("24.999 TL", 24999.0),
+    ("1.299.000", 1299000.0),
+    ("24.999,00 TL", 24999.0),
+    ("24999.00", 24999.0),
+    ("24,999.00", 24999.0),
+    ("24.99", 24.99),
+    ("24,99", 24.99),
+    (24999, 24999.0),
+    ({'value': "12.499"}, 12499.0),
+    ("fiyat yok", 0.0),
+    (None, 0.0),
+])
+def test_parse_price(value, expected):
+    assert parse_price(value) == expected
@@ -0,0 +1,95 @@
+import threading
+
+import pytest
+from selenium.common.exceptions import TimeoutException
+
+from src.scrapers import webdriver_pool
+from src.scrapers.webdriver_pool import WebDriverPool, WebDriverPoolExhausted
+
+
+class FakeDriver:
+    def __init__(self, *args, **kwargs):
+        self.timeouts = {}
+        self.quit_called = False
+
+    def set_page_load_timeout(self, seconds):
+        self.timeouts['page_load'] = seconds
+
+    def set_script_timeout(self, seconds):
+        self.timeouts['script'] = seconds
+
+    def execute_cdp_cmd(self, command, params):
+        pass
+
+    def quit(self):
+        self.quit_called = True
+
+
+@pytest.fixture
+def fake_chrome(monkeypatch):
+    monkeypatch.setattr(webdriver_pool, 'get_chromedriver_path', lambda: '/usr/bin/chromedriver')
+    monkeypatch.setattr(webdriver_pool, 'Service', lambda path: None)
+    monkeypatch.setattr(webdriver_pool.webdriver, 'Chrome', FakeDriver)
+
+
+def make_pool(**kwargs):
+    options = dict(size=1, max_pages=0, page_load_timeout=12, script_timeout=4, acquire_timeout=0.05)
+    options.update(kwargs)
+    return WebDriverPool(**options)
+
+
+def test_new_driver_gets_timeouts(fake_chrome):
+    with make_pool().lease() as driver:
+        assert driver.timeouts == {'page_load': 12, 'script': 4}
+
+
+def test_exhausted_pool_raises_after_acquire_timeout(fake_chrome):
+    pool = make_pool()
+    with pool.lease():
+        with pytest.raises(WebDriverPoolExhausted, match="1 sürücünün tümü kullanımda"):
+            with pool.lease():
+                pass
+
+    # Sürücü geri döndükten sonra yeniden kiralanabilir
+    with pool.lease() as driver:
+        assert isinstance(driver, FakeDriver)
+
+
+def test_waiting_lease_gets_released_driver(fake_chrome):
+    pool = make_pool(acquire_timeout=5)
+    leased = []
+    with pool.lease() as first:
+        waiter = threading.Thread(target=lambda: leased.append(pool.lease().__enter__()))
+        waiter.start()
+        waiter.join(0.1)
+        assert waiter.is_alive()
+    waiter.join(5)
+    assert leased == [first]
+
+
+def test_driver_recycled_after_max_pages(fake_chrome):
+    pool = make_pool(max_pages=2)
+    drivers = []
+    for _ in range(3):
+        with pool.lease() as driver:
+            drivers.append(driver)
+
+    assert drivers[0] is drivers[1]
+    assert drivers[2] is not drivers[0]
+    assert drivers[0].quit_called
+
+
+def test_broken_driver_discarded_but_timeout_kept(fake_chrome):
+    pool = make_pool()
+    with pytest.raises(TimeoutException):
+        with pool.lease() as driver:
+            raise TimeoutException("sayfa geç yüklendi")
+    assert not driver.quit_called
+
+    with pytest.raises(ConnectionError):
+        with pool.lease() as same:
+            raise ConnectionError("chromedriver çöktü")
+    assert same is driver and driver.quit_called
+
+    with pool.lease() as fresh:
+        assert fresh is not driver